@@ -1,30 +1,180 @@
+import multiprocessing
 import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request
-import boto3
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 
 load_dotenv()
 
-from parseland_lib.parse import parse_page, find_pdf_link
-from parseland_lib.s3 import get_landing_page_from_r2
-from parseland_lib.dynamodb import get_dynamodb_record
+from parseland_lib.parse import parse_page, parse_pages, parse_pool, find_pdf_link
+from parseland_lib.s3 import get_guarded_landing_page_from_r2
+from parseland_lib.dynamodb import get_dynamodb_record, get_dynamodb_records
+from parseland_lib.clients import dynamodb_client, r2_client
+from parseland_lib.trace import ParseTrace
+from parseland_lib import serialize
+
+
+class ParselandJSONProvider(DefaultJSONProvider):
+    """jsonify() through parseland_lib.serialize (orjson when installed)."""
+
+    def dumps(self, obj, **kwargs):
+        return serialize.dumps(obj, indent='indent' in kwargs).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            serialize.dumps(obj, indent=indent) + b"\n", mimetype=self.mimetype)
+
 
 app = Flask(__name__)
-app.json.sort_keys = False
+app.json = ParselandJSONProvider(app)
+
+# DynamoDB lookups run here while the request thread reads the page from R2
+fetch_pool = ThreadPoolExecutor(max_workers=8)
+
+
+def fetch_landing_page_and_record(harvest_id):
+    """Fetch the R2 landing page and start the DynamoDB lookup concurrently.
+
+    Returns the page and a future for the harvested-html record; callers that
+    bail out on a missing page never wait for the record.
+    """
+    record = fetch_pool.submit(get_dynamodb_record, harvest_id, dynamodb_client())
+    lp = get_guarded_landing_page_from_r2(harvest_id, r2_client())
+    return lp, record
+
+
+# Time limit for parsing one page, kept under gunicorn's 10 s --timeout;
+# see parseland_lib.budget.ParseBudget
+PARSE_BUDGET_SECONDS = float(os.environ.get('PARSELAND_PARSE_BUDGET_SECONDS', 7))
+
+# Send a Server-Timing header with the stage and parser timings of every
+# single-page parse; see parseland_lib.trace
+SERVER_TIMING = bool(int(os.environ.get('PARSELAND_SERVER_TIMING', 0)))
+
+# POST /parseland/batch limits. The response streams from a sync gunicorn
+# worker, which is killed once a request runs past --timeout (10 s): a batch
+# stops parsing at BATCH_DEADLINE_SECONDS and reports the pages it did not
+# get to, and MAX_BATCH_SIZE keeps that rare (~105 ms a page on 4 workers).
+MAX_BATCH_SIZE = int(os.environ.get('PARSELAND_BATCH_MAX_SIZE', 200))
+BATCH_DEADLINE_SECONDS = float(os.environ.get('PARSELAND_BATCH_DEADLINE_SECONDS', 8))
+BATCH_R2_CONCURRENCY = int(os.environ.get('PARSELAND_BATCH_R2_CONCURRENCY', 16))
+BATCH_PARSE_WORKERS = int(os.environ.get('PARSELAND_BATCH_PARSE_WORKERS', 4))
+
+_batch_pool = None
+_batch_pool_lock = threading.Lock()
+
+
+def batch_parse_pool():
+    """The process's pool for batch parses, started on first use.
+
+    Its workers come from a forkserver rather than a fork of this process,
+    whose fetch threads may hold locks mid-fork.
+    """
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            context = multiprocessing.get_context('forkserver')
+            context.set_forkserver_preload(['parseland_lib.parse'])
+            _batch_pool = parse_pool(BATCH_PARSE_WORKERS, context)
+        return _batch_pool
+
+
+def _discard_batch_pool(pool):
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is pool:
+            _batch_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _forget_batch_pool():
+    # a forked child must start its own pool
+    global _batch_pool, _batch_pool_lock
+    _batch_pool = None
+    _batch_pool_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_batch_pool)
+
+
+def _fetch_r2_page(harvest_id):
+    try:
+        lp = get_guarded_landing_page_from_r2(harvest_id, r2_client())
+    except Exception as e:
+        return None, f'{type(e).__name__}: {e}'
+    if lp is None:
+        return None, "No landing page found"
+    return lp, None
+
+
+def fetch_batch_pages(harvest_ids, errors):
+    """Yield (harvest_id, lp, namespace, resolved_url) for parse_pages.
+
+    The harvested-html records are read with one BatchGetItem pass while the
+    R2 objects are fetched, at most BATCH_R2_CONCURRENCY at a time; pages are
+    yielded as their fetches finish. Ids with no landing page are appended to
+    errors as (harvest_id, msg) instead.
+    """
+    records = fetch_pool.submit(get_dynamodb_records, harvest_ids, dynamodb_client())
+    ids = iter(harvest_ids)
+    r2_pool = ThreadPoolExecutor(max_workers=BATCH_R2_CONCURRENCY)
+    try:
+        pending = deque()
 
-r2_account_id = os.environ.get('R2_ACCOUNT_ID')
-r2_access_key = os.environ.get('R2_ACCESS_KEY_ID')
-r2_secret_key = os.environ.get('R2_SECRET_ACCESS_KEY')
+        def submit_next():
+            if (harvest_id := next(ids, None)) is not None:
+                pending.append((harvest_id, r2_pool.submit(_fetch_r2_page, harvest_id)))
+
+        for _ in range(BATCH_R2_CONCURRENCY * 2):
+            submit_next()
+        while pending:
+            wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+            for harvest_id, future in [item for item in pending if item[1].done()]:
+                pending.remove((harvest_id, future))
+                submit_next()
+                lp, error = future.result()
+                if error:
+                    errors.append((harvest_id, error))
+                    continue
+                record = records.result()[harvest_id]
+                yield harvest_id, lp, record['namespace'], record['resolved_url']
+    finally:
+        # a batch past its deadline stops reading; don't wait on its fetches
+        r2_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _new_trace():
+    return ParseTrace() if SERVER_TIMING else None
+
+
+def _timed(trace, stage):
+    return trace.stage(stage) if trace is not None else nullcontext()
+
+
+def _with_server_timing(response, trace):
+    if trace is not None:
+        response.headers['Server-Timing'] = trace.server_timing()
+    return response
+
+
+def _batch_line(key, result=None, error=None):
+    line = {"id": key}
+    if error:
+        line["error"] = error
+    else:
+        line["result"] = result
+    return serialize.dumps(line) + b"\n"
 
-s3_client = boto3.client(
-    's3',
-    endpoint_url=f'https://{r2_account_id}.r2.cloudflarestorage.com',
-    aws_access_key_id=r2_access_key,
-    aws_secret_access_key=r2_secret_key,
-    region_name='auto'  # R2 uses 'auto' as region
-)
-dynamodb_client = boto3.client("dynamodb", region_name="us-east-1")
 
 @app.route("/")
 def index():
@@ -35,24 +185,26 @@ def index():
 
 @app.route("/parseland/<uuid:harvest_id>", methods=['GET'])
 def parse_landing_page(harvest_id):
-    lp = get_landing_page_from_r2(harvest_id, s3_client)
-    if lp is None:
-        return jsonify({
-            "msg": "No landing page found"
-        }), 404
-
-    dynamo_record = get_dynamodb_record(harvest_id, dynamodb_client)
+    trace = _new_trace()
+    with _timed(trace, 'fetch'):
+        lp, record = fetch_landing_page_and_record(harvest_id)
+        if lp is None:
+            return jsonify({
+                "msg": "No landing page found"
+            }), 404
+        dynamo_record = record.result()
     namespace = dynamo_record['namespace']
     resolved_url = dynamo_record['resolved_url']
 
-    response = parse_page(lp, namespace, resolved_url)
-    return jsonify(response)
+    response = parse_page(lp, namespace, resolved_url, PARSE_BUDGET_SECONDS,
+                          trace)
+    return _with_server_timing(jsonify(response), trace)
 
 @app.route("/parseland/find-pdf/<uuid:harvest_id>", methods=['GET'])
 def get_pdf_url(harvest_id):
-    lp = get_landing_page_from_r2(harvest_id, s3_client)
+    lp, record = fetch_landing_page_and_record(harvest_id)
 
-    dynamo_record = get_dynamodb_record(harvest_id, dynamodb_client)
+    dynamo_record = record.result()
     namespace = dynamo_record['namespace']
     resolved_url = dynamo_record['resolved_url']
 
@@ -76,8 +228,105 @@ def parse_landing_page_raw():
         }), 400
     namespace = data.get('namespace')
     resolved_url = data.get('resolved_url')
-    response = parse_page(data['html'], namespace, resolved_url)
-    return jsonify(response)
+    trace = _new_trace()
+    response = parse_page(data['html'], namespace, resolved_url,
+                          PARSE_BUDGET_SECONDS, trace)
+    return _with_server_timing(jsonify(response), trace)
+
+
+@app.route("/parseland/batch", methods=['POST'])
+def parse_landing_pages_batch():
+    """Parse many pages in one request.
+
+    The JSON body carries "ids", a list of harvest ids to read from R2 and
+    DynamoDB, and/or "pages", a list of inline pages shaped like the
+    POST /parseland body plus an "id". Responds with NDJSON, one line per
+    page in completion order: {"id": ..., "result": {...}} or
+    {"id": ..., "error": "..."}. Invalid entries are reported first and R2
+    fetch errors as they happen. Pages not parsed within
+    BATCH_DEADLINE_SECONDS get a "Batch deadline exceeded" error line.
+    """
+    data = request.get_json(silent=True) or {}
+    harvest_ids = data.get('ids') or []
+    pages = data.get('pages') or []
+    if not isinstance(harvest_ids, list) or not isinstance(pages, list) or not (
+            harvest_ids or pages):
+        return jsonify({
+            "msg": "Request body needs a list of ids or pages"
+        }), 400
+    if len(harvest_ids) + len(pages) > MAX_BATCH_SIZE:
+        return jsonify({
+            "msg": f"At most {MAX_BATCH_SIZE} ids and pages per batch"
+        }), 400
+    deadline = time.monotonic() + BATCH_DEADLINE_SECONDS
+
+    invalid = []
+    valid_ids = []
+    for harvest_id in dict.fromkeys(map(str, harvest_ids)):
+        try:
+            valid_ids.append(str(uuid.UUID(harvest_id)))
+        except ValueError:
+            invalid.append((harvest_id, "Invalid harvest id"))
+    valid_ids = list(dict.fromkeys(valid_ids))
+    # pages are parsed under their position in keys, since an inline id
+    # need be neither unique nor hashable
+    keys = []
+    inline_pages = []
+    for page in pages:
+        if not isinstance(page, dict) or 'id' not in page or 'html' not in page:
+            invalid.append((page.get('id') if isinstance(page, dict) else None,
+                            "No id or html in page"))
+            continue
+        inline_pages.append((len(keys), page['html'], page.get('namespace'),
+                             page.get('resolved_url')))
+        keys.append(page['id'])
+    index_of = {harvest_id: len(keys) + n for n, harvest_id in enumerate(valid_ids)}
+    keys += valid_ids
+
+    def generate():
+        for key, error in invalid:
+            yield _batch_line(key, error=error)
+
+        fetch_errors = deque()
+        unanswered = set(range(len(keys)))
+
+        def all_pages():
+            yield from inline_pages
+            for harvest_id, lp, namespace, resolved_url in fetch_batch_pages(
+                    valid_ids, fetch_errors):
+                yield index_of[harvest_id], lp, namespace, resolved_url
+
+        def answer(n, result=None, error=None):
+            unanswered.discard(n)
+            return _batch_line(keys[n], result, error)
+
+        def fetch_error_lines():
+            while fetch_errors:
+                harvest_id, error = fetch_errors.popleft()
+                yield answer(index_of[harvest_id], error=error)
+
+        workers = BATCH_PARSE_WORKERS
+        pool = batch_parse_pool() if workers > 1 else None
+        results = parse_pages(all_pages(), workers=workers, chunksize=1,
+                              ordered=False, budget=PARSE_BUDGET_SECONDS,
+                              pool=pool, deadline=deadline)
+        leftover = "Batch deadline exceeded"
+        try:
+            for result in results:
+                yield from fetch_error_lines()
+                # clients get the exception, not the worker's traceback
+                error = result.error and result.error.partition('\n')[0]
+                yield answer(result.key, result.parsed, error)
+        except BrokenProcessPool:
+            _discard_batch_pool(pool)
+            leftover = "Parse worker crashed"
+        finally:
+            results.close()
+        yield from fetch_error_lines()
+        for n in sorted(unanswered):
+            yield _batch_line(keys[n], error=leftover)
+
+    return Response(generate(), mimetype='application/x-ndjson')
 
 
 if __name__ == "__main__":
@@ -0,0 +1,349 @@
+"""Offline parse-throughput benchmark over the cached HTML corpus.
+
+`python -m parseland_eval bench` runs three targets over every gold row whose
+HTML is in the cache or the --corpus pack (the same frozen pages `run`
+scores):
+
+  - parse_page      the whole parse, as the API runs it
+  - find_pdf_link   the fulltext-location pass alone
+  - publisher_parser
+                    PublisherParser.parse() of each publisher-specific parser
+                    that claims the page, on a soup built outside the timer
+
+Each page is timed `repeat` times. A second, untimed-for-latency pass runs
+every call once under tracemalloc and reports the peak Python allocation of
+the call and the peak RSS of the process while it ran (Linux resets the
+high-water mark per call through /proc/self/clear_refs; elsewhere it is the
+process peak so far).
+
+Results are grouped by publisher domain (by parser class for
+publisher_parser) and written to eval/runs/bench/, with an index.json the
+dashboard can chart over time.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from parseland_eval import __version__
+from parseland_eval.gold import GoldRow
+from parseland_eval.paths import BENCH_DIR, PARSELAND_LIB
+from parseland_eval.runner import _ensure_parseland_lib_on_path, _publisher_domain, read_html
+
+log = logging.getLogger(__name__)
+
+TARGETS = ("parse_page", "find_pdf_link", "publisher_parser")
+PERCENTILES = (50, 95, 99)
+
+_CLEAR_REFS = Path("/proc/self/clear_refs")
+_STATUS = Path("/proc/self/status")
+
+
+@dataclass(frozen=True)
+class BenchPage:
+    doi: str
+    link: str
+    publisher_domain: str
+    html: str
+
+
+@dataclass
+class Samples:
+    durations_ms: list[float] = field(default_factory=list)
+    alloc_peak_kb: list[float] = field(default_factory=list)
+    peak_rss_kb: int = 0
+    errors: int = 0
+
+
+@dataclass(frozen=True)
+class BenchCall:
+    target: str
+    group: str
+    call: Callable[[], Any]
+
+
+def load_pages(rows: Iterable[GoldRow], limit: int | None = None, corpus: Any = None) -> list[BenchPage]:
+    pages = []
+    for row in rows:
+        html = read_html(row, corpus)
+        if html is None:
+            continue
+        pages.append(BenchPage(row.doi, row.link, _publisher_domain(row.link), html))
+        if limit and len(pages) >= limit:
+            break
+    return pages
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linear-interpolated percentile of values (0.0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _reset_peak_rss() -> None:
+    try:
+        _CLEAR_REFS.write_text("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_kb() -> int:
+    try:
+        for line in _STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _fresh_soup(html: str):
+    from bs4 import BeautifulSoup
+    from parseland_lib.page_context import page_context  # type: ignore[import-not-found]
+
+    soup = BeautifulSoup(html, parser="lxml", features="lxml")
+    page_context(soup)
+    return soup
+
+
+def _claiming_parsers(html: str) -> list[type]:
+    """The publisher-specific parsers whose cheap checks accept the page."""
+    from parseland_lib.publisher.parsers.parser import PublisherParser  # type: ignore[import-not-found]
+
+    soup = _fresh_soup(html)
+    claiming = []
+    for cls in PublisherParser.__subclasses__():
+        parser = cls(soup)
+        try:
+            if parser.is_publisher_specific_parser() and parser.authors_found():
+                claiming.append(cls)
+        except Exception:  # noqa: BLE001 — a parser that cannot decide does not claim
+            continue
+    return claiming
+
+
+def _parser_call(cls: type, html: str) -> Callable[[], Any]:
+    # parse() edits the soup and memoizes on it, so every call gets its own
+    # soup; building it is not part of the parser's time.
+    soups = []
+
+    def prepare() -> None:
+        soups.append(_fresh_soup(html))
+
+    def call() -> Any:
+        return cls(soups.pop()).parse()
+
+    call.prepare = prepare  # type: ignore[attr-defined]
+    return call
+
+
+def bench_calls(pages: list[BenchPage], targets: Iterable[str] = TARGETS) -> list[BenchCall]:
+    _ensure_parseland_lib_on_path()
+    from parseland_lib.parse import find_pdf_link, parse_page  # type: ignore[import-not-found]
+
+    targets = set(targets)
+    calls = []
+    for page in pages:
+        if "parse_page" in targets:
+            calls.append(BenchCall("parse_page", page.publisher_domain, lambda p=page: parse_page(
+                p.html, namespace="doi", resolved_url=p.link)))
+        if "find_pdf_link" in targets:
+            calls.append(BenchCall("find_pdf_link", page.publisher_domain, lambda p=page: find_pdf_link(
+                p.html, namespace="doi", resolved_url=p.link)))
+        if "publisher_parser" in targets:
+            for cls in _claiming_parsers(page.html):
+                calls.append(BenchCall("publisher_parser", cls.__name__, _parser_call(cls, page.html)))
+    return calls
+
+
+def _run(call: Callable[[], Any]) -> bool:
+    if prepare := getattr(call, "prepare", None):
+        prepare()
+    try:
+        call()
+        return True
+    except Exception:  # noqa: BLE001 — a crash is counted, not fatal
+        return False
+
+
+def _time_calls(calls: list[BenchCall], repeat: int, samples: dict) -> None:
+    for bench_call in calls:
+        bucket = samples[bench_call.target][bench_call.group]
+        for _ in range(repeat):
+            if prepare := getattr(bench_call.call, "prepare", None):
+                prepare()
+            start = time.perf_counter()
+            try:
+                bench_call.call()
+            except Exception:  # noqa: BLE001
+                bucket.errors += 1
+            bucket.durations_ms.append((time.perf_counter() - start) * 1000.0)
+
+
+def _measure_memory(calls: list[BenchCall], samples: dict) -> None:
+    tracemalloc.start()
+    try:
+        for bench_call in calls:
+            bucket = samples[bench_call.target][bench_call.group]
+            if prepare := getattr(bench_call.call, "prepare", None):
+                prepare()
+            _reset_peak_rss()
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            try:
+                bench_call.call()
+            except Exception:  # noqa: BLE001
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            bucket.alloc_peak_kb.append((peak - before) / 1024.0)
+            bucket.peak_rss_kb = max(bucket.peak_rss_kb, _peak_rss_kb())
+    finally:
+        tracemalloc.stop()
+
+
+def summarize_samples(samples: Samples) -> dict[str, Any]:
+    durations = samples.durations_ms
+    total_ms = sum(durations)
+    summary: dict[str, Any] = {
+        "calls": len(durations),
+        "errors": samples.errors,
+        "total_ms": total_ms,
+        "per_sec": len(durations) / (total_ms / 1000.0) if total_ms else 0.0,
+        "mean_ms": total_ms / len(durations) if durations else 0.0,
+    }
+    for pct in PERCENTILES:
+        summary[f"p{pct}_ms"] = percentile(durations, pct)
+    summary["max_ms"] = max(durations, default=0.0)
+    if samples.alloc_peak_kb:
+        summary["alloc_peak_kb_p50"] = percentile(samples.alloc_peak_kb, 50)
+        summary["alloc_peak_kb_max"] = max(samples.alloc_peak_kb)
+        summary["peak_rss_mb"] = samples.peak_rss_kb / 1024.0
+    return summary
+
+
+def _merge(buckets: Iterable[Samples]) -> Samples:
+    merged = Samples()
+    for bucket in buckets:
+        merged.durations_ms += bucket.durations_ms
+        merged.alloc_peak_kb += bucket.alloc_peak_kb
+        merged.peak_rss_kb = max(merged.peak_rss_kb, bucket.peak_rss_kb)
+        merged.errors += bucket.errors
+    return merged
+
+
+def run_bench(
+    pages: list[BenchPage],
+    *,
+    repeat: int = 3,
+    memory: bool = True,
+    targets: Iterable[str] = TARGETS,
+) -> dict[str, Any]:
+    """Benchmark pages; returns {target: {"overall": ..., "groups": {...}}}."""
+    calls = bench_calls(pages, targets)
+    # warm-up: imports, the dispatch index and module-level caches
+    for bench_call in calls[:len(TARGETS)]:
+        _run(bench_call.call)
+
+    samples: dict[str, dict[str, Samples]] = defaultdict(lambda: defaultdict(Samples))
+    _time_calls(calls, repeat, samples)
+    if memory:
+        _measure_memory(calls, samples)
+
+    results = {}
+    for target, groups in samples.items():
+        results[target] = {
+            "group_by": "parser" if target == "publisher_parser" else "publisher_domain",
+            "overall": summarize_samples(_merge(groups.values())),
+            "groups": {
+                name: summarize_samples(bucket)
+                for name, bucket in sorted(groups.items(), key=lambda kv: -len(kv[1].durations_ms))
+            },
+        }
+    return results
+
+
+def _parseland_lib_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PARSELAND_LIB, capture_output=True, text=True, timeout=10, check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def write_bench(results: dict[str, Any], *, pages: int, repeat: int, label: str | None = None) -> Path:
+    _ensure_parseland_lib_on_path()
+    from parseland_lib.serialize import dumps  # type: ignore[import-not-found]
+
+    BENCH_DIR.mkdir(parents=True, exist_ok=True)
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = BENCH_DIR / (f"{label}-{ts}.json" if label else f"bench-{ts}.json")
+    payload = {
+        "run_id": ts,
+        "label": label,
+        "eval_version": __version__,
+        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+        "parseland_lib_commit": _parseland_lib_commit(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "pages": pages,
+        "repeat": repeat,
+        "results": results,
+    }
+    out.write_bytes(dumps(payload, indent=True))
+    _update_bench_index()
+    return out
+
+
+def _update_bench_index() -> None:
+    """Produce runs/bench/index.json listing benchmark runs newest-first."""
+    import json
+
+    from parseland_lib.serialize import dumps  # type: ignore[import-not-found]
+
+    entries = []
+    for f in sorted(BENCH_DIR.glob("*.json")):
+        if f.name == "index.json":
+            continue
+        try:
+            head = json.loads(f.read_text(encoding="utf-8"))
+        except Exception:  # noqa: BLE001
+            continue
+        entries.append(
+            {
+                "file": f.name,
+                "run_id": head.get("run_id"),
+                "label": head.get("label"),
+                "timestamp_utc": head.get("timestamp_utc"),
+                "parseland_lib_commit": head.get("parseland_lib_commit"),
+                "overall": {
+                    target: result.get("overall", {})
+                    for target, result in head.get("results", {}).items()
+                },
+            }
+        )
+    entries.sort(key=lambda e: e.get("timestamp_utc") or "", reverse=True)
+    (BENCH_DIR / "index.json").write_bytes(dumps({"runs": entries}, indent=True))
@@ -1,16 +1,20 @@
-"""CLI: `python -m parseland_eval [fetch|run|score]`."""
+"""CLI: `python -m parseland_eval [fetch|run|bench|corpus]`."""
 from __future__ import annotations
 
 import argparse
+import json
 import logging
 import sys
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Any
 
+from parseland_eval.bench import TARGETS, load_pages, run_bench, write_bench
 from parseland_eval.fetch import fetch_many
 from parseland_eval.gold import load_gold
-from parseland_eval.paths import GOLD_JSON, HTML_CACHE, RUNS_DIR
+from parseland_eval.paths import GOLD_JSON, HTML_CACHE, RESULT_CACHE, RUNS_DIR
 from parseland_eval.report import write_run
-from parseland_eval.runner import run_all
+from parseland_eval.runner import _ensure_parseland_lib_on_path, run_all
 from parseland_eval.score.aggregate import score_row, summarize
 
 
@@ -32,11 +36,29 @@ def cmd_fetch(args: argparse.Namespace) -> int:
     return 0
 
 
+def _open_corpus(path: Path | None) -> Any:
+    """A parseland_lib Corpus for --corpus, or a null context without one."""
+    if path is None:
+        return nullcontext()
+    _ensure_parseland_lib_on_path()
+    from parseland_lib.corpus import Corpus  # type: ignore[import-not-found]
+
+    return Corpus(path)
+
+
 def cmd_run(args: argparse.Namespace) -> int:
+    with _open_corpus(args.corpus) as corpus:
+        return _run(args, corpus)
+
+
+def _run(args: argparse.Namespace, corpus: Any) -> int:
     rows = load_gold()
     logging.info("loaded %d gold rows", len(rows))
 
-    missing = [r for r in rows if not (HTML_CACHE / f"{__import__('hashlib').sha1(r.doi.lower().encode()).hexdigest()}.html").exists()]
+    if corpus is not None:
+        missing = [r for r in rows if r.doi not in corpus]
+    else:
+        missing = [r for r in rows if not (HTML_CACHE / f"{__import__('hashlib').sha1(r.doi.lower().encode()).hexdigest()}.html").exists()]
     if missing and not args.skip_missing:
         logging.error(
             "%d DOIs have no cached HTML. Run `python -m parseland_eval fetch` first, "
@@ -45,7 +67,8 @@ def cmd_run(args: argparse.Namespace) -> int:
         )
         return 2
 
-    runs = run_all(rows)
+    cache_dir = None if args.no_result_cache else args.result_cache
+    runs = run_all(rows, trace=args.trace, corpus=corpus, workers=args.workers, cache_dir=cache_dir)
     scores = [score_row(g, r) for g, r in zip(rows, runs)]
     summary = summarize(scores)
     out = write_run(rows, runs, scores, summary, label=args.label)
@@ -65,6 +88,88 @@ def cmd_run(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_bench(args: argparse.Namespace) -> int:
+    rows = load_gold()
+    with _open_corpus(args.corpus) as corpus:
+        pages = load_pages(rows, limit=args.limit, corpus=corpus)
+    if not pages:
+        logging.error("no cached HTML to benchmark. Run `python -m parseland_eval fetch` first.")
+        return 2
+    logging.info("benchmarking %d cached pages x%d", len(pages), args.repeat)
+
+    targets = args.targets.split(",") if args.targets else TARGETS
+    results = run_bench(pages, repeat=args.repeat, memory=not args.no_memory, targets=targets)
+    out = write_bench(results, pages=len(pages), repeat=args.repeat, label=args.label)
+
+    print(f"\n─── Parseland Bench — {len(pages)} pages x{args.repeat} ───")
+    for target, result in results.items():
+        o = result["overall"]
+        memory = f"   alloc p50: {o['alloc_peak_kb_p50']:.0f} kB   peak RSS: {o['peak_rss_mb']:.0f} MB" \
+            if "peak_rss_mb" in o else ""
+        print(
+            f"  {target:<17}: {o['per_sec']:7.1f}/s   p50 {o['p50_ms']:6.1f} ms   "
+            f"p95 {o['p95_ms']:6.1f} ms   p99 {o['p99_ms']:6.1f} ms   errors {o['errors']}{memory}"
+        )
+    print(f"\n  bench file: {out}")
+    return 0
+
+
+def _dois_from(path: Path) -> list[str]:
+    """DOIs of an ndjson file of {"doi": ...} objects (the tests/fixtures
+    *-gold.ndjson sets) or a gold-standard JSON file."""
+    if path.suffix == ".ndjson":
+        with path.open(encoding="utf-8") as f:
+            return [json.loads(line)["doi"] for line in f if line.strip()]
+    return [row.doi for row in load_gold(path)]
+
+
+def _r2_pages(path: Path):
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                yield item.get("doi"), item["harvest_id"], item.get("resolved_url")
+
+
+def cmd_corpus_build(args: argparse.Namespace) -> int:
+    _ensure_parseland_lib_on_path()
+    from parseland_lib import corpus as corpus_lib  # type: ignore[import-not-found]
+
+    codec = {"gzip": corpus_lib.CODEC_GZIP, "zstd": corpus_lib.CODEC_ZSTD}.get(args.codec)
+    dois = [row.doi for row in load_gold()]
+    for path in args.dois_from:
+        dois += _dois_from(path)
+    cache_dirs = args.cache_dir if args.cache_dir or args.r2 else [HTML_CACHE]
+
+    with corpus_lib.CorpusWriter(args.out, codec=codec) as writer:
+        for cache_dir in cache_dirs:
+            added = corpus_lib.import_cache_dir(writer, cache_dir, dois)
+            logging.info("added %d pages from %s", added, cache_dir)
+        if args.r2:
+            failed = corpus_lib.import_r2(writer, _r2_pages(args.r2))
+            for harvest_id, error in failed:
+                logging.warning("R2 page not added for %s: %s", harvest_id, error)
+    return _print_corpus_info(args.out)
+
+
+def _print_corpus_info(path: Path) -> int:
+    _ensure_parseland_lib_on_path()
+    from parseland_lib.corpus import Corpus  # type: ignore[import-not-found]
+
+    with Corpus(path) as corpus:
+        stats = corpus.stats()
+    print(
+        f"\n─── Corpus {path} ───\n"
+        f"  entries: {stats['entries']}   distinct pages: {stats['pages']}   keys: {stats['keys']}\n"
+        f"  pages: {stats['page_bytes'] / 2**20:.1f} MB   packed: {stats['packed_bytes'] / 2**20:.1f} MB"
+    )
+    return 0
+
+
+def cmd_corpus_info(args: argparse.Namespace) -> int:
+    return _print_corpus_info(args.pack)
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(prog="parseland-eval", description="Parseland offline eval")
     parser.add_argument("-v", "--verbose", action="store_true")
@@ -77,8 +182,38 @@ def main(argv: list[str] | None = None) -> int:
     r = sub.add_parser("run", help="Run parseland-lib against cached HTML + score")
     r.add_argument("--label", help="Optional label for the run file (e.g. 'baseline')")
     r.add_argument("--skip-missing", action="store_true", help="Proceed even if some HTML not cached")
+    r.add_argument("--trace", action="store_true", help="Store per-stage / per-parser timings on each row")
+    r.add_argument("--corpus", type=Path, help="Read pages from a corpus pack instead of the HTML cache")
+    r.add_argument("--workers", type=int, default=0, help="Parser processes (default: one per CPU)")
+    r.add_argument("--result-cache", type=Path, default=RESULT_CACHE,
+                   help=f"Reuse parses whose HTML and parsers are unchanged (default: {RESULT_CACHE})")
+    r.add_argument("--no-result-cache", action="store_true", help="Parse every row")
     r.set_defaults(func=cmd_run)
 
+    b = sub.add_parser("bench", help="Benchmark parse throughput over cached HTML")
+    b.add_argument("--label", help="Optional label for the bench file")
+    b.add_argument("--limit", type=int, help="Benchmark at most this many pages")
+    b.add_argument("--repeat", type=int, default=3, help="Timed calls per page (default 3)")
+    b.add_argument("--targets", help=f"Comma-separated subset of {','.join(TARGETS)}")
+    b.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc / peak-RSS pass")
+    b.add_argument("--corpus", type=Path, help="Read pages from a corpus pack instead of the HTML cache")
+    b.set_defaults(func=cmd_bench)
+
+    c = sub.add_parser("corpus", help="Build or inspect a packed HTML corpus")
+    csub = c.add_subparsers(dest="corpus_cmd", required=True)
+    cb = csub.add_parser("build", help="Pack cached HTML and/or R2 pages into one file")
+    cb.add_argument("out", type=Path, help="Pack file to write")
+    cb.add_argument("--cache-dir", type=Path, action="append", default=[],
+                    help="<sha1(doi)>.html directory to import (default: the eval HTML cache); repeatable")
+    cb.add_argument("--dois-from", type=Path, action="append", default=[],
+                    help="ndjson / gold JSON naming the DOIs of cached pages; repeatable")
+    cb.add_argument("--r2", type=Path, help='ndjson of {"doi", "harvest_id", "resolved_url"} to fetch from R2')
+    cb.add_argument("--codec", choices=("gzip", "zstd"), help="Frame codec (default: zstd if installed)")
+    cb.set_defaults(func=cmd_corpus_build)
+    ci = csub.add_parser("info", help="Summarize a corpus pack")
+    ci.add_argument("pack", type=Path)
+    ci.set_defaults(func=cmd_corpus_info)
+
     args = parser.parse_args(argv)
     _configure_logging(args.verbose)
     return args.func(args)
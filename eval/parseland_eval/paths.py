@@ -9,7 +9,9 @@ GOLD_JSON = EVAL_DIR / "gold-standard.json"
 GOLD_SEED_JSON = EVAL_DIR / "gold-standard.seed.json"
 GOLD_HOLDOUT_JSON = EVAL_DIR / "gold-standard.holdout.json"
 HTML_CACHE = EVAL_DIR / "html-cache"
+RESULT_CACHE = EVAL_DIR / "parse-cache"
 RUNS_DIR = EVAL_DIR / "runs"
+BENCH_DIR = RUNS_DIR / "bench"
 SILVER_DIR = EVAL_DIR / "silver"
 PROMPTS_DIR = ROOT / "eval" / "parseland_eval" / "prompts"
 PARSELAND_LIB = ROOT
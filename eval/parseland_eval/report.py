@@ -10,7 +10,7 @@ from typing import Any
 from parseland_eval import __version__
 from parseland_eval.gold import GoldRow
 from parseland_eval.paths import RUNS_DIR
-from parseland_eval.runner import ParserRun
+from parseland_eval.runner import ParserRun, _ensure_parseland_lib_on_path
 from parseland_eval.score.aggregate import RowScore
 
 
@@ -26,7 +26,7 @@ def _asdict(obj: Any) -> Any:
 
 def row_payload(gold: GoldRow, run: ParserRun, score: RowScore) -> dict[str, Any]:
     parsed = run.parsed or {}
-    return {
+    payload = {
         "no": gold.no,
         "doi": gold.doi,
         "link": gold.link,
@@ -55,6 +55,9 @@ def row_payload(gold: GoldRow, run: ParserRun, score: RowScore) -> dict[str, Any
         "error": run.error,
         "duration_ms": run.duration_ms,
     }
+    if run.trace is not None:
+        payload["trace"] = run.trace
+    return payload
 
 
 def write_run(
@@ -65,6 +68,9 @@ def write_run(
     *,
     label: str | None = None,
 ) -> Path:
+    _ensure_parseland_lib_on_path()
+    from parseland_lib.serialize import dumps  # type: ignore[import-not-found]
+
     RUNS_DIR.mkdir(parents=True, exist_ok=True)
     ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     fname = f"{label}-{ts}.json" if label else f"run-{ts}.json"
@@ -78,13 +84,16 @@ def write_run(
         "summary": summary,
         "rows": [row_payload(g, r, s) for g, r, s in zip(rows, runs, scores)],
     }
-    out.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    out.write_bytes(dumps(payload, indent=True))
     _update_index()
     return out
 
 
 def _update_index() -> None:
     """Produce runs/index.json listing available runs newest-first."""
+    _ensure_parseland_lib_on_path()
+    from parseland_lib.serialize import dumps  # type: ignore[import-not-found]
+
     RUNS_DIR.mkdir(parents=True, exist_ok=True)
     entries = []
     for f in sorted(RUNS_DIR.glob("*.json")):
@@ -104,7 +113,4 @@ def _update_index() -> None:
             }
         )
     entries.sort(key=lambda e: e.get("timestamp_utc") or "", reverse=True)
-    (RUNS_DIR / "index.json").write_text(
-        json.dumps({"runs": entries}, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    (RUNS_DIR / "index.json").write_bytes(dumps({"runs": entries}, indent=True))
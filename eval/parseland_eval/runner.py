@@ -4,7 +4,6 @@ from __future__ import annotations
 import logging
 import sys
 import time
-import traceback
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -31,6 +30,7 @@ class ParserRun:
     duration_ms: float
     html_cached: bool
     publisher_domain: str
+    trace: dict[str, Any] | None = None  # ParseTrace.to_dict(), when traced
 
 
 def _publisher_domain(url: str) -> str:
@@ -41,11 +41,19 @@ def _publisher_domain(url: str) -> str:
         return ""
 
 
-def run_one(row: GoldRow) -> ParserRun:
+def read_html(row: GoldRow, corpus: Any = None) -> str | None:
+    """The row's page from a parseland_lib Corpus pack, or from the HTML cache."""
+    if corpus is not None:
+        return corpus.get_text(doi=row.doi)
+    return read_cached(row.doi)
+
+
+def run_one(row: GoldRow, *, trace: bool = False, corpus: Any = None) -> ParserRun:
     _ensure_parseland_lib_on_path()
-    from parseland_lib.parse import parse_page  # type: ignore[import-not-found]
+    from parseland_lib.parse import format_error, parse_page  # type: ignore[import-not-found]
+    from parseland_lib.trace import ParseTrace  # type: ignore[import-not-found]
 
-    html = read_cached(row.doi)
+    html = read_html(row, corpus)
     if html is None:
         return ParserRun(
             doi=row.doi,
@@ -56,13 +64,14 @@ def run_one(row: GoldRow) -> ParserRun:
             publisher_domain=_publisher_domain(row.link),
         )
 
+    page_trace = ParseTrace() if trace else None
     start = time.perf_counter()
     try:
-        parsed = parse_page(html, namespace="doi", resolved_url=row.link)
+        parsed = parse_page(html, namespace="doi", resolved_url=row.link, trace=page_trace)
         err = None
     except Exception as exc:  # noqa: BLE001 — record any parser crash
         parsed = None
-        err = f"{type(exc).__name__}: {exc}\n{traceback.format_exc(limit=3)}"
+        err = format_error(exc)
     duration_ms = (time.perf_counter() - start) * 1000.0
 
     return ParserRun(
@@ -72,8 +81,69 @@ def run_one(row: GoldRow) -> ParserRun:
         duration_ms=duration_ms,
         html_cached=True,
         publisher_domain=_publisher_domain(row.link),
+        trace=page_trace.to_dict() if page_trace is not None else None,
     )
 
 
-def run_all(rows: list[GoldRow]) -> list[ParserRun]:
-    return [run_one(r) for r in rows]
+def run_all(
+    rows: list[GoldRow],
+    *,
+    trace: bool = False,
+    corpus: Any = None,
+    workers: int = 1,
+    cache_dir: Path | None = None,
+) -> list[ParserRun]:
+    """Parse every row, in row order.
+
+    With workers=1 and no cache_dir each row is parsed here, as run_one does.
+    Otherwise rows are parsed in a pool of `workers` processes (0: one per
+    CPU) through parseland_lib.parse_pages, and with cache_dir through a
+    parseland_lib ResultCache there: a row is only parsed again if its HTML
+    or a parser that could handle it has changed since the cached parse.
+    duration_ms of a cached row is that of the parse that produced it.
+    """
+    if workers == 1 and cache_dir is None:
+        return [run_one(r, trace=trace, corpus=corpus) for r in rows]
+    _ensure_parseland_lib_on_path()
+
+    runs: dict[int, ParserRun] = {}
+    pages = []
+    for i, row in enumerate(rows):
+        html = read_html(row, corpus)
+        if html is None:
+            runs[i] = run_one(row, corpus=corpus)
+        else:
+            pages.append((i, html, "doi", row.link))
+
+    for i, result, duration_ms in _parse_pages(pages, workers or None, cache_dir):
+        row = rows[i]
+        runs[i] = ParserRun(
+            doi=row.doi,
+            parsed=result.parsed,
+            error=result.error,
+            duration_ms=duration_ms,
+            html_cached=True,
+            publisher_domain=_publisher_domain(row.link),
+            trace=result.trace if trace else None,
+        )
+    return [runs[i] for i in range(len(rows))]
+
+
+def _parse_pages(pages: list, workers: int | None, cache_dir: Path | None):
+    """(key, PageResult, duration_ms) per page, in no particular order."""
+    if cache_dir is None:
+        from parseland_lib.parse import parse_pages  # type: ignore[import-not-found]
+
+        for result in parse_pages(pages, workers=workers, ordered=False, trace=True):
+            yield result.key, result, result.trace["stages"]["parse_page"]["wall_ms"]
+        return
+
+    from parseland_lib.result_cache import ResultCache, parse_pages_cached  # type: ignore[import-not-found]
+
+    cache = ResultCache(cache_dir)
+    for result, duration_ms in parse_pages_cached(pages, cache, workers=workers, trace=True):
+        yield result.key, result, duration_ms
+    log.info(
+        "result cache %s: %d hits, %d rechecked, %d parsed",
+        cache_dir, cache.hits, cache.rechecked, cache.misses,
+    )
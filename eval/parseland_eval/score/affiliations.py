@@ -3,14 +3,21 @@
 Canonicalization is deliberately lightweight: strip emails/URLs, collapse whitespace,
 drop common filler tokens ("department of", "institute of"). Full (org, city, country)
 triple extraction is a future improvement (see future-ideas in plan).
+
+Affiliation strings repeat across the authors of a paper, so canonical forms
+are cached. Strict pairs are counted by equality; fuzzy pairs are scored a
+gold affiliation at a time by rapidfuzz.process.extract, which drops pairs
+below the threshold before they reach the greedy assignment.
 """
 from __future__ import annotations
 
+import functools
 import re
+from collections import Counter
 from dataclasses import dataclass
 from typing import Any, Iterable, Sequence
 
-from rapidfuzz import fuzz  # type: ignore[import-untyped]
+from rapidfuzz import fuzz, process  # type: ignore[import-untyped]
 
 from parseland_eval.score.normalize import normalize_alpha
 
@@ -32,6 +39,7 @@ class AffiliationResult:
     parsed_total: int
 
 
+@functools.lru_cache(maxsize=65536)
 def _clean(text: str) -> str:
     t = _EMAIL.sub(" ", text)
     t = _URL.sub(" ", t)
@@ -60,32 +68,36 @@ def _extract_affs(author: Any) -> list[str]:
     return out
 
 
-def _pair_f1(gold: Sequence[str], parsed: Sequence[str], *, strict: bool, threshold: float) -> tuple[float, int]:
-    if not gold and not parsed:
-        return 1.0, 0
-    if not gold or not parsed:
-        return 0.0, 0
-    used_g: set[int] = set()
-    used_p: set[int] = set()
-    tp = 0
-    # Greedy: score every pair, sort desc, assign.
+def _greedy_matches(gold: Sequence[str], parsed: Sequence[str], threshold: float) -> int:
+    """Pairs matched by assigning the best-scoring pairs first."""
     scored: list[tuple[float, int, int]] = []
     for gi, g in enumerate(gold):
-        for pi, p in enumerate(parsed):
-            if strict:
-                ratio = 100.0 if g == p else 0.0
-            else:
-                ratio = float(fuzz.token_set_ratio(g, p))
-            scored.append((ratio, gi, pi))
+        for _, ratio, pi in process.extract(
+            g, parsed, scorer=fuzz.token_set_ratio, limit=None, score_cutoff=threshold
+        ):
+            scored.append((float(ratio), gi, pi))
     scored.sort(reverse=True)
-    for ratio, gi, pi in scored:
-        if ratio < threshold:
-            break
+    used_g: set[int] = set()
+    used_p: set[int] = set()
+    for _, gi, pi in scored:
         if gi in used_g or pi in used_p:
             continue
-        tp += 1
         used_g.add(gi)
         used_p.add(pi)
+    return len(used_g)
+
+
+def _pair_f1(gold: Sequence[str], parsed: Sequence[str], *, strict: bool, threshold: float) -> tuple[float, int]:
+    if not gold and not parsed:
+        return 1.0, 0
+    if not gold or not parsed:
+        return 0.0, 0
+    if strict:
+        # equal strings only: each distinct string matches min(count) times
+        parsed_counts = Counter(parsed)
+        tp = sum(min(n, parsed_counts[g]) for g, n in Counter(gold).items())
+    else:
+        tp = _greedy_matches(gold, parsed, threshold)
     fp = len(parsed) - tp
     fn = len(gold) - tp
     if not tp:
@@ -2,14 +2,22 @@
 
 Match key: (last_name_normalized, first_initial). Tie-breaking uses rapidfuzz
 token_set_ratio over the full normalized name.
+
+Names are normalized once per distinct name (and cached across rows). Only
+pairs the assignment could accept are scored one by one: pairs sharing a
+match key, found through a key index. The other pairs are scored a gold name
+at a time by rapidfuzz.process.extract with the soft threshold as cutoff, so
+a row with 1,000+ authors costs one C-level scan per gold author.
 """
 from __future__ import annotations
 
+import functools
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any, Iterable
 
 from nameparser import HumanName  # type: ignore[import-untyped]
-from rapidfuzz import fuzz  # type: ignore[import-untyped]
+from rapidfuzz import fuzz, process  # type: ignore[import-untyped]
 
 from parseland_eval.score.normalize import normalize_alpha
 
@@ -35,6 +43,7 @@ class AuthorResult:
     f1_soft: float
 
 
+@functools.lru_cache(maxsize=65536)
 def _name_key(name: str) -> tuple[str, str]:
     if not name:
         return ("", "")
@@ -45,6 +54,7 @@ def _name_key(name: str) -> tuple[str, str]:
     return (last, initial)
 
 
+@functools.lru_cache(maxsize=65536)
 def _name_full(name: str) -> str:
     return normalize_alpha(name)
 
@@ -59,6 +69,38 @@ def _extract_names(authors: Iterable[Any]) -> list[str]:
     return names
 
 
+def _candidates(
+    gold_names: list[str], parsed_names: list[str], soft_threshold: float
+) -> list[tuple[float, int, int, bool]]:
+    """(score, gold index, parsed index, key match) for every pair the greedy
+    assignment can accept: each key match, and each other pair whose ratio
+    reaches soft_threshold. Key matches score ratio + 1000, ranking them
+    above every ratio."""
+    parsed_at = [pi for pi, name in enumerate(parsed_names) if name]
+    parsed_full = [_name_full(parsed_names[pi]) for pi in parsed_at]
+    by_key: dict[tuple[str, str], list[int]] = defaultdict(list)
+    for pi in parsed_at:
+        key = _name_key(parsed_names[pi])
+        if key[0]:
+            by_key[key].append(pi)
+
+    candidates: list[tuple[float, int, int, bool]] = []
+    for gi, gname in enumerate(gold_names):
+        if not gname:
+            continue
+        gfull = _name_full(gname)
+        keyed = by_key.get(_name_key(gname), ())
+        for pi in keyed:
+            ratio = fuzz.token_set_ratio(gfull, _name_full(parsed_names[pi]))
+            candidates.append((ratio + 1000, gi, pi, True))
+        for _, ratio, j in process.extract(
+            gfull, parsed_full, scorer=fuzz.token_set_ratio, limit=None, score_cutoff=soft_threshold
+        ):
+            if parsed_at[j] not in keyed:
+                candidates.append((ratio, gi, parsed_at[j], False))
+    return candidates
+
+
 def _f1(tp: int, fp: int, fn: int) -> tuple[float, float, float]:
     precision = tp / (tp + fp) if (tp + fp) else 0.0
     recall = tp / (tp + fn) if (tp + fn) else 0.0
@@ -75,23 +117,8 @@ def score_authors(
     gold_names = _extract_names(gold_authors)
     parsed_names = _extract_names(parsed_authors)
 
-    gold_keys = [_name_key(n) for n in gold_names]
-    parsed_keys = [_name_key(n) for n in parsed_names]
-
-    # Build all candidate pairs with a score; greedy-assign best first.
-    candidates: list[tuple[float, int, int, bool]] = []
-    for gi, (gkey, gname) in enumerate(zip(gold_keys, gold_names)):
-        if not gname:
-            continue
-        for pi, (pkey, pname) in enumerate(zip(parsed_keys, parsed_names)):
-            if not pname:
-                continue
-            key_match = bool(gkey[0]) and gkey == pkey
-            ratio = fuzz.token_set_ratio(_name_full(gname), _name_full(pname))
-            # Boost strict-key hits above ratio ties.
-            score = ratio + (1000 if key_match else 0)
-            candidates.append((score, gi, pi, key_match))
-
+    # Score the pairs that can match; greedy-assign best first.
+    candidates = _candidates(gold_names, parsed_names, soft_threshold)
     candidates.sort(reverse=True)
     used_g: set[int] = set()
     used_p: set[int] = set()
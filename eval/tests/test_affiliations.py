@@ -0,0 +1,30 @@
+from parseland_eval.score.affiliations import score_affiliations
+
+
+def _author(*affiliations: str) -> dict:
+    return {"name": "Jane Doe", "affiliations": list(affiliations)}
+
+
+def test_identical_affiliations() -> None:
+    r = score_affiliations(_author("MIT", "Harvard University"), _author("Harvard University", "MIT"))
+    assert (r.strict_f1, r.soft_f1, r.fuzzy_f1, r.matched) == (1.0, 1.0, 1.0, 2)
+
+
+def test_strict_counts_repeated_affiliations_once_per_copy() -> None:
+    r = score_affiliations(_author("MIT", "MIT", "CAS"), _author("MIT", "Oxford"))
+    assert r.strict_f1 == 0.4  # 1 pair: precision 1/2, recall 1/3
+
+
+def test_fuzzy_ignores_filler_and_punctuation() -> None:
+    r = score_affiliations(
+        _author("Department of Physics, Massachusetts Institute of Technology"),
+        _author("Dept. Physics — Massachusetts Institute of Technology"),
+    )
+    assert r.strict_f1 == 0.0
+    assert r.fuzzy_f1 == 1.0
+    assert r.matched == 1
+
+
+def test_no_parsed_author() -> None:
+    r = score_affiliations(_author("MIT"), None)
+    assert (r.fuzzy_f1, r.matched, r.parsed_total) == (0.0, 0, 0)
@@ -56,3 +56,46 @@ class TestAuthorMatching:
         r = score_authors(gold, parsed)
         assert r.precision < 1.0
         assert r.recall == 1.0
+
+
+def _all_pairs(gold: list[dict], parsed: list[dict], soft_threshold: float = 85.0) -> list[tuple]:
+    """Reference: score every pair one at a time, greedy-assign best first."""
+    from rapidfuzz import fuzz
+
+    from parseland_eval.score.authors import _name_full, _name_key
+
+    candidates = []
+    for gi, g in enumerate(gold):
+        for pi, p in enumerate(parsed):
+            if g["name"] and p["name"]:
+                key_match = bool(_name_key(g["name"])[0]) and _name_key(g["name"]) == _name_key(p["name"])
+                ratio = fuzz.token_set_ratio(_name_full(g["name"]), _name_full(p["name"]))
+                candidates.append((ratio + (1000 if key_match else 0), gi, pi, key_match))
+    used_g, used_p, matched = set(), set(), []
+    for score, gi, pi, key_match in sorted(candidates, reverse=True):
+        ratio = score - (1000 if key_match else 0)
+        if gi in used_g or pi in used_p or (not key_match and ratio < soft_threshold):
+            continue
+        matched.append((gi, pi, key_match, float(ratio)))
+        used_g.add(gi)
+        used_p.add(pi)
+    return matched
+
+
+class TestBatchedMatching:
+    GOLD = [_mk("Jane Doe"), _mk("J. Doe"), _mk("Doe, John"), _mk(""), _mk("Wei Wang"), _mk("Wang Wei"),
+            _mk("Cédric Moreau"), _mk("Mary-Ann O'Neil"), _mk("Smith")]
+    PARSED = [_mk("John Doe"), _mk("Jane Doe"), _mk("Wei Wang"), _mk("W. Wang"), _mk("Cedric Moreau"),
+              _mk("MaryAnn ONeil"), _mk(""), _mk("J Doe"), _mk("Smyth")]
+
+    def test_matches_scoring_every_pair(self) -> None:
+        for threshold in (85.0, 60.0, 0.0):
+            r = score_authors(self.GOLD, self.PARSED, soft_threshold=threshold)
+            got = [(m.gold_index, m.parsed_index, m.key_match, m.name_ratio) for m in r.matched]
+            assert got == _all_pairs(self.GOLD, self.PARSED, threshold)
+
+    def test_consortium_author_list(self) -> None:
+        gold = [_mk(f"Author{n} Member{n % 37}") for n in range(1200)]
+        r = score_authors(gold, list(reversed(gold)))
+        assert r.f1 == 1.0
+        assert r.f1_soft == 1.0
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from parseland_eval import bench
+from parseland_eval.bench import BenchPage, Samples, percentile, run_bench, summarize_samples
+
+PAGE = """<html><head>
+<meta name="citation_title" content="A study">
+<meta name="citation_author" content="Jane Doe">
+<meta name="citation_author_institution" content="MIT">
+<meta name="citation_pdf_url" content="https://example.com/paper.pdf">
+</head><body><p>Abstract text.</p></body></html>"""
+
+
+def _page(domain: str) -> BenchPage:
+    return BenchPage(doi=f"10.1/{domain}", link=f"https://{domain}/article", publisher_domain=domain, html=PAGE)
+
+
+def test_percentile_interpolates() -> None:
+    values = [4.0, 1.0, 3.0, 2.0]
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 50) == 2.5
+    assert percentile(values, 100) == 4.0
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+
+def test_summarize_samples() -> None:
+    summary = summarize_samples(Samples(durations_ms=[10.0, 30.0], errors=1))
+    assert summary["calls"] == 2
+    assert summary["errors"] == 1
+    assert summary["mean_ms"] == 20.0
+    assert summary["per_sec"] == pytest.approx(50.0)
+    assert summary["p50_ms"] == 20.0
+    assert "peak_rss_mb" not in summary
+
+
+def test_run_bench_groups_by_publisher() -> None:
+    results = run_bench([_page("a.example"), _page("b.example")], repeat=2,
+                        targets=("parse_page", "find_pdf_link"))
+    assert set(results) == {"parse_page", "find_pdf_link"}
+    parse = results["parse_page"]
+    assert parse["group_by"] == "publisher_domain"
+    assert set(parse["groups"]) == {"a.example", "b.example"}
+    assert parse["overall"]["calls"] == 4
+    assert parse["overall"]["errors"] == 0
+    assert parse["groups"]["a.example"]["calls"] == 2
+    assert parse["overall"]["peak_rss_mb"] > 0
+    assert parse["overall"]["alloc_peak_kb_max"] > 0
+
+
+def test_write_bench_updates_index(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(bench, "BENCH_DIR", tmp_path)
+    results = run_bench([_page("a.example")], repeat=1, memory=False, targets=("parse_page",))
+    out = bench.write_bench(results, pages=1, repeat=1, label="smoke")
+    assert out.parent == tmp_path and out.name.startswith("smoke-")
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert index["runs"][0]["file"] == out.name
+    assert index["runs"][0]["overall"]["parse_page"]["calls"] == 1
@@ -0,0 +1,66 @@
+from contextlib import nullcontext
+
+from parseland_eval.gold import GoldRow
+from parseland_eval.runner import run_all
+
+PAGE = """<html><head>
+<meta name="citation_title" content="A study">
+<meta name="citation_author" content="Jane Doe">
+<meta name="citation_pdf_url" content="https://example.com/{n}.pdf">
+</head><body><p>Abstract text.</p></body></html>"""
+
+
+class DictCorpus:
+    """The get_text() of a parseland_lib Corpus, over a dict."""
+
+    def __init__(self, pages: dict[str, str]) -> None:
+        self.pages = pages
+
+    def get_text(self, doi: str) -> str | None:
+        return self.pages.get(doi)
+
+
+def _row(n: int) -> GoldRow:
+    return GoldRow(no=n, doi=f"10.1/{n}", link=f"https://example.com/{n}", authors=(), abstract=None,
+                   pdf_url=None, status=True, notes="", has_bot_check=None, resolves_to_pdf=None)
+
+
+def test_pooled_cached_runs_match_the_serial_run(tmp_path) -> None:
+    rows = [_row(n) for n in range(5)]
+    corpus = DictCorpus({row.doi: PAGE.format(n=row.no) for row in rows[:4]})
+
+    serial = run_all(rows, corpus=corpus)
+    first = run_all(rows, corpus=corpus, workers=2, cache_dir=tmp_path)
+    second = run_all(rows, corpus=corpus, workers=2, cache_dir=tmp_path)
+
+    assert [r.doi for r in first] == [r.doi for r in rows]
+    for expected, got, again in zip(serial, first, second):
+        assert got.parsed == again.parsed == expected.parsed
+        assert got.html_cached == expected.html_cached
+        assert again.duration_ms == got.duration_ms
+    assert first[-1].error == "html-not-cached"
+    assert first[0].parsed["urls"][0]["url"] == "https://example.com/0.pdf"
+    assert list(tmp_path.glob("??/*.json"))
+
+
+def _failing_parse(lp_content, namespace=None, resolved_url=None, budget=None, trace=None):
+    # parse_page times itself into the trace it is given, raising or not
+    with trace.stage("parse_page") if trace is not None else nullcontext():
+        raise ValueError("bad page")
+
+
+def test_parse_errors_read_the_same_with_or_without_workers(tmp_path, monkeypatch) -> None:
+    from parseland_lib import parse, result_cache
+
+    monkeypatch.setattr(parse, "parse_page", _failing_parse)
+    monkeypatch.setattr(result_cache, "parse_page", _failing_parse)
+    rows = [_row(0)]
+    corpus = DictCorpus({rows[0].doi: PAGE.format(n=0)})
+
+    serial = run_all(rows, corpus=corpus)[0].error
+    pooled = run_all(rows, corpus=corpus, workers=2)[0].error
+    cached = run_all(rows, corpus=corpus, workers=1, cache_dir=tmp_path)[0].error
+
+    assert serial == pooled == cached
+    assert serial.startswith("ValueError: bad page\nTraceback (most recent call last):")
+    assert "in _failing_parse" in serial
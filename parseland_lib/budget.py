@@ -0,0 +1,36 @@
+import time
+
+
+class ParseBudget:
+    """Wall-clock budget for parsing one page.
+
+    parse_page runs in gunicorn workers with a 10 s --timeout; one
+    pathological page used to take the worker, and every request on it,
+    down. The stages of a parse (publisher dispatch, the publisher parser
+    scan, the generic parser, the PDF link search, bronze and hybrid
+    detection) ask the budget before they start, and the costly loops ask
+    again between parsers. Once the budget has run out every stage still to
+    come is skipped and recorded in truncated_stages, so the caller gets
+    whatever was found so far instead of a killed worker.
+
+    Stages are checked, not interrupted: a stage that has started runs to
+    its end. seconds=None never runs out.
+    """
+
+    def __init__(self, seconds=None):
+        self.deadline = None if seconds is None else time.monotonic() + seconds
+        self.truncated_stages = []
+
+    def expired(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def allows(self, stage):
+        """True if stage may run; otherwise records it as truncated."""
+        if not self.expired():
+            return True
+        self.truncate(stage)
+        return False
+
+    def truncate(self, stage):
+        if stage not in self.truncated_stages:
+            self.truncated_stages.append(stage)
@@ -0,0 +1,91 @@
+"""boto3 clients for R2 and DynamoDB, tuned for concurrent loads and shared
+per process.
+
+botocore's defaults - 10 pooled connections, legacy retries, 60 s timeouts,
+no keep-alive - make a busy process open and drop connections whenever more
+than ten threads fetch at once. The clients built here have a larger pool,
+short connect / read timeouts, adaptive retries (which also back off under
+throttling) and TCP keep-alive. Every setting can be overridden from the
+environment.
+
+Clients are thread-safe and built once per process: r2_client() and
+dynamodb_client() return the same client on every call. After a fork (e.g.
+gunicorn workers of a preloaded app) the child builds its own, so no pooled
+socket is ever shared between processes. Call them where the client is
+used rather than keeping the result in a module global that a fork would
+copy.
+"""
+import os
+import threading
+
+import boto3
+from botocore.config import Config
+
+R2_MAX_POOL_CONNECTIONS = int(
+    os.environ.get('PARSELAND_R2_MAX_POOL_CONNECTIONS', 50))
+DYNAMODB_MAX_POOL_CONNECTIONS = int(
+    os.environ.get('PARSELAND_DYNAMODB_MAX_POOL_CONNECTIONS', 25))
+CONNECT_TIMEOUT_SECONDS = float(
+    os.environ.get('PARSELAND_AWS_CONNECT_TIMEOUT_SECONDS', 3))
+READ_TIMEOUT_SECONDS = float(
+    os.environ.get('PARSELAND_AWS_READ_TIMEOUT_SECONDS', 10))
+MAX_ATTEMPTS = int(os.environ.get('PARSELAND_AWS_MAX_ATTEMPTS', 4))
+DYNAMODB_REGION = 'us-east-1'
+
+_clients = {}
+_lock = threading.Lock()
+
+
+def client_config(max_pool_connections):
+    return Config(
+        max_pool_connections=max_pool_connections,
+        connect_timeout=CONNECT_TIMEOUT_SECONDS,
+        read_timeout=READ_TIMEOUT_SECONDS,
+        retries={'mode': 'adaptive', 'max_attempts': MAX_ATTEMPTS},
+        tcp_keepalive=True,
+    )
+
+
+def _shared(name, build):
+    client = _clients.get(name)
+    if client is None:
+        with _lock:
+            client = _clients.get(name)
+            if client is None:
+                # a Session per client: creating clients from boto3's
+                # default session is not thread-safe
+                client = _clients[name] = build(boto3.session.Session())
+    return client
+
+
+def r2_client():
+    """The process's R2 (S3 API) client; credentials are read from
+    R2_ACCOUNT_ID, R2_ACCESS_KEY_ID and R2_SECRET_ACCESS_KEY when it is
+    first built."""
+    return _shared('r2', lambda session: session.client(
+        's3',
+        endpoint_url=f"https://{os.environ.get('R2_ACCOUNT_ID')}.r2.cloudflarestorage.com",
+        aws_access_key_id=os.environ.get('R2_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.environ.get('R2_SECRET_ACCESS_KEY'),
+        region_name='auto',  # R2 uses 'auto' as region
+        config=client_config(R2_MAX_POOL_CONNECTIONS),
+    ))
+
+
+def dynamodb_client():
+    """The process's DynamoDB client."""
+    return _shared('dynamodb', lambda session: session.client(
+        'dynamodb',
+        region_name=DYNAMODB_REGION,
+        config=client_config(DYNAMODB_MAX_POOL_CONNECTIONS),
+    ))
+
+
+def _forget_clients():
+    # the child of a fork must not reuse the parent's connections
+    global _lock
+    _clients.clear()
+    _lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_clients)
@@ -0,0 +1,308 @@
+"""Packed, content-addressed store of landing pages for offline evaluation.
+
+A corpus pack is a single file:
+
+    MAGIC
+    frames    one gzip (or zstd) frame per distinct page, back to back
+    records   _RECORD per frame: sha1 of the page, offset, frame size,
+              page size, codec
+    keys      _KEY per lookup key, sorted: the key's digest, record number
+    entries   gzip'd JSON list of [doi, harvest_id, resolved_url, record]
+    _FOOTER   table counts and offsets
+
+A page is stored once however many DOIs or harvests point at it. The DOI
+key is sha1 of the lowercased DOI - the name eval/html-cache/ and
+mismatches/whole-goldie-cache/ already give their files, so those
+directories import without a DOI list - and the harvest key is sha1 of the
+lowercased harvest UUID. Lookups binary-search the key table in the mmap
+and inflate one frame; iterating streams the pages in the order they were
+added. Packs are reproducible: the same pages added in the same order give
+the same bytes.
+"""
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:  # optional; packs are written with gzip frames instead
+    zstandard = None
+
+MAGIC = b'PLCORP\x00\x01'
+CODEC_GZIP = 1
+CODEC_ZSTD = 2
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 10
+
+_RECORD = struct.Struct('<20sQIIB3x')
+_KEY = struct.Struct('<20sI')
+_FOOTER = struct.Struct('<8sIIQQQQ')
+
+
+def doi_key(doi):
+    return hashlib.sha1(doi.lower().encode('utf-8')).digest()
+
+
+def harvest_key(harvest_id):
+    return hashlib.sha1(str(harvest_id).lower().encode('utf-8')).digest()
+
+
+def default_codec():
+    return CODEC_ZSTD if zstandard is not None else CODEC_GZIP
+
+
+def _compress(data, codec):
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise ValueError('zstd frames need the zstandard package')
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    if codec == CODEC_GZIP:
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    raise ValueError(f'unknown codec {codec}')
+
+
+def _decompress(frame, codec):
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise ValueError('this corpus has zstd frames; install zstandard '
+                             'to read it')
+        return zstandard.ZstdDecompressor().decompress(frame)
+    return zlib.decompress(frame, 16 + zlib.MAX_WBITS)
+
+
+@dataclass(frozen=True)
+class CorpusPage:
+    doi: Optional[str]
+    harvest_id: Optional[str]
+    resolved_url: Optional[str]
+    html: bytes
+
+    @property
+    def text(self):
+        return self.html.decode('utf-8', 'replace')
+
+
+class CorpusWriter:
+    """Write a corpus pack: add() pages, then close(). The pack appears at
+    path only once it is complete."""
+
+    def __init__(self, path, codec=None):
+        self.path = Path(path)
+        self.codec = codec or default_codec()
+        self._tmp = self.path.with_name(self.path.name + '.tmp')
+        self._out = open(self._tmp, 'wb')
+        self._out.write(MAGIC)
+        self._records = []
+        self._by_digest = {}
+        self._keys = {}
+        # (doi or doi digest, harvest_id) -> entry; re-adding replaces
+        self._entries = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._out.close()
+            self._tmp.unlink(missing_ok=True)
+        return False
+
+    def add(self, html, *, doi=None, harvest_id=None, resolved_url=None,
+            doi_sha1=None):
+        """Add a page under its DOI and / or harvest id. doi_sha1 is the hex
+        DOI key, for pages whose DOI is known only by its cache file name.
+        Returns the page's record number."""
+        if isinstance(html, str):
+            html = html.encode('utf-8', 'surrogatepass')
+        keys = []
+        if doi:
+            keys.append(doi_key(doi))
+        elif doi_sha1:
+            keys.append(bytes.fromhex(doi_sha1))
+        if harvest_id:
+            harvest_id = str(harvest_id)
+            keys.append(harvest_key(harvest_id))
+        if not keys:
+            raise ValueError('a page needs a doi or a harvest_id')
+
+        digest = hashlib.sha1(html).digest()
+        record = self._by_digest.get(digest)
+        if record is None:
+            frame = _compress(html, self.codec)
+            record = self._by_digest[digest] = len(self._records)
+            self._records.append(_RECORD.pack(
+                digest, self._out.tell(), len(frame), len(html), self.codec))
+            self._out.write(frame)
+        for key in keys:
+            self._keys[key] = record
+        self._entries[(doi or doi_sha1, harvest_id)] = [
+            doi, harvest_id, resolved_url, record]
+        return record
+
+    def close(self):
+        if self._out.closed:
+            return
+        out = self._out
+        records_at = out.tell()
+        out.write(b''.join(self._records))
+        keys_at = out.tell()
+        out.write(b''.join(_KEY.pack(key, record)
+                           for key, record in sorted(self._keys.items())))
+        entries_at = out.tell()
+        entries = gzip.compress(
+            json.dumps(list(self._entries.values()),
+                       separators=(',', ':')).encode('utf-8'), mtime=0)
+        out.write(entries)
+        out.write(_FOOTER.pack(MAGIC, len(self._records), len(self._keys),
+                               records_at, keys_at, entries_at, len(entries)))
+        out.close()
+        os.replace(self._tmp, self.path)
+
+
+class Corpus:
+    """Read a corpus pack through an mmap; see the module docstring."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < len(MAGIC) + _FOOTER.size or \
+                self._map[:len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f'{self.path} is not a corpus pack')
+        (magic, self._record_count, self._key_count, self._records_at,
+         self._keys_at, self._entries_at, self._entries_size) = \
+            _FOOTER.unpack_from(self._map, len(self._map) - _FOOTER.size)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f'{self.path} is truncated')
+        self._entries = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self):
+        self._map.close()
+
+    def _lookup(self, key):
+        low, high = 0, self._key_count
+        while low < high:
+            mid = (low + high) // 2
+            found, record = _KEY.unpack_from(
+                self._map, self._keys_at + mid * _KEY.size)
+            if found < key:
+                low = mid + 1
+            elif found > key:
+                high = mid
+            else:
+                return record
+        return None
+
+    def _page(self, record):
+        _, offset, size, _, codec = _RECORD.unpack_from(
+            self._map, self._records_at + record * _RECORD.size)
+        return _decompress(self._map[offset:offset + size], codec)
+
+    def get(self, doi=None, harvest_id=None):
+        """The page bytes for a DOI or harvest id, or None."""
+        if not (doi or harvest_id):
+            raise ValueError('get() needs a doi or a harvest_id')
+        key = doi_key(doi) if doi else harvest_key(harvest_id)
+        record = self._lookup(key)
+        return None if record is None else self._page(record)
+
+    def get_text(self, doi=None, harvest_id=None):
+        """get() decoded as UTF-8, undecodable bytes replaced."""
+        html = self.get(doi, harvest_id)
+        return None if html is None else html.decode('utf-8', 'replace')
+
+    def __contains__(self, doi):
+        return self._lookup(doi_key(doi)) is not None
+
+    def entries(self):
+        """[doi, harvest_id, resolved_url, record] for every added page."""
+        if self._entries is None:
+            blob = self._map[self._entries_at:
+                             self._entries_at + self._entries_size]
+            self._entries = json.loads(zlib.decompress(blob, 16 + zlib.MAX_WBITS))
+        return self._entries
+
+    def __len__(self):
+        return len(self.entries())
+
+    def __iter__(self):
+        """Stream every page as a CorpusPage, in the order added."""
+        for doi, harvest_id, resolved_url, record in self.entries():
+            yield CorpusPage(doi, harvest_id, resolved_url, self._page(record))
+
+    def stats(self):
+        frames = sizes = 0
+        for record in range(self._record_count):
+            _, _, size, raw_size, _ = _RECORD.unpack_from(
+                self._map, self._records_at + record * _RECORD.size)
+            frames += size
+            sizes += raw_size
+        return {'entries': len(self), 'pages': self._record_count,
+                'keys': self._key_count, 'page_bytes': sizes,
+                'packed_bytes': frames, 'file_bytes': len(self._map)}
+
+
+def import_cache_dir(writer, cache_dir, dois=()):
+    """Add every <sha1(doi)>.html page of cache_dir (eval/html-cache/,
+    mismatches/whole-goldie-cache/). dois names the pages whose DOI is
+    known; the others are found by DOI all the same but iterate with
+    doi=None. Returns the number of pages added."""
+    names = {hashlib.sha1(doi.lower().encode('utf-8')).hexdigest(): doi
+             for doi in dois}
+    added = 0
+    for path in sorted(Path(cache_dir).glob('*.html')):
+        writer.add(path.read_bytes(), doi=names.get(path.stem),
+                   doi_sha1=path.stem)
+        added += 1
+    return added
+
+
+def import_r2(writer, pages, s3=None, max_workers=16):
+    """Add the R2 landing page of every (doi, harvest_id, resolved_url) in
+    pages, fetching max_workers at a time. Returns [(harvest_id, error)]
+    for those not added."""
+    from parseland_lib.clients import r2_client
+    from parseland_lib.s3 import get_landing_page_from_r2
+
+    s3 = s3 or r2_client()
+
+    def fetch(page):
+        try:
+            return page, get_landing_page_from_r2(page[1], s3), None
+        except Exception as e:
+            return page, None, f'{type(e).__name__}: {e}'
+
+    failed = []
+    pages = iter(pages)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # a window of pages at a time, so fetched pages wait in memory for
+        # at most one window
+        while window := list(islice(pages, max_workers * 4)):
+            for (doi, harvest_id, resolved_url), html, error in \
+                    pool.map(fetch, window):
+                if html is None:
+                    failed.append((harvest_id, error or 'no landing page'))
+                    continue
+                writer.add(html, doi=doi, harvest_id=harvest_id,
+                           resolved_url=resolved_url)
+    return failed
@@ -1,21 +1,68 @@
+import time
+
+TABLE_NAME = 'harvested-html'
+BATCH_GET_LIMIT = 100  # BatchGetItem accepts at most 100 keys per call
+BATCH_GET_RETRIES = 5
+
+
+def _empty_record():
+    return {'resolved_url': None, 'namespace': None}
+
+
+def _record_from_item(item):
+    return {
+        'resolved_url': item.get('resolved_url', {}).get('S'),
+        'namespace': item.get('native_id_namespace', {}).get('S')
+    }
+
+
 def get_dynamodb_record(harvest_id, dynamodb):
     try:
         response = dynamodb.get_item(
-            TableName='harvested-html',
+            TableName=TABLE_NAME,
             Key={
                 'id': {'S': str(harvest_id)}
             }
         )
 
         if 'Item' not in response:
-            return {'resolved_url': None, 'namespace': None}
+            return _empty_record()
 
-        item = response['Item']
-        return {
-            'resolved_url': item.get('resolved_url', {}).get('S'),
-            'namespace': item.get('native_id_namespace', {}).get('S')
-        }
+        return _record_from_item(response['Item'])
 
     except Exception as e:
         print(f"Error getting record for harvest_id {harvest_id}: {str(e)}")
-        return {'resolved_url': None, 'namespace': None}
\ No newline at end of file
+        return _empty_record()
+
+
+def get_dynamodb_records(harvest_ids, dynamodb):
+    """Batch version of get_dynamodb_record.
+
+    Looks the ids up with BatchGetItem, 100 keys per call, and returns
+    {str(harvest_id): record} for every id. Ids that are missing, or whose
+    lookup failed, get the same empty record get_dynamodb_record returns.
+    """
+    ids = list(dict.fromkeys(str(harvest_id) for harvest_id in harvest_ids))
+    records = {harvest_id: _empty_record() for harvest_id in ids}
+
+    for start in range(0, len(ids), BATCH_GET_LIMIT):
+        chunk = ids[start:start + BATCH_GET_LIMIT]
+        request_items = {
+            TABLE_NAME: {'Keys': [{'id': {'S': harvest_id}} for harvest_id in chunk]}
+        }
+        try:
+            for attempt in range(BATCH_GET_RETRIES):
+                response = dynamodb.batch_get_item(RequestItems=request_items)
+                for item in response.get('Responses', {}).get(TABLE_NAME, []):
+                    records[item['id']['S']] = _record_from_item(item)
+                # throttled keys come back unprocessed; retry them with backoff
+                request_items = response.get('UnprocessedKeys')
+                if not request_items:
+                    break
+                time.sleep(0.05 * 2 ** attempt)
+            else:
+                print(f"Gave up on {len(request_items[TABLE_NAME]['Keys'])} unprocessed harvest_ids")
+        except Exception as e:
+            print(f"Error getting records for harvest_ids {chunk[0]}..{chunk[-1]}: {str(e)}")
+
+    return records
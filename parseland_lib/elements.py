@@ -2,21 +2,109 @@ from dataclasses import dataclass
 from typing import Optional, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class Author:
     name: str
     aff_ids: list
     is_corresponding: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Affiliation:
     organization: str
     aff_id: Optional[Union[int, str]]
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthorAffiliations:
     name: str
     affiliations: list
     is_corresponding: Optional[bool] = None
+
+
+# Result model. Parsers return author dicts, AuthorAffiliations or bare
+# lists; parse_page normalizes that output once, into the records below, and
+# serializes them to the response JSON shape with to_dict().
+
+@dataclass(slots=True)
+class AuthorRecord:
+    name: str
+    affiliations: tuple = ()
+    is_corresponding: Optional[bool] = None
+
+    @classmethod
+    def from_parsed(cls, author):
+        """Build from a parser's author dict or author object."""
+        if isinstance(author, dict):
+            return cls(author.get("name", ""),
+                       tuple(author.get("affiliations", [])),
+                       author.get("is_corresponding", None))
+        return cls(getattr(author, "name", ""),
+                   tuple(getattr(author, "affiliations", [])),
+                   getattr(author, "is_corresponding", None))
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "affiliations": [{"name": aff} for aff in self.affiliations],
+            "is_corresponding": self.is_corresponding,
+        }
+
+
+@dataclass(slots=True)
+class UrlRecord:
+    url: str
+    content_type: str
+
+    def to_dict(self):
+        return {"url": self.url, "content_type": self.content_type}
+
+
+@dataclass(slots=True)
+class PageRecord:
+    authors: list
+    urls: list
+    license: Optional[str] = None
+    version: Optional[str] = None
+    abstract: Optional[str] = None
+    truncated_stages: tuple = ()
+
+    @classmethod
+    def from_parsed(cls, authors_and_abstract, fulltext_location,
+                    truncated_stages=()):
+        """Build from get_authors_and_abstract() output (a dict, a bare
+        author list or None) and a fulltext location dict (or None)."""
+        if authors_and_abstract is None:
+            authors_and_abstract = {'authors': [], 'abstract': None}
+        elif isinstance(authors_and_abstract, list):
+            authors_and_abstract = {'authors': authors_and_abstract,
+                                    'abstract': None}
+        response = {**authors_and_abstract, **(fulltext_location or {})}
+
+        authors = response.get("authors", [])
+        if authors:
+            authors = [AuthorRecord.from_parsed(author) for author in authors]
+
+        urls = []
+        if response.get("pdf_url"):
+            urls.append(UrlRecord(response["pdf_url"], "pdf"))
+        if response.get("resolved_url"):
+            urls.append(UrlRecord(response["resolved_url"], "html"))
+
+        return cls(authors, urls, response.get("license"),
+                   response.get("version"), response.get("abstract"),
+                   tuple(truncated_stages))
+
+    def to_dict(self):
+        """The parseland response JSON shape."""
+        result = {
+            "authors": [author.to_dict() for author in self.authors]
+            if self.authors else self.authors,
+            "urls": [url.to_dict() for url in self.urls],
+            "license": self.license,
+            "version": self.version,
+            "abstract": self.abstract,
+        }
+        if self.truncated_stages:
+            result["truncated_stages"] = list(self.truncated_stages)
+        return result
@@ -2,6 +2,7 @@ import html
 import re
 from urllib.parse import urlparse, urlsplit, urlunsplit
 
+from parseland_lib.budget import ParseBudget
 from parseland_lib.legacy_parse_utils.resolved_url import get_base_url_from_soup
 from parseland_lib.legacy_parse_utils.pdf import trust_publisher_license, \
     find_normalized_license, DuckLink, get_link_target, clean_pdf_url, \
@@ -10,7 +11,9 @@ from parseland_lib.legacy_parse_utils.pdf import trust_publisher_license, \
 from parseland_lib.legacy_parse_utils.version_and_license import \
     page_potential_license_text, detect_sd_author_manuscript, detect_bronze, \
     detect_hybrid
-from parseland_lib.legacy_parse_utils.strings import cleanup_soup
+from parseland_lib.legacy_parse_utils.strings import cleanup_soup, \
+    LandingPage, original_soup
+from parseland_lib.page_context import page_context
 
 
 # Lippincott / Wolters Kluwer (journals.lww.com) embeds the article PDF as a
@@ -96,10 +99,11 @@ def find_de_gruyter_pdf_link(soup):
     non-anchor .pdf-container, so the generic anchor scanner has no link to
     pick. The PDF route is the same DOI-scoped document path with /pdf.
     """
+    context = page_context(original_soup(soup))
     for tag in (
-        soup.select_one('link[rel="canonical"]'),
-        soup.select_one('meta[property="og:url"]'),
-        soup.select_one('meta[name="og:url"]'),
+        context.link("canonical"),
+        context.meta(property="og:url"),
+        context.meta(name="og:url"),
     ):
         if not tag:
             continue
@@ -129,10 +133,11 @@ def find_tandfonline_pdf_link(soup):
     /doi/pdf/<doi>. Keep this host- and path-scoped so non-TandF pages and
     TaylorFrancis book/product pages are not affected.
     """
+    context = page_context(soup)
     for tag in (
-        soup.select_one('link[rel="canonical"]'),
-        soup.select_one('meta[property="og:url"]'),
-        soup.select_one('meta[name="og:url"]'),
+        context.link("canonical"),
+        context.meta(property="og:url"),
+        context.meta(name="og:url"),
     ):
         if not tag:
             continue
@@ -182,22 +187,26 @@ def _doi_router_relative_pdf_base(pdf_href, resolved_url):
     return resolved_url
 
 
-def parse_publisher_fulltext_location(soup, resolved_url):
+def parse_publisher_fulltext_location(soup, resolved_url, budget=None):
+    budget = budget or ParseBudget()
     cleaned_soup = cleanup_soup(soup)
     detected_resolved_url = get_base_url_from_soup(soup)
     if not resolved_url:
         resolved_url = detected_resolved_url
     resolved_host = urlparse(resolved_url).hostname or ''
-    soup_str = str(soup)
-    license_search_substr = page_potential_license_text(soup_str)
+    # serialized and parsed once, from the cleaned view, for every helper below
+    landing_page = LandingPage(cleaned_soup)
+    soup_str = landing_page.html
+    license_search_substr = page_potential_license_text(landing_page)
     version = 'publishedVersion'
     open_version_source_string, oa_status, license = None, None, trust_publisher_license(
         resolved_url) and find_normalized_license(license_search_substr)
     def is_ojs_full_index(soup):
-        ojs_meta = soup.find('meta', {'name': 'generator',
-                                      'content': re.compile(
-                                          r'^Open Journal Systems')})
-        if ojs_meta is not None:
+        is_ojs = any(
+            re.match(r'^Open Journal Systems', meta.get('content') or '')
+            for meta in page_context(original_soup(soup)).metas_by(
+                'name', 'generator'))
+        if is_ojs:
             main_article_elements = soup.select(
                 'div[role="main"] li a[id^="article-"]')
             return len(main_article_elements) > 1
@@ -207,43 +216,45 @@ def parse_publisher_fulltext_location(soup, resolved_url):
 
     pdf_link = None
 
-    if am_ovs := detect_sd_author_manuscript(soup):
-        open_version_source_string = am_ovs
-        version = 'acceptedVersion'
-        pdf_link = DuckLink(re.sub(
-            r'/article/(?:abs/)?pii/', '/article/am/pii/', resolved_url),
-            'download')
-
-    pdf_link = find_pdf_link(resolved_url, soup=cleaned_soup,
-                             page_with_scripts=soup_str) if not pdf_link else pdf_link
-
-    if pdf_link is None:
-        if resolved_host.endswith('ieeexplore.ieee.org') and (
-        ieee_pdf := re.search(r'"pdfPath":\s*"(/ielx?7/[\d/]*\.pdf)"',
-                              str(soup))):
-            pdf_link = DuckLink(
-                ieee_pdf.group(1).replace('iel7', 'ielx7'), 'download')
-        elif any(resolved_host.endswith(x) for x in
-                 ['osf.io', 'psyarxiv.com']):
-            pdf_link = DuckLink(get_link_target('download', resolved_url),
-                                'download')
-        elif am_ovs := detect_sd_author_manuscript(soup):
+    if budget.allows('pdf_link'):
+        if am_ovs := detect_sd_author_manuscript(cleaned_soup):
             open_version_source_string = am_ovs
             version = 'acceptedVersion'
-            pdf_link = DuckLink(resolved_url.replace(
-                '/article/pii/', '/article/am/pii/'), 'download')
-        elif resolved_host.endswith('journals.lww.com') and (
-                lww_pdf := find_lww_pdf_link(soup_str)):
-            pdf_link = DuckLink(lww_pdf, 'download')
-        elif resolved_host.endswith('cambridge.org') and (
-                cup_pdf := find_cup_pdf_link(soup_str)):
-            pdf_link = DuckLink(cup_pdf, 'download')
-        elif resolved_host.endswith(('degruyter.com', 'degruyterbrill.com')) and (
-                de_gruyter_pdf := find_de_gruyter_pdf_link(soup)):
-            pdf_link = DuckLink(de_gruyter_pdf, 'De Gruyter document PDF')
-        elif resolved_host.endswith('tandfonline.com') and (
-                tandfonline_pdf := find_tandfonline_pdf_link(soup)):
-            pdf_link = DuckLink(tandfonline_pdf, 'Taylor & Francis DOI PDF')
+            pdf_link = DuckLink(re.sub(
+                r'/article/(?:abs/)?pii/', '/article/am/pii/', resolved_url),
+                'download')
+
+        pdf_link = find_pdf_link(resolved_url, soup=cleaned_soup,
+                                 page_with_scripts=soup_str,
+                                 page=landing_page) if not pdf_link else pdf_link
+
+        if pdf_link is None:
+            if resolved_host.endswith('ieeexplore.ieee.org') and (
+            ieee_pdf := re.search(r'"pdfPath":\s*"(/ielx?7/[\d/]*\.pdf)"',
+                                  soup_str)):
+                pdf_link = DuckLink(
+                    ieee_pdf.group(1).replace('iel7', 'ielx7'), 'download')
+            elif any(resolved_host.endswith(x) for x in
+                     ['osf.io', 'psyarxiv.com']):
+                pdf_link = DuckLink(get_link_target('download', resolved_url),
+                                    'download')
+            elif am_ovs := detect_sd_author_manuscript(cleaned_soup):
+                open_version_source_string = am_ovs
+                version = 'acceptedVersion'
+                pdf_link = DuckLink(resolved_url.replace(
+                    '/article/pii/', '/article/am/pii/'), 'download')
+            elif resolved_host.endswith('journals.lww.com') and (
+                    lww_pdf := find_lww_pdf_link(soup_str)):
+                pdf_link = DuckLink(lww_pdf, 'download')
+            elif resolved_host.endswith('cambridge.org') and (
+                    cup_pdf := find_cup_pdf_link(soup_str)):
+                pdf_link = DuckLink(cup_pdf, 'download')
+            elif resolved_host.endswith(('degruyter.com', 'degruyterbrill.com')) and (
+                    de_gruyter_pdf := find_de_gruyter_pdf_link(cleaned_soup)):
+                pdf_link = DuckLink(de_gruyter_pdf, 'De Gruyter document PDF')
+            elif resolved_host.endswith('tandfonline.com') and (
+                    tandfonline_pdf := find_tandfonline_pdf_link(soup)):
+                pdf_link = DuckLink(tandfonline_pdf, 'Taylor & Francis DOI PDF')
 
     if pdf_link is not None:
         pdf_base_url = _doi_router_relative_pdf_base(pdf_link.href, resolved_url)
@@ -253,11 +264,14 @@ def parse_publisher_fulltext_location(soup, resolved_url):
     pdf_url, pdf_link = clean_pdf_url(pdf_url, pdf_link) if pdf_url else (None, None)
     pdf_url = normalize_de_gruyter_pdf_url(pdf_url)
 
-    if bronze_ovs := detect_bronze(soup, resolved_url):
+    if budget.allows('bronze') and (
+            bronze_ovs := detect_bronze(soup, resolved_url, page=landing_page)):
         open_version_source_string = bronze_ovs
         oa_status = 'bronze'
 
-    if (hybrid_parse := detect_hybrid(soup, license_search_substr, resolved_url)) and \
+    if budget.allows('hybrid') and \
+            (hybrid_parse := detect_hybrid(soup, license_search_substr,
+                                           resolved_url, page=landing_page)) and \
             hybrid_parse[0] is not None and open_version_source_string is None:
         open_version_source_string, license = hybrid_parse
         oa_status = 'hybrid'
@@ -274,13 +288,15 @@ def parse_publisher_fulltext_location(soup, resolved_url):
              }
 
 
-def parse_repo_fulltext_location(soup, resolved_url):
-    soup_str = str(soup)
+def parse_repo_fulltext_location(soup, resolved_url, budget=None):
+    budget = budget or ParseBudget()
+    landing_page = LandingPage(soup)
+    soup_str = landing_page.html
     if not resolved_url:
         resolved_url = get_base_url_from_soup(soup)
 
     # license
-    license_search_substr = page_potential_license_text(soup_str)
+    license_search_substr = page_potential_license_text(landing_page)
     license = find_normalized_license(license_search_substr)
 
     # version
@@ -289,18 +305,20 @@ def parse_repo_fulltext_location(soup, resolved_url):
     # fulltext url
     pdf_url = None
     doc_url = None
-    pdf_download_link = find_pdf_link(resolved_url, soup, page_with_scripts=soup_str)
+    pdf_download_link = find_pdf_link(
+        resolved_url, soup, page_with_scripts=soup_str,
+        page=landing_page) if budget.allows('pdf_link') else None
     if pdf_download_link is not None:
         pdf_url = get_link_target(pdf_download_link.href, resolved_url) if hasattr(pdf_download_link, 'href') else None
 
-    doc_link = find_doc_download_link(soup_str)
+    doc_link = find_doc_download_link(landing_page)
     if doc_link is None and try_pdf_link_as_doc(resolved_url):
         doc_link = pdf_download_link
 
         if doc_link:
             doc_url = get_link_target(doc_link.href, resolved_url)
 
-    bhl_link = find_bhl_view_link(resolved_url, soup)
+    bhl_link = find_bhl_view_link(resolved_url, landing_page)
     if bhl_link:
         doc_url = bhl_link.href
 
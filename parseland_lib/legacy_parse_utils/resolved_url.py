@@ -1,33 +1,33 @@
 from urllib.parse import urlparse
 
+from parseland_lib.page_context import page_context
+
+
 def get_base_url_from_soup(soup):
     """Extract base URL from BeautifulSoup object."""
-    base_tag = soup.find('base', href=True)
-    if base_tag:
-        return base_tag['href']
-
-    canonical = soup.find('link', {'rel': 'canonical', 'href': True})
-    if canonical:
-        return canonical['href']
-
-    og_url = soup.find('meta', {'property': 'og:url', 'content': True})
-    if og_url:
-        return og_url['content']
-
-    meta_url_tags = [
-        ('meta', {'name': 'citation_url', 'content': True}),
-        ('meta', {'name': 'dc.identifier', 'content': True}),
-        ('meta', {'property': 'al:web:url', 'content': True}),
+    context = page_context(soup)
+    if context.base is not None:
+        return context.base['href']
+
+    for canonical in context.links('canonical'):
+        if canonical.has_attr('href'):
+            return canonical['href']
+
+    meta_url_attrs = [
+        ('property', 'og:url'),
+        ('name', 'citation_url'),
+        ('name', 'dc.identifier'),
+        ('property', 'al:web:url'),
     ]
 
-    for tag, attrs in meta_url_tags:
-        meta = soup.find(tag, attrs)
-        if meta:
-            return meta['content']
+    for attr, value in meta_url_attrs:
+        for meta in context.metas_by(attr, value):
+            if meta.has_attr('content'):
+                return meta['content']
 
-    for meta in soup.find_all('meta', content=True):
-        content = meta['content']
-        if content.startswith(('http://', 'https://')):
+    for meta in context.metas:
+        content = meta.get('content')
+        if content is not None and content.startswith(('http://', 'https://')):
             parsed = urlparse(content)
             return f"{parsed.scheme}://{parsed.netloc}"
 
@@ -0,0 +1,160 @@
+"""Compiled matchers for the legacy URL / link rule tables.
+
+The blacklists and per-publisher rules in pdf.py and version_and_license.py
+are evaluated for every candidate link on every page. They are declared
+once at module level and compiled here at import time: substring blacklists
+become one alternation, lists of regexes become one pattern, rules that
+only apply to one publisher are keyed by host so a link is only checked
+against the rules for its own host, and long lists of regexes or needles
+run over whole pages are gated by literals they cannot match without.
+"""
+import re
+from urllib.parse import urlparse
+
+
+class SubstringSet:
+    """Does any of a fixed set of words occur in a text?
+
+    Equivalent to any(word in text for word in words), compiled into a
+    single alternation so the cost no longer grows with the list. With
+    ignore_case, both sides are lower()ed first, as the tables always did.
+    """
+
+    def __init__(self, words, ignore_case=True):
+        self.ignore_case = ignore_case
+        words = {word.lower() if ignore_case else word for word in words}
+        words = sorted(words, key=len, reverse=True)
+        self._re = re.compile('|'.join(map(re.escape, words))) if words else None
+
+    def search(self, text):
+        if self._re is None or not text:
+            return None
+        return self._re.search(text.lower() if self.ignore_case else text)
+
+    def __contains__(self, text):
+        return self.search(text) is not None
+
+
+def any_pattern(patterns, flags=0):
+    """Compile a list of regexes into one that matches where any of them
+    would (search semantics)."""
+    return re.compile('|'.join('(?:{})'.format(p) for p in patterns), flags)
+
+
+def url_host(url):
+    if not url:
+        return ''
+    try:
+        return (urlparse(url).hostname or '').lower()
+    except ValueError:
+        return ''
+
+
+class HostRules:
+    """Rules keyed by the host they apply to.
+
+    Built from (hosts, rule) pairs. rules_for(url) returns, in declaration
+    order, the rules declared for the url's host or one of its parent
+    domains, plus rules declared with no hosts, which apply everywhere.
+    Rules still check the full url themselves; the host key only decides
+    which rules are worth checking.
+    """
+
+    def __init__(self, rules):
+        self._everywhere = []
+        self._by_host = {}
+        for order, (hosts, rule) in enumerate(rules):
+            if not hosts:
+                self._everywhere.append((order, rule))
+            for host in hosts:
+                self._by_host.setdefault(host.lower(), []).append((order, rule))
+
+    def rules_for(self, url):
+        found = dict(self._everywhere)
+        parts = url_host(url).split('.')
+        for i in range(len(parts)):
+            found.update(self._by_host.get('.'.join(parts[i:]), []))
+        return [found[order] for order in sorted(found)]
+
+
+class SnippetPatterns:
+    """(url snippet, page regex) rules: a rule fires when its snippet occurs
+    in the url and its regex matches the page.
+
+    The regexes sharing a snippet are compiled into one pattern, so a page is
+    searched once per snippet found in the url rather than once per rule.
+    """
+
+    def __init__(self, rules, flags=0):
+        grouped = {}
+        for snippet, pattern in rules:
+            grouped.setdefault(snippet, []).append(pattern)
+        self._rules = [(snippet, any_pattern(patterns, flags))
+                       for snippet, patterns in grouped.items()]
+
+    def search(self, url, page):
+        url = url.lower()
+        return any(snippet in url and pattern.search(page)
+                   for snippet, pattern in self._rules)
+
+
+# Characters outside ASCII that an IGNORECASE regex matches to an ASCII
+# letter although their lower() is not that letter ('İ', 'ı', 'ſ').
+_IGNORECASE_SPECIALS = '\u0130\u0131\u017f'
+
+
+class GatedPatterns:
+    """IGNORECASE regexes, each declared with a literal every match of it
+    contains, run only on texts where the literal occurs.
+
+    Declaration order is kept: last_match(text) is the match of the last
+    pattern, in order, that matches text - what looping over all of them and
+    keeping the last hit returned - but patterns whose literal is absent
+    from text.lower() are never searched.
+    """
+
+    def __init__(self, rules):
+        self._rules = [(literal.lower(), re.compile(pattern, re.IGNORECASE))
+                       for literal, pattern in rules]
+
+    def last_match(self, text):
+        if not text:
+            return None
+        lowered = text.lower()
+        # the few characters lower() does not fold the way the regex engine
+        # does: fall back to searching every pattern
+        gated = not any(char in text for char in _IGNORECASE_SPECIALS)
+        for literal, pattern in reversed(self._rules):
+            if gated and literal not in lowered:
+                continue
+            if match := pattern.search(text):
+                return match
+        return None
+
+
+class OrderedLookups:
+    """(needle, value) pairs where the first pair, in declaration order,
+    whose needle occurs in a text wins.
+
+    Needles sharing one of the anchors (a substring of each of them) are
+    skipped together when the anchor does not occur, so a text without e.g.
+    "creativecommons" costs one search for the whole group.
+    """
+
+    def __init__(self, lookups, anchors=()):
+        self._lookups = [
+            (needle, value,
+             next((anchor for anchor in anchors if anchor in needle), None))
+            for needle, value in lookups]
+
+    def first(self, text):
+        present = {}
+        for needle, value, anchor in self._lookups:
+            if anchor is not None:
+                if anchor not in present:
+                    present[anchor] = anchor in text
+                if not present[anchor]:
+                    continue
+            if needle in text:
+                return value
+        return None
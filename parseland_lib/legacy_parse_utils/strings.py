@@ -1,3 +1,4 @@
+import copy
 import re
 
 import bs4
@@ -5,6 +6,9 @@ from bs4 import UnicodeDammit
 from lxml import html, etree
 from unidecode import unidecode
 
+from parseland_lib.page_context import page_context
+from parseland_lib.trace import traced
+
 
 
 def clean_html(raw_html):
@@ -12,26 +16,99 @@ def clean_html(raw_html):
     cleantext = re.sub(cleanr, '', raw_html)
     return cleantext
 
+class CleanedSoup:
+    """A read-only view of a soup with cleanup_soup's nodes left out.
+
+    cleanup_soup used to extract <script> and table-of-contents nodes from
+    the soup itself, which left every later consumer looking at a different
+    document (and made callers deepcopy the soup first). The view keeps the
+    removed nodes in a skip-set instead: str(view), select() and find() see
+    the cleaned document while the soup underneath is never touched.
+    """
+
+    def __init__(self, soup, removed=()):
+        self.soup = soup
+        self.removed = list(removed)
+        self._removed_ids = {id(tag) for tag in self.removed}
+
+    def is_removed(self, element):
+        """True if element is a removed node or sits inside one."""
+        while element is not None:
+            if id(element) in self._removed_ids:
+                return True
+            element = element.parent
+        return False
+
+    def elements(self, start=None):
+        """start and its descendants in document order, skipping removed
+        subtrees."""
+        start = self.soup if start is None else start
+        yield start
+        if not getattr(start, 'contents', None):
+            return
+        stop = start._last_descendant().next_element
+        element = start.contents[0]
+        while element is not None and element is not stop:
+            if id(element) in self._removed_ids:
+                element = element._last_descendant().next_element
+                continue
+            yield element
+            element = element.next_element
+
+    def get_text(self, tag):
+        """tag.get_text() as it reads once the removed nodes are gone."""
+        types = tag.interesting_string_types
+        if isinstance(types, type):
+            types = (types,)
+        return ''.join(
+            element for element in self.elements(tag)
+            if isinstance(element, bs4.NavigableString)
+            and type(element) in types)
+
+    def select(self, selector):
+        return [tag for tag in self.soup.select(selector)
+                if not self.is_removed(tag)]
+
+    def select_one(self, selector):
+        return next(iter(self.select(selector)), None)
+
+    def find(self, predicate):
+        for element in self.elements():
+            if isinstance(element, bs4.Tag) and predicate(element):
+                return element
+        return None
+
+    def __str__(self):
+        if not self.removed:
+            return str(self.soup)
+        return self.soup.decode(iterator=self.elements())
+
+
+def original_soup(soup):
+    """The soup underneath a CleanedSoup; any other soup as is."""
+    return soup.soup if isinstance(soup, CleanedSoup) else soup
+
+
+@traced('cleanup_soup')
 def cleanup_soup(soup):
     from parseland_lib.publisher.parsers.wiley import Wiley
+    soup = original_soup(soup)
+    removed = []
     try:
-        [script.extract() for script in soup('script')]
-        [div.extract() for div in
-         soup.find_all("div", {'class': 'table-of-content'})]
-        [div.extract() for div in
-         soup.find_all("li", {'class': 'linked-article__item'})]
+        removed += soup('script')
+        removed += soup.find_all("div", {'class': 'table-of-content'})
+        removed += soup.find_all("li", {'class': 'linked-article__item'})
 
         if Wiley(soup).is_publisher_specific_parser():
-            [div.extract() for div in
-             soup.find_all('div', {'class': 'hubpage-menu'})]
+            removed += soup.find_all('div', {'class': 'hubpage-menu'})
 
-        if soup.find('meta', {'property': 'og:site_name', 'content': lambda
-                x: 'Oncology Nursing Society' in x}):
-            [div.extract() for div in
-             soup.find_all('div', {'class': 'view-issue-articles'})]
+        if any('Oncology Nursing Society' in (meta.get('content') or '')
+               for meta in page_context(soup).metas_by('property',
+                                                       'og:site_name')):
+            removed += soup.find_all('div', {'class': 'view-issue-articles'})
     except Exception as e:
         pass
-    return soup
+    return CleanedSoup(soup, removed)
 
 def remove_punctuation(input_string):
     # from http://stackoverflow.com/questions/265960/best-way-to-strip-punctuation-from-a-string-in-python
@@ -72,20 +149,46 @@ def decode_escaped_href(href):
 
     return href
 
-def get_tree(page):
-    if page is None:
-        return None
+class LandingPage:
+    """A landing page serialized and parsed once for the legacy helpers.
 
-    if isinstance(page, bs4.BeautifulSoup):
-        page = str(page)
-    elif not isinstance(page, str):
-        # handle any other non-string types
-        try:
-            page = str(page)
-        except UnicodeDecodeError:
-            # Handle the case where page cannot be converted to string
-            return None
+    The fulltext helpers (pdf links, license text, bronze/hybrid detection)
+    each used to call str(soup) and build their own lxml tree from it. A
+    LandingPage holds one serialization of the soup and one lxml tree built
+    from it; the helpers accept it anywhere they accept a page string.
+
+    The serialization is taken on first use, so build it after the soup has
+    been cleaned up. The tree is shared: callers that clear sections must
+    work on get_tree(page, writable=True).
+    """
+
+    def __init__(self, soup):
+        self.soup = soup
+        self._html = None
+        self._tree = None
+        self._tree_built = False
 
+    @property
+    def html(self):
+        if self._html is None:
+            self._html = str(self.soup)
+        return self._html
+
+    @property
+    def tree(self):
+        if not self._tree_built:
+            self._tree = _parse_tree(self.html)
+            self._tree_built = True
+        return self._tree
+
+    def __str__(self):
+        return self.html
+
+    def __contains__(self, item):
+        return item in self.html
+
+
+def _parse_tree(page):
     page = page.replace("&nbsp;",
                         " ")  # otherwise starts-with for lxml doesn't work
     try:
@@ -97,3 +200,24 @@ def get_tree(page):
         tree = None
     return tree
 
+
+def get_tree(page, writable=False):
+    if page is None:
+        return None
+
+    if isinstance(page, LandingPage):
+        tree = page.tree
+        # copying the parsed tree is much cheaper than parsing the page again
+        return copy.deepcopy(tree) if writable and tree is not None else tree
+
+    if isinstance(page, bs4.BeautifulSoup):
+        page = str(page)
+    elif not isinstance(page, str):
+        # handle any other non-string types
+        try:
+            page = str(page)
+        except UnicodeDecodeError:
+            # Handle the case where page cannot be converted to string
+            return None
+
+    return _parse_tree(page)
@@ -4,85 +4,102 @@ from lxml import etree
 
 from parseland_lib.legacy_parse_utils.pdf import get_pdf_in_meta, \
     trust_publisher_license, find_normalized_license
+from parseland_lib.legacy_parse_utils.rules import GatedPatterns, \
+    SnippetPatterns, any_pattern
 from parseland_lib.legacy_parse_utils.strings import normalized_strings_equal, \
-    get_tree
+    get_tree, LandingPage
+from parseland_lib.page_context import page_context
+from parseland_lib.text_index import text_index
+from parseland_lib.trace import traced
+
+
+_LICENSE_BAD_SECTIONS = etree.XPath(" | ".join([
+    "//div[contains(@class, 'view-pnas-featured')]",  # https://www.pnas.org/content/114/38/10035
+    "//meta[contains(@name, 'citation_reference')]",  # https://www.thieme-connect.de/products/ebooks/lookinside/10.1055/sos-SD-226-00098
+]))
 
 
 def page_potential_license_text(page):
     tree = get_tree(page)
 
     if tree is None:
-        return page
-
-    section_removed = False
+        return str(page)
 
-    bad_section_finders = [
-        "//div[contains(@class, 'view-pnas-featured')]",  # https://www.pnas.org/content/114/38/10035
-        "//meta[contains(@name, 'citation_reference')]",  # https://www.thieme-connect.de/products/ebooks/lookinside/10.1055/sos-SD-226-00098
-    ]
+    if not _LICENSE_BAD_SECTIONS(tree):
+        return str(page)
 
-    for section_finder in bad_section_finders:
-        for bad_section in tree.xpath(section_finder):
-            bad_section.clear()
-            section_removed = True
+    if isinstance(page, LandingPage):
+        tree = get_tree(page, writable=True)
 
-    if not section_removed:
-        return page
+    for bad_section in _LICENSE_BAD_SECTIONS(tree):
+        bad_section.clear()
 
     try:
         return etree.tostring(tree, encoding=str)
     except Exception:
-        return page
-
-
-def detect_bronze(soup, resolved_url):
+        return str(page)
+
+
+_BRONZE_URL_SNIPPET_PATTERNS = SnippetPatterns([
+    ('sciencedirect.com/',
+     '<div class="OpenAccessLabel">open archive</div>'),
+    ('sciencedirect.com/',
+     r'<span[^>]*class="[^"]*pdf-download-label[^"]*"[^>]*>Download PDF</span>'),
+    ('sciencedirect.com/',
+     r'<span class="primary-cta-button-text|link-button-text">View\s*<strong>PDF</strong></span>'),
+    ('onlinelibrary.wiley.com',
+     '<div[^>]*class="doi-access"[^>]*>Free Access</div>'),
+    ('openedition.org', r'<span[^>]*id="img-freemium"[^>]*></span>'),
+    ('openedition.org', r'<span[^>]*id="img-openaccess"[^>]*></span>'),
+    # landing page html is invalid: <span class="accesstext"></span>Free</span>
+    ('microbiologyresearch.org',
+     r'<span class="accesstext">(?:</span>)?Free'),
+    ('journals.lww.com',
+     r'<li[^>]*id="[^"]*-article-indicators-free"[^>]*>'),
+    ('ashpublications.org', r'<i[^>]*class="[^"]*icon-availability_free'),
+    ('academic.oup.com', r'<i[^>]*class="[^"]*icon-availability_free'),
+    ('publications.aap.org', r'<i[^>]*class="[^"]*icon-availability_free'),
+    ('degruyter.com/', '<span>Free Access</span>'),
+    ('degruyter.com/', 'data-accessrestricted="false"'),
+    (
+    'practicalactionpublishing.com', r'<img [^>]*class="open-access-icon"'),
+    ("iucnredlist.org", r'<title>'),
+], re.IGNORECASE | re.DOTALL)
+
+_NEJM_FREE_RE = re.compile('<meta content="yes" name="evt-free"', re.IGNORECASE | re.DOTALL)
+_CHICAGO_FREE_RE = re.compile(r'<img[^>]*class="[^"]*accessIconLocation', re.IGNORECASE | re.DOTALL)
+_ELSEVIER_OPEN_ARCHIVE_RE = re.compile(
+    r'<span[^>]*class="[^"]*article-header__access[^"]*"[^>]*>Open Archive</span>',
+    re.IGNORECASE | re.DOTALL)
+
+_BRONZE_CITATION_PDF_RE = re.compile(
+    r'^https?://www\.sciencedirect\.com/science/article/pii/S[0-9X]+/pdf(?:ft)?\?md5=[0-9a-f]+.*[0-9x]+-main.pdf$',
+    re.IGNORECASE | re.DOTALL)
+
+
+@traced('detect_bronze')
+def detect_bronze(soup, resolved_url, page=None):
     from parseland_lib.publisher.parsers.nejm import NewEnglandJournalOfMedicine
     from parseland_lib.publisher.parsers.elsevier_bv import ElsevierBV
-    page = str(soup)
+    landing_page = page if page is not None else LandingPage(soup)
+    page = str(landing_page)
     open_version_string = None
-    bronze_url_snippet_patterns = [
-        ('sciencedirect.com/',
-         '<div class="OpenAccessLabel">open archive</div>'),
-        ('sciencedirect.com/',
-         r'<span[^>]*class="[^"]*pdf-download-label[^"]*"[^>]*>Download PDF</span>'),
-        ('sciencedirect.com/',
-         r'<span class="primary-cta-button-text|link-button-text">View\s*<strong>PDF</strong></span>'),
-        ('onlinelibrary.wiley.com',
-         '<div[^>]*class="doi-access"[^>]*>Free Access</div>'),
-        ('openedition.org', r'<span[^>]*id="img-freemium"[^>]*></span>'),
-        ('openedition.org', r'<span[^>]*id="img-openaccess"[^>]*></span>'),
-        # landing page html is invalid: <span class="accesstext"></span>Free</span>
-        ('microbiologyresearch.org',
-         r'<span class="accesstext">(?:</span>)?Free'),
-        ('journals.lww.com',
-         r'<li[^>]*id="[^"]*-article-indicators-free"[^>]*>'),
-        ('ashpublications.org', r'<i[^>]*class="[^"]*icon-availability_free'),
-        ('academic.oup.com', r'<i[^>]*class="[^"]*icon-availability_free'),
-        ('publications.aap.org', r'<i[^>]*class="[^"]*icon-availability_free'),
-        ('degruyter.com/', '<span>Free Access</span>'),
-        ('degruyter.com/', 'data-accessrestricted="false"'),
-        (
-        'practicalactionpublishing.com', r'<img [^>]*class="open-access-icon"'),
-        ("iucnredlist.org", r'<title>'),
-    ]
 
-    for (url_snippet, pattern) in bronze_url_snippet_patterns:
-        if url_snippet in resolved_url.lower() and re.findall(pattern,
-                                                                   page,
-                                                                   re.IGNORECASE | re.DOTALL):
-            open_version_string = "open (via free article)"
+    if _BRONZE_URL_SNIPPET_PATTERNS.search(resolved_url, page):
+        open_version_string = "open (via free article)"
 
     bronze_publisher_patterns = [
         (NewEnglandJournalOfMedicine(soup).is_publisher_specific_parser,
-         '<meta content="yes" name="evt-free"'),
-        (lambda: soup.find('meta', {'name': 'dc.Publisher', 'content': lambda x: 'university of chicago press' in x.lower()}),
-         r'<img[^>]*class="[^"]*accessIconLocation'),
+         _NEJM_FREE_RE),
+        (lambda: any('university of chicago press' in (meta.get('content') or '').lower()
+                     for meta in page_context(soup).metas_by('name', 'dc.Publisher')),
+         _CHICAGO_FREE_RE),
         (ElsevierBV(soup).is_publisher_specific_parser,
-         r'<span[^>]*class="[^"]*article-header__access[^"]*"[^>]*>Open Archive</span>'),
+         _ELSEVIER_OPEN_ARCHIVE_RE),
     ]
 
     for (publisher_func, pattern) in bronze_publisher_patterns:
-        if publisher_func() and re.findall(pattern, page, re.IGNORECASE | re.DOTALL):
+        if publisher_func() and pattern.search(page):
             open_version_string = "open (via free article)"
 
     # bronze_journal_patterns = [
@@ -95,68 +112,90 @@ def detect_bronze(soup, resolved_url):
     #         self.scraped_open_metadata_url = metadata_url
     #         self.open_version_source_string = "open (via free article)"
 
-    bronze_citation_pdf_patterns = [
-        r'^https?://www\.sciencedirect\.com/science/article/pii/S[0-9X]+/pdf(?:ft)?\?md5=[0-9a-f]+.*[0-9x]+-main.pdf$'
-    ]
-
-    citation_pdf_link = get_pdf_in_meta(page)
+    citation_pdf_link = get_pdf_in_meta(landing_page)
 
     if citation_pdf_link and citation_pdf_link.href:
-        for pattern in bronze_citation_pdf_patterns:
-            if re.findall(pattern, citation_pdf_link.href,
-                          re.IGNORECASE | re.DOTALL):
-                open_version_string = "open (via free article)"
+        if _BRONZE_CITATION_PDF_RE.search(citation_pdf_link.href):
+            open_version_string = "open (via free article)"
 
     return open_version_string
 
 
-def detect_hybrid(soup, license_search_substr, resolved_url):
+_HYBRID_URL_SNIPPET_PATTERNS = SnippetPatterns([
+    ('projecteuclid.org/', '<strong>Full-text: Open access</strong>'),
+    (
+    'sciencedirect.com/', '<div class="OpenAccessLabel">open access</div>'),
+    ('journals.ametsoc.org/',
+     r'src="/templates/jsp/_style2/_ams/images/access_free\.gif"'),
+    ('apsjournals.apsnet.org',
+     r'src="/products/aps/releasedAssets/images/open-access-icon\.png"'),
+    ('psychiatriapolska.pl', 'is an Open Access journal:'),
+    ('journals.lww.com', '<span class="[^>]*ejp-indicator--free'),
+    ('journals.lww.com',
+     r'<img[^>]*src="[^"]*/icon-access-open\.gif"[^>]*>'),
+    ('iospress.com',
+     r'<img[^>]*src="[^"]*/img/openaccess_icon.png[^"]*"[^>]*>'),
+    ('rti.org/', r'</svg>[^<]*Open Access[^<]*</span>'),
+    ('cambridge.org/',
+     r'<span[^>]*class="open-access"[^>]*>Open access</span>'),
+], re.IGNORECASE | re.DOTALL)
+
+_BACKUP_HYBRID_URL_SNIPPET_PATTERNS = SnippetPatterns([
+    ('degruyter.com/', '<span>Open Access</span>'),
+], re.IGNORECASE | re.DOTALL)
+
+_HYBRID_PUBLISHER_RES = {
+    # Informa UK Limited? Always returning true for now
+    'informa': re.compile("/accessOA.png", re.IGNORECASE | re.DOTALL),
+    'oxford': re.compile("<i class='icon-availability_open'", re.IGNORECASE | re.DOTALL),
+    'ieee': any_pattern([r'"isOpenAccess":true', r'"openAccessFlag":"yes"'], re.IGNORECASE | re.DOTALL),
+    'rsc': re.compile("/open_access_blue.png", re.IGNORECASE | re.DOTALL),
+    'cup': re.compile('<span class="icon access open-access cursorDefault">', re.IGNORECASE | re.DOTALL),
+    'wiley': re.compile(r'<div[^>]*class="doi-access"[^>]*>Open Access</div>', re.IGNORECASE | re.DOTALL),
+}
+
+# Look for more license-like patterns that make this a hybrid location.
+# Extract the specific license if present; the last pattern that matches
+# wins. Each pattern is listed with a literal all its matches contain.
+_LICENSE_PATTERNS = GatedPatterns([
+    ('creativecommons', r"(creativecommons.org/licenses/[a-z\-]+)"),
+    ('distributed under the terms ',
+     "distributed under the terms (.*) which permits"),
+    ('This is an open access article under the terms ',
+     "This is an open access article under the terms (.*) which permits"),
+    ('This is an open-access article distributed under the terms ',
+     "This is an open-access article distributed under the terms (.*), where it is permissible"),
+    ('This is an open access article published under ',
+     "This is an open access article published under (.*) which permits"),
+    ('<div class="openAccess-articleHeaderContainer',
+     '<div class="openAccess-articleHeaderContainer(.*?)</div>'),
+    ('this article is published under the creative commons ',
+     r'this article is published under the creative commons (.*) licence'),
+    ('This work is licensed under a Creative Commons ',
+     r'This work is licensed under a Creative Commons (.*), which permits '),
+])
+
+
+@traced('detect_hybrid')
+def detect_hybrid(soup, license_search_substr, resolved_url, page=None):
     from parseland_lib.publisher.parsers.cup import CUP
     from parseland_lib.publisher.parsers.ieee import IEEE
     from parseland_lib.publisher.parsers.oxford import Oxford
     from parseland_lib.publisher.parsers.rsc import RSC
     from parseland_lib.publisher.parsers.wiley import Wiley
 
-    page = str(soup)
+    page = str(page) if page is not None else str(soup)
     open_version_string, license = None, None
-    hybrid_url_snippet_patterns = [
-        ('projecteuclid.org/', '<strong>Full-text: Open access</strong>'),
-        (
-        'sciencedirect.com/', '<div class="OpenAccessLabel">open access</div>'),
-        ('journals.ametsoc.org/',
-         r'src="/templates/jsp/_style2/_ams/images/access_free\.gif"'),
-        ('apsjournals.apsnet.org',
-         r'src="/products/aps/releasedAssets/images/open-access-icon\.png"'),
-        ('psychiatriapolska.pl', 'is an Open Access journal:'),
-        ('journals.lww.com', '<span class="[^>]*ejp-indicator--free'),
-        ('journals.lww.com',
-         r'<img[^>]*src="[^"]*/icon-access-open\.gif"[^>]*>'),
-        ('iospress.com',
-         r'<img[^>]*src="[^"]*/img/openaccess_icon.png[^"]*"[^>]*>'),
-        ('rti.org/', r'</svg>[^<]*Open Access[^<]*</span>'),
-        ('cambridge.org/',
-         r'<span[^>]*class="open-access"[^>]*>Open access</span>'),
-    ]
-
-    for (url_snippet, pattern) in hybrid_url_snippet_patterns:
-        if url_snippet in resolved_url.lower() and re.findall(pattern,
-                                                                   page,
-                                                                   re.IGNORECASE | re.DOTALL):
-            open_version_string = "open (via page says Open Access)"
-            license = "unspecified-oa"
 
-    backup_hybrid_url_snippet_patterns = [
-        ('degruyter.com/', '<span>Open Access</span>'),
-    ]
+    if _HYBRID_URL_SNIPPET_PATTERNS.search(resolved_url, page):
+        open_version_string = "open (via page says Open Access)"
+        license = "unspecified-oa"
 
     # should probably defer to scraped license for all publishers, but don't want to rock the boat yet
     if not license:
-        for (url_snippet, pattern) in backup_hybrid_url_snippet_patterns:
-            if url_snippet in resolved_url.lower() and re.findall(pattern,
-                                                                       page,
-                                                                       re.IGNORECASE | re.DOTALL):
-                open_version_string = "open (via page says Open Access)"
-                license = "unspecified-oa"
+        if _BACKUP_HYBRID_URL_SNIPPET_PATTERNS.search(resolved_url, page):
+            open_version_string = "open (via page says Open Access)"
+            license = "unspecified-oa"
 
     # # try the license tab on T&F pages
     # # https://www.tandfonline.com/doi/full/10.1080/03057240.2018.1471391
@@ -185,54 +224,34 @@ def detect_hybrid(soup, license_search_substr, resolved_url):
 
     hybrid_publisher_patterns = [
         # Informa UK Limited? Always returning true for now
-        (lambda: True, "/accessOA.png"),
-        (Oxford(soup).is_publisher_specific_parser, "<i class='icon-availability_open'"),
-        (IEEE(soup).is_publisher_specific_parser,
-         r'"isOpenAccess":true'),
+        (lambda: True, _HYBRID_PUBLISHER_RES['informa']),
+        (Oxford(soup).is_publisher_specific_parser, _HYBRID_PUBLISHER_RES['oxford']),
         (IEEE(soup).is_publisher_specific_parser,
-         r'"openAccessFlag":"yes"'),
-        (RSC(soup).is_publisher_specific_parser, "/open_access_blue.png"),
+         _HYBRID_PUBLISHER_RES['ieee']),
+        (RSC(soup).is_publisher_specific_parser, _HYBRID_PUBLISHER_RES['rsc']),
         (CUP(soup).is_publisher_specific_parser,
-         '<span class="icon access open-access cursorDefault">'),
-        (Wiley(soup).is_publisher_specific_parser, r'<div[^>]*class="doi-access"[^>]*>Open Access</div>'),
+         _HYBRID_PUBLISHER_RES['cup']),
+        (Wiley(soup).is_publisher_specific_parser, _HYBRID_PUBLISHER_RES['wiley']),
     ]
 
     for (publisher_func, pattern) in hybrid_publisher_patterns:
-        if publisher_func() and re.findall(pattern, page,
-                                                            re.IGNORECASE | re.DOTALL):
+        if publisher_func() and pattern.search(page):
             open_version_string = "open (via page says Open Access)"
             license = "unspecified-oa"
 
-    # Look for more license-like patterns that make this a hybrid location.
-    # Extract the specific license if present.
-
-    license_patterns = [
-        r"(creativecommons.org/licenses/[a-z\-]+)",
-        "distributed under the terms (.*) which permits",
-        "This is an open access article under the terms (.*) which permits",
-        "This is an open-access article distributed under the terms (.*), where it is permissible",
-        "This is an open access article published under (.*) which permits",
-        '<div class="openAccess-articleHeaderContainer(.*?)</div>',
-        r'this article is published under the creative commons (.*) licence',
-        r'This work is licensed under a Creative Commons (.*), which permits ',
-    ]
-
-
-    if trust_publisher_license(resolved_url):
-        for pattern in license_patterns:
-            matches = re.findall(pattern, license_search_substr, re.IGNORECASE)
-            if matches:
-                normalized_license = find_normalized_license(matches[0])
-                license = normalized_license or 'unspecified-oa'
-                if normalized_license:
-                    open_version_string = 'open (via page says license)'
-                else:
-                    open_version_string = 'open (via page says Open Access)'
+    if trust_publisher_license(resolved_url) and (
+            match := _LICENSE_PATTERNS.last_match(license_search_substr)):
+        normalized_license = find_normalized_license(match.group(1))
+        license = normalized_license or 'unspecified-oa'
+        if normalized_license:
+            open_version_string = 'open (via page says license)'
+        else:
+            open_version_string = 'open (via page says Open Access)'
 
     return open_version_string, license
 
 def detect_sd_author_manuscript(soup):
-    if bool(soup.find(lambda tag: tag.text == 'View Open Manuscript')):
+    if text_index(soup).find_text('View Open Manuscript') is not None:
         return 'open (author manuscript)'
 
     return None
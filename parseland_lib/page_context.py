@@ -0,0 +1,190 @@
+import json
+
+# Attribute name under which the context is cached on the soup. Read it
+# through vars(): attribute access on a BeautifulSoup object falls back to
+# soup.find(<name>), which would walk the whole tree on a cache miss.
+_CONTEXT_ATTR = '_parseland_page_context'
+
+
+class PageContext:
+    """Per-page index of <meta>, <link>, <title>, <base> and JSON-LD blocks.
+
+    Built in a single walk of the soup so that head-metadata checks made by
+    every parser (canonical link, og:url, citation_* meta, ...) are dict
+    lookups instead of DOM scans. Tags are kept in document order, so
+    "first matching tag" has the same meaning as soup.find().
+    """
+
+    def __init__(self, soup):
+        self.soup = soup
+        self.metas = []
+        self.title = None
+        self.base = None
+        self._meta_by_attr = {'name': {}, 'property': {}}
+        self._meta_by_attr_ci = {'name': {}, 'property': {}}
+        self._links_by_rel = {}
+        self._script_tags = []
+        self._scripts = None
+        self._json_ld = None
+
+        for tag in soup.find_all(['meta', 'link', 'title', 'base', 'script']):
+            if tag.name == 'meta':
+                self._add_meta(tag)
+            elif tag.name == 'link':
+                for rel in tag.get('rel') or []:
+                    self._links_by_rel.setdefault(rel.lower(), []).append(tag)
+            elif tag.name == 'title':
+                if self.title is None:
+                    self.title = tag
+            elif tag.name == 'base':
+                if self.base is None and tag.get('href'):
+                    self.base = tag
+            else:
+                self._script_tags.append(tag)
+
+    def _add_meta(self, tag):
+        self.metas.append(tag)
+        for attr in ('name', 'property'):
+            value = tag.get(attr)
+            if not isinstance(value, str):
+                continue
+            self._meta_by_attr[attr].setdefault(value, []).append(tag)
+            self._meta_by_attr_ci[attr].setdefault(
+                value.lower(), []).append(tag)
+
+    def metas_by(self, attr, value, case_sensitive=True):
+        """All <meta> tags whose `attr` (name or property) equals value."""
+        if case_sensitive:
+            return self._meta_by_attr[attr].get(value, [])
+        return self._meta_by_attr_ci[attr].get(value.lower(), [])
+
+    def meta(self, name=None, property=None, case_sensitive=True):
+        """First <meta> with the given name or property, or None."""
+        if name is not None:
+            tags = self.metas_by('name', name, case_sensitive)
+        else:
+            tags = self.metas_by('property', property, case_sensitive)
+        return tags[0] if tags else None
+
+    def meta_content(self, name=None, property=None, case_sensitive=True):
+        tag = self.meta(name, property, case_sensitive)
+        return tag.get('content') if tag is not None else None
+
+    def og(self, key):
+        """og:* meta looked up by property first, then by name, the way
+        publishers inconsistently emit it."""
+        return self.meta(property=key) or self.meta(name=key)
+
+    def links(self, rel):
+        return self._links_by_rel.get(rel.lower(), [])
+
+    def link(self, rel):
+        tags = self.links(rel)
+        return tags[0] if tags else None
+
+    @property
+    def canonical_href(self):
+        tag = self.link('canonical')
+        return tag.get('href') if tag is not None else None
+
+    @property
+    def title_text(self):
+        return self.title.text if self.title is not None else None
+
+    @property
+    def scripts(self):
+        """The page's ScriptIndex, built on first use."""
+        if self._scripts is None:
+            self._scripts = ScriptIndex(self._script_tags)
+        return self._scripts
+
+    def json_ld(self):
+        """Decoded JSON-LD blocks, decoded on first use; blocks that fail to
+        decode are skipped."""
+        if self._json_ld is None:
+            self._json_ld = []
+            for _, text in self.scripts.of_type('application/ld+json',
+                                                case_sensitive=False):
+                try:
+                    self._json_ld.append(self.scripts.json(text))
+                except (TypeError, ValueError):
+                    continue
+        return self._json_ld
+
+
+class ScriptIndex:
+    """The <script> elements of a page, read once.
+
+    Parsers used to walk the tree for <script> tags, or serialize the whole
+    page and regex-search it, for every payload they read, and json.loads
+    the same blobs again in authors_found() and parse(). The index holds
+    each script's tag and text in document order, classified by type and
+    id as it is built; scripts containing a marker (a global assignment like
+    "xplGlobal.document.metadata", a key like '"pdfUrl":"') are found once
+    per marker, and json() decodes each distinct payload once.
+
+    Decoded payloads are shared by every caller on the page: do not mutate
+    them.
+    """
+
+    def __init__(self, tags):
+        self.tags = tags
+        self.texts = [tag.string or tag.get_text() for tag in tags]
+        self._by_type = {}
+        self._by_type_ci = {}
+        self._by_id = {}
+        self._containing = {}
+        self._decoded = {}
+        for pos, tag in enumerate(tags):
+            script_type = tag.get('type')
+            if isinstance(script_type, str):
+                self._by_type.setdefault(script_type, []).append(pos)
+                self._by_type_ci.setdefault(
+                    script_type.lower(), []).append(pos)
+            script_id = tag.get('id')
+            if isinstance(script_id, str):
+                self._by_id.setdefault(script_id, pos)
+
+    def __iter__(self):
+        """(tag, text) for every script, in document order."""
+        return zip(self.tags, self.texts)
+
+    def _entries(self, positions):
+        return [(self.tags[pos], self.texts[pos]) for pos in positions]
+
+    def of_type(self, script_type, case_sensitive=True):
+        """(tag, text) for the scripts whose type attribute is script_type."""
+        if case_sensitive:
+            return self._entries(self._by_type.get(script_type, ()))
+        return self._entries(self._by_type_ci.get(script_type.lower(), ()))
+
+    def with_id(self, script_id):
+        """(tag, text) of the first script with the id, or None."""
+        pos = self._by_id.get(script_id)
+        return None if pos is None else (self.tags[pos], self.texts[pos])
+
+    def containing(self, marker):
+        """(tag, text) for the scripts whose text contains marker."""
+        positions = self._containing.get(marker)
+        if positions is None:
+            positions = self._containing[marker] = [
+                pos for pos, text in enumerate(self.texts) if marker in text]
+        return self._entries(positions)
+
+    def json(self, raw):
+        """json.loads(raw), decoded once per distinct payload. Decode errors
+        are raised on every call."""
+        try:
+            return self._decoded[raw]
+        except KeyError:
+            value = self._decoded[raw] = json.loads(raw)
+            return value
+
+
+def page_context(soup):
+    """Return the PageContext cached on soup, building it on first use."""
+    context = vars(soup).get(_CONTEXT_ATTR)
+    if context is None:
+        context = PageContext(soup)
+        setattr(soup, _CONTEXT_ATTR, context)
+    return context
@@ -0,0 +1,46 @@
+import functools
+
+# Attribute under which the memo is kept on the soup (see page_context for
+# why it is read through vars()).
+_MEMO_ATTR = '_parseland_page_memo'
+
+
+def page_memo(soup):
+    """The dict of derived values memoized for soup, created on first use.
+
+    Keys are (parser class, method name) for memoized_on_page methods;
+    other callers should key by something of their own that cannot collide.
+    """
+    memo = vars(soup).get(_MEMO_ATTR)
+    if memo is None:
+        memo = {}
+        setattr(soup, _MEMO_ATTR, memo)
+    return memo
+
+
+def memoized_on_page(method):
+    """Evaluate a no-argument parser method once per page.
+
+    The value is kept in page_memo(self.soup) under (type(self), method
+    name), so every instance of the parser built for the same soup -
+    authors_found(), parse(), detect_bronze / detect_hybrid - gets the first
+    result. A call that raises is not memoized.
+
+    The method must depend on self.soup alone, and callers must not mutate
+    the value it returns. Like page_context, it sees the page as it was on
+    the first call, before parsers edit the soup in place.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        memo = page_memo(self.soup)
+        key = (type(self), name)
+        try:
+            return memo[key]
+        except KeyError:
+            value = memo[key] = method(self)
+            return value
+
+    wrapper.memoized_on_page = True
+    return wrapper
@@ -1,10 +1,24 @@
+import os
+import time
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from typing import Any, Optional
 from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
 
+from parseland_lib.budget import ParseBudget
+from parseland_lib.elements import PageRecord
 from parseland_lib.legacy_parse_utils.fulltext import parse_publisher_fulltext_location
 from parseland_lib.legacy_parse_utils.fulltext import parse_repo_fulltext_location
+from parseland_lib.page_context import page_context
 from parseland_lib.parse_publisher_authors_abstract import get_authors_and_abstract
+from parseland_lib.pretrim import guard_page
+from parseland_lib.trace import ParseTrace, stage
 
 
 def _is_doi_router_url(url):
@@ -25,8 +39,9 @@ def _sniff_publisher_url(soup):
     None if neither is present or both still point at doi.org (some publishers
     set canonical to the DOI link).
     """
+    context = page_context(soup)
     try:
-        canonical = soup.find("link", attrs={"rel": "canonical"})
+        canonical = context.link("canonical")
         if canonical and canonical.get("href"):
             href = canonical.get("href").strip()
             if href and not _is_doi_router_url(href):
@@ -34,7 +49,7 @@ def _sniff_publisher_url(soup):
     except Exception:
         pass
     try:
-        og = soup.find("meta", attrs={"property": "og:url"})
+        og = context.meta(property="og:url")
         if og and og.get("content"):
             href = og.get("content").strip()
             if href and not _is_doi_router_url(href):
@@ -44,8 +59,45 @@ def _sniff_publisher_url(soup):
     return None
 
 
-def parse_page(lp_content, namespace, resolved_url=None):
-    soup = BeautifulSoup(lp_content, parser='lxml', features='lxml')
+def parse_page(lp_content, namespace, resolved_url=None, budget=None,
+               trace=None):
+    """Parse one landing page into the parseland response dict; see
+    parse_page_record."""
+    return parse_page_record(lp_content, namespace, resolved_url,
+                             budget, trace).to_dict()
+
+
+def parse_page_record(lp_content, namespace, resolved_url=None, budget=None,
+                      trace=None):
+    """Parse one landing page into a PageRecord.
+
+    budget is a time limit in seconds for the whole parse (None: no limit).
+    Stages that would start after it ran out are skipped, and the response
+    then lists them in "truncated_stages"; see ParseBudget. Oversized pages
+    are pre-trimmed first (see parseland_lib.pretrim); a page still over the
+    size limit after that is cut, listed as "page_tail".
+
+    trace, a ParseTrace, is filled with the wall / CPU time of every stage
+    and parser of the parse (see parseland_lib.trace).
+    """
+    if trace is None:
+        return _parse_page_record(lp_content, namespace, resolved_url, budget)
+    with trace.activate(), trace.stage('parse_page'):
+        return _parse_page_record(lp_content, namespace, resolved_url, budget)
+
+
+def _parse_page_record(lp_content, namespace, resolved_url, budget):
+    budget = ParseBudget(budget)
+    with stage('pretrim'):
+        lp_content, cut = guard_page(lp_content)
+    if cut:
+        budget.truncate('page_tail')
+    with stage('soup'):
+        soup = BeautifulSoup(lp_content, parser='lxml', features='lxml')
+    # Index head metadata once; every parser and fulltext helper reads it
+    # from here instead of re-walking the tree.
+    with stage('page_context'):
+        page_context(soup)
 
     # If the caller passed a bare doi.org link, the relative-PDF-URL joiner
     # downstream produces broken hosts like https://doi.org/doi/pdf/... .
@@ -56,65 +108,24 @@ def parse_page(lp_content, namespace, resolved_url=None):
         if sniffed:
             resolved_url = sniffed
 
-    raw_authors_and_abstract = get_authors_and_abstract(soup, namespace)
-    if namespace == "doi":
-        fulltext_location = parse_publisher_fulltext_location(soup, resolved_url)
-    elif namespace == "pmh":
-        fulltext_location = parse_repo_fulltext_location(soup, resolved_url)
-    else:
-        fulltext_location = None
+    with stage('authors_and_abstract'):
+        raw_authors_and_abstract = get_authors_and_abstract(
+            soup, namespace, budget)
+    with stage('fulltext_location'):
+        if namespace == "doi":
+            fulltext_location = parse_publisher_fulltext_location(
+                soup, resolved_url, budget)
+        elif namespace == "pmh":
+            fulltext_location = parse_repo_fulltext_location(
+                soup, resolved_url, budget)
+        else:
+            fulltext_location = None
 
-    if raw_authors_and_abstract is None:
-        authors_and_abstract = {'authors': [], 'abstract': None}
-    elif isinstance(raw_authors_and_abstract, list):
-        authors_and_abstract = {'authors': raw_authors_and_abstract, 'abstract': None}
-    else:
-        authors_and_abstract = raw_authors_and_abstract
-
-    if authors_and_abstract and authors_and_abstract.get('authors'):
-        authors = []
-        for author in authors_and_abstract['authors']:
-            # handle both dict and object formats
-            name = author.get("name", "") if isinstance(author, dict) else getattr(author, "name", "")
-            affiliations = (
-                [{"name": aff} for aff in author.get("affiliations", [])]
-                if isinstance(author, dict)
-                else [{"name": aff} for aff in getattr(author, "affiliations", [])]
-            )
-            is_corresponding = (
-                author.get("is_corresponding", None)
-                if isinstance(author, dict)
-                else getattr(author, "is_corresponding", None)
-            )
-            authors.append({
-                "name": name,
-                "affiliations": affiliations,
-                "is_corresponding": is_corresponding,
-            })
-        authors_and_abstract['authors'] = authors
-
-    # Merge into a single response
-    response = authors_and_abstract
-    response.update(fulltext_location or {})
-
-    urls = []
-    if response.get("pdf_url"):
-        urls.append({"url": response["pdf_url"], "content_type": "pdf"})
-    if response.get("resolved_url"):
-        urls.append({"url": response["resolved_url"], "content_type": "html"})
-
-    # reorder the response
-    ordered_response = {
-        "authors": response.get("authors", []),
-        "urls": urls,
-        "license": response.get("license"),
-        "version": response.get("version"),
-        "abstract": response.get("abstract"),
-    }
-
-    return ordered_response
+    return PageRecord.from_parsed(
+        raw_authors_and_abstract, fulltext_location, budget.truncated_stages)
 
 def find_pdf_link(lp_content, namespace, resolved_url):
+    lp_content, _ = guard_page(lp_content)
     soup = BeautifulSoup(lp_content, parser='lxml', features='lxml')
     if namespace == "doi":
         fulltext_location = parse_publisher_fulltext_location(soup, resolved_url)
@@ -123,3 +134,138 @@ def find_pdf_link(lp_content, namespace, resolved_url):
     else:
         fulltext_location = None
     return fulltext_location.get("pdf_url") if fulltext_location else None
+
+
+@dataclass
+class PageResult:
+    key: Any
+    parsed: Optional[dict]
+    error: Optional[str] = None
+    # ParseTrace.to_dict() of the parse, when parse_pages(trace=True)
+    trace: Optional[dict] = None
+    # True if the result came from a ResultCache instead of a parse
+    cached: bool = False
+
+
+def format_error(exc):
+    """A parse error as PageResult.error and the eval run files record it:
+    the exception, then its traceback from the call that raised, three
+    frames deep. Call it where exc was caught: the catching frame is left
+    out, so the text does not depend on which caller ran the parse."""
+    frames = exc.__traceback__.tb_next if exc.__traceback__ else None
+    return (f'{type(exc).__name__}: {exc}\n'
+            f'{"".join(traceback.format_exception(type(exc), exc, frames, limit=3))}')
+
+
+def _parse_one(item, budget=None, trace=False):
+    key, lp_content, namespace, resolved_url = item
+    page_trace = ParseTrace() if trace else None
+    try:
+        result = PageResult(key, parse_page(lp_content, namespace,
+                                            resolved_url, budget, page_trace))
+    except Exception as e:
+        result = PageResult(key, None, format_error(e))
+    if page_trace is not None:
+        result.trace = page_trace.to_dict()
+    return result
+
+
+def _parse_chunk(chunk, budget=None, trace=False):
+    return [_parse_one(item, budget, trace) for item in chunk]
+
+
+def _warm_worker():
+    # Build the publisher dispatch index (and with it import every parser)
+    # once per worker, before the first page arrives.
+    import parseland_lib.publisher.dispatch  # noqa: F401
+
+
+def _chunks(items, chunksize):
+    items = iter(items)
+    while chunk := list(islice(items, chunksize)):
+        yield chunk
+
+
+def _drain(pool, chunk_fn, pending, chunks, ordered, deadline):
+    while pending:
+        timeout = None if deadline is None else max(0, deadline - time.monotonic())
+        finished, _ = wait([pending[0]] if ordered else pending,
+                           timeout=timeout, return_when=FIRST_COMPLETED)
+        if not finished:
+            # out of time; the caller drops the chunks still pending
+            return
+        done = [future for future in pending if future in finished]
+        for future in done:
+            pending.remove(future)
+        for future in done:
+            for chunk in islice(chunks, 1):
+                pending.append(pool.submit(chunk_fn, chunk))
+            yield from future.result()
+
+
+def parse_pool(workers=None, mp_context=None):
+    """A process pool for parse_pages(pool=...), to keep across calls.
+
+    mp_context is a multiprocessing context; a threaded process should pass
+    a 'forkserver' or 'spawn' one, since forking it can copy locks held by
+    its other threads.
+    """
+    return ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                               mp_context=mp_context,
+                               initializer=_warm_worker)
+
+
+def _pool_map(chunk_fn, items, workers=None, chunksize=16, ordered=True,
+              pool=None, deadline=None):
+    """Run chunk_fn over chunks of items in a pool of worker processes and
+    yield what it returns for each chunk, item by item; see parse_pages."""
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(items, chunksize)
+
+    if pool is None and workers == 1:
+        for chunk in chunks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            yield from chunk_fn(chunk)
+        return
+
+    own_pool = pool is None
+    if own_pool:
+        pool = parse_pool(workers)
+    pending = deque(pool.submit(chunk_fn, chunk)
+                    for chunk in islice(chunks, workers * 2))
+    try:
+        yield from _drain(pool, chunk_fn, pending, chunks, ordered, deadline)
+    finally:
+        # the caller stopped early or time ran out: drop the chunks not
+        # started yet
+        for future in pending:
+            future.cancel()
+        if own_pool:
+            pool.shutdown(wait=deadline is None, cancel_futures=True)
+
+
+def parse_pages(pages, workers=None, chunksize=16, ordered=True, budget=None,
+                trace=False, pool=None, deadline=None):
+    """Parse many landing pages in a pool of worker processes.
+
+    pages is an iterable of (key, lp_content, namespace, resolved_url)
+    tuples; key is anything picklable that identifies the page to the
+    caller. Yields one PageResult per page. A page that raises is reported
+    in PageResult.error (see format_error) and does not stop the batch.
+
+    Pages are sent to the workers chunksize at a time and at most two chunks
+    per worker are in flight, so pages can be a lazy stream of any length.
+    With ordered=False results are yielded as chunks finish rather than in
+    input order. workers=None uses every CPU; workers=1 parses in this
+    process without a pool. budget is passed on to parse_page for each page;
+    with trace=True each PageResult carries the page's ParseTrace as a dict.
+
+    pool is a parse_pool() to run in instead of a pool started for this
+    call; workers then only sets how many chunks are kept in flight.
+    deadline is a time.monotonic() value: once it passes, no more results
+    are yielded and the pages not yet parsed are dropped (chunks already
+    running in a caller's pool run to completion there).
+    """
+    return _pool_map(partial(_parse_chunk, budget=budget, trace=trace),
+                     pages, workers, chunksize, ordered, pool, deadline)
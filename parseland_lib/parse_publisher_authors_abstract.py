@@ -1,87 +1,206 @@
+from parseland_lib.budget import ParseBudget
+from parseland_lib.publisher.dispatch import candidate_parsers
 from parseland_lib.publisher.parsers.generic import GenericPublisherParser
 from parseland_lib.publisher.parsers.parser import PublisherParser
 from parseland_lib.repository.parsers.parser import RepositoryParser
+from parseland_lib.trace import parser_stage, stage
 
+_NOT_PARSED = object()
 
-def get_authors_and_abstract(soup, namespace):
-    both_conditions_parsers = []
-    authors_found_parsers = []
 
-    def has_affs(parsed):
-        def author_affiliations(author):
-            if isinstance(author, dict):
-                return author.get('affiliations')
-            return getattr(author, 'affiliations', None)
-
-        if isinstance(parsed, list):
-            if not parsed:
-                return False
-            return any(author_affiliations(author) for author in parsed)
-        elif isinstance(parsed, dict):
-            if not parsed.get('authors'):
-                return False
-            return any(author_affiliations(author) for author in parsed['authors'])
-        return False
-
-    def has_content(parsed):
-        if isinstance(parsed, list):
-            return bool(parsed)
-        if isinstance(parsed, dict):
-            return bool(parsed.get('authors') or parsed.get('abstract'))
-        return False
-
-    def has_authors(parsed):
-        if isinstance(parsed, list):
-            return bool(parsed)
-        if isinstance(parsed, dict):
-            return bool(parsed.get('authors'))
-        return False
+class LazyParse:
+    """A parser that passed its cheap checks, with parse() deferred until the
+    selection logic asks for the result. The result (or failure) is memoized,
+    so each parser parses at most once per page."""
 
-    if namespace == "doi":
-        for cls in PublisherParser.__subclasses__():
+    def __init__(self, parser):
+        self.parser = parser
+        self._parsed = _NOT_PARSED
+        self.failed = False
+
+    @property
+    def parsed(self):
+        return self._parsed is not _NOT_PARSED
+
+    def result(self):
+        if self._parsed is _NOT_PARSED:
+            try:
+                with parser_stage(self.parser, 'parse'):
+                    self._parsed = self.parser.parse()
+            except Exception:
+                self._parsed = None
+                self.failed = True
+        return self._parsed
+
+
+def has_affs(parsed):
+    def author_affiliations(author):
+        if isinstance(author, dict):
+            return author.get('affiliations')
+        return getattr(author, 'affiliations', None)
+
+    if isinstance(parsed, list):
+        if not parsed:
+            return False
+        return any(author_affiliations(author) for author in parsed)
+    elif isinstance(parsed, dict):
+        if not parsed.get('authors'):
+            return False
+        return any(author_affiliations(author) for author in parsed['authors'])
+    return False
+
+
+def has_content(parsed):
+    if isinstance(parsed, list):
+        return bool(parsed)
+    if isinstance(parsed, dict):
+        return bool(parsed.get('authors') or parsed.get('abstract'))
+    return False
+
+
+def has_authors(parsed):
+    if isinstance(parsed, list):
+        return bool(parsed)
+    if isinstance(parsed, dict):
+        return bool(parsed.get('authors'))
+    return False
+
+
+def _first_result(lazy_parsers, predicate, wants=lambda parser: True,
+                  budget=None, stage='publisher_parsers'):
+    """Parse lazy_parsers in order until one satisfies predicate. `wants`
+    filters on the parser alone, so unwanted parsers are never parsed.
+    Parsing stops, with no result, once the budget has run out."""
+    for lazy in lazy_parsers:
+        if not wants(lazy.parser):
+            continue
+        if not lazy.parsed and budget and not budget.allows(stage):
+            return None
+        parsed = lazy.result()
+        if not lazy.failed and predicate(parsed):
+            return lazy
+    return None
+
+
+def _decisive_publisher_result(both_conditions_parsers, budget=None,
+                               stage='publisher_parsers'):
+    if winner := _first_result(both_conditions_parsers, has_affs,
+                               budget=budget, stage=stage):
+        return winner
+    return _first_result(
+        both_conditions_parsers,
+        has_authors,
+        wants=lambda parser: getattr(
+            parser, "prefer_publisher_authors_over_generic", False),
+        budget=budget,
+        stage=stage,
+    )
+
+
+def _classify_publisher_parsers(classes, soup, classified, budget=None,
+                                stage='publisher_parsers'):
+    """Split classes into (both_conditions, authors_found) LazyParse lists
+    using only authors_found() / is_publisher_specific_parser(). classified
+    memoizes per class so a class is checked at most once per page. Classes
+    not yet checked when the budget runs out are left out."""
+    both_conditions, authors_found = [], []
+    for cls in classes:
+        if cls not in classified:
+            if budget and not budget.allows(stage):
+                break
+            classified[cls] = None
             parser = cls(soup)
             try:
-                if parser.authors_found():
-                    parsed = parser.parse()
-                    if parser.is_publisher_specific_parser():
-                        both_conditions_parsers.append((parser, parsed))
-                    else:
-                        authors_found_parsers.append((parser, parsed))
+                with parser_stage(parser, 'authors_found'):
+                    found = parser.authors_found()
+                if found:
+                    with parser_stage(parser, 'is_publisher_specific_parser'):
+                        is_specific = parser.is_publisher_specific_parser()
+                    classified[cls] = (LazyParse(parser), is_specific)
             except Exception:
-                continue
+                pass
+        if classified[cls] is None:
+            continue
+        lazy, is_specific = classified[cls]
+        if is_specific:
+            both_conditions.append(lazy)
+        else:
+            authors_found.append(lazy)
+    return both_conditions, authors_found
+
+
+def get_authors_and_abstract(soup, namespace, budget=None):
+    budget = budget or ParseBudget()
+    budget_stage = ('repository_parsers' if namespace == 'pmh'
+                    else 'publisher_parsers')
+    both_conditions_parsers = []
+    authors_found_parsers = []
+
+    if namespace == "doi":
+        # Route by canonical host / og:url / og:site_name / citation_publisher
+        # / DOI prefix first. A publisher-specific candidate with affiliations
+        # settles the page once no parser ahead of it in subclass order
+        # (candidate or not: some parsers have no hints) would take it;
+        # otherwise run the full scan, reusing whatever was computed.
+        classified = {}
+        with stage('publisher_dispatch'):
+            candidates = candidate_parsers(soup)
+            if candidates:
+                candidate_both, _ = _classify_publisher_parsers(
+                    candidates, soup, classified, budget, 'publisher_dispatch')
+                if winner := _first_result(candidate_both, has_affs,
+                                           budget=budget,
+                                           stage='publisher_dispatch'):
+                    subclasses = PublisherParser.__subclasses__()
+                    ahead, _ = _classify_publisher_parsers(
+                        subclasses[:subclasses.index(type(winner.parser)) + 1],
+                        soup, classified, budget, 'publisher_dispatch')
+                    winner = _first_result(
+                        ahead, has_affs, budget=budget,
+                        stage='publisher_dispatch') or winner
+                    return winner.result()
+        with stage('publisher_parsers'):
+            both_conditions_parsers, authors_found_parsers = \
+                _classify_publisher_parsers(
+                    PublisherParser.__subclasses__(), soup, classified, budget)
     elif namespace == "pmh":
         for cls in RepositoryParser.__subclasses__():
+            if not budget.allows(budget_stage):
+                break
             parser = cls(soup)
             try:
-                if parser.is_correct_parser() and parser.authors_found():
-                    parsed = parser.parse()
-                    authors_found_parsers.append((parser, parsed))
+                with parser_stage(parser, 'authors_found'):
+                    found = parser.is_correct_parser() and \
+                        parser.authors_found()
+                if found:
+                    authors_found_parsers.append(LazyParse(parser))
             except Exception:
                 continue
 
+    # Each step below only parses what it has to: publisher-specific parsers
+    # first, non-specific ones (e.g. Springer, whose authors_found() is always
+    # true) only when no publisher-specific parser produced affiliations.
+    with stage('parser_selection'):
+        winner = (
+            _decisive_publisher_result(both_conditions_parsers, budget,
+                                       budget_stage)
+            or _first_result(authors_found_parsers, has_affs, budget=budget,
+                             stage=budget_stage)
+            or _first_result(both_conditions_parsers, has_content,
+                             budget=budget, stage=budget_stage)
+        )
+    if winner:
+        return winner.result()
 
-    for parser, parsed in both_conditions_parsers:
-        if has_affs(parsed):
-            return parsed
-
-    for parser, parsed in both_conditions_parsers:
-        if (
-            getattr(parser, "prefer_publisher_authors_over_generic", False)
-            and has_authors(parsed)
-        ):
-            return parsed
-
-    for parser, parsed in authors_found_parsers:
-        if has_affs(parsed):
-            return parsed
-
-    for parser, parsed in both_conditions_parsers:
-        if has_content(parsed):
-            return parsed
-
-    generic_parser = GenericPublisherParser(soup)
-    if generic_parser.authors_found():
-        print(f"Authors found for generic parser")
-        return generic_parser.parse()
+    if not budget.allows('generic_parser'):
+        return None
+    with stage('generic_parser'):
+        generic_parser = GenericPublisherParser(soup)
+        with parser_stage(generic_parser, 'authors_found'):
+            found = generic_parser.authors_found()
+        if found:
+            print(f"Authors found for generic parser")
+            with parser_stage(generic_parser, 'parse'):
+                return generic_parser.parse()
 
     return None
@@ -0,0 +1,317 @@
+"""Byte-level pre-trim of oversized landing pages, before tree construction.
+
+Some harvested pages are several MB of inline JSON, SVG, CSS, base64 images
+and reference lists, none of which any parser reads. On pages over
+PRETRIM_MIN_BYTES a single streaming pass over the raw bytes drops:
+
+- the bodies of inline <script> elements over MAX_INLINE_SCRIPT_BYTES whose
+  opening tag and body carry none of the registered script signatures,
+- the bodies of <style> and <svg> elements,
+- base64 payloads of data: URIs,
+- the contents of reference lists (id / class "references", "ref-list",
+  "reference-list" or "bibliography"), matched to their closing tag by
+  counting same-name tags.
+
+A self-closing <svg .../> or <script src="..."/> has no body, as lxml reads
+it. A script, style, svg or reference list that does not close before
+</body> or the end of the page (an unbalanced tag, a missing closing tag),
+or runs past MAX_DROPPED_SECTION_BYTES, is kept as it is: its bytes are held
+back until it closes.
+
+Opening and closing tags are always kept, so selectors still see the same
+elements. Comments are passed through untouched. Smaller pages are not
+touched at all.
+
+The script signature registry is KEEP_SCRIPT_SIGNATURES, the keys of the
+javascript PDF link patterns in legacy_parse_utils.pdf, and the
+script_signatures declared by every PublisherParser / RepositoryParser: a
+parser that reads a script payload declares a string that identifies it
+(a variable name, a type attribute, an id) and those scripts survive.
+"""
+import io
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+
+# Pages smaller than this are parsed as they are.
+PRETRIM_MIN_BYTES = 1024 * 1024
+MAX_INLINE_SCRIPT_BYTES = 64 * 1024
+# Elements and reference lists longer than this are kept: held back until
+# they close, they are only dropped once known to be balanced.
+MAX_DROPPED_SECTION_BYTES = 4 * 1024 * 1024
+# After trimming, pages are cut at this size.
+MAX_PAGE_BYTES = 16 * 1024 * 1024
+_CHUNK_BYTES = 1024 * 1024
+
+# Script payloads read outside of the parser classes and the javascript PDF
+# patterns: JSON-LD (PageContext) and the fulltext / ScienceDirect lookups
+# of legacy_parse_utils.
+KEEP_SCRIPT_SIGNATURES = (
+    'application/ld+json',
+    'pdfPath',
+    '"pii"',
+    'downloadpdf.aspx',
+    'aop-cambridge-core',
+    '/document/doi/',
+)
+
+_OPEN_RE = re.compile(
+    rb'<!--'
+    rb'|<(script|style|svg)\b[^>]*>'
+    rb'|<(section|div|ol|ul)\b[^>]*?\b(?:id|class)\s*=\s*"(?:[^"]*\s)?'
+    rb'(?:references|ref-list|reference-list|bibliography)(?:\s[^"]*)?"[^>]*>',
+    re.I)
+_DATA_URI_RE = re.compile(rb'(data:[\w/+.-]*;base64,)[A-Za-z0-9+/=]{256,}', re.I)
+_COMMENT_END = b'-->'
+# bytes at the end of the buffer that could be a closing tag cut by the
+# chunk boundary: '</script', the longest one looked for
+_END_TAG_BYTES = len(b'</script')
+
+
+@lru_cache(maxsize=1)
+def script_signature_re():
+    from parseland_lib.legacy_parse_utils.pdf import _JAVASCRIPT_PDF_PATTERNS
+    from parseland_lib.publisher.parsers.parser import PublisherParser
+    from parseland_lib.repository.parsers.parser import RepositoryParser
+
+    signatures = set(KEEP_SCRIPT_SIGNATURES)
+    signatures.update(key for key, _ in _JAVASCRIPT_PDF_PATTERNS)
+    for base in (PublisherParser, RepositoryParser):
+        for cls in base.__subclasses__():
+            signatures.update(cls.script_signatures)
+    return re.compile(b'|'.join(
+        re.escape(signature.encode()) for signature in sorted(signatures)), re.I)
+
+
+class PreTrimmer:
+    """Streaming pre-trim: feed() raw page bytes in chunks of any size and
+    get the trimmed bytes back as they become final; close() flushes."""
+
+    def __init__(self):
+        self._signatures = script_signature_re()
+        self._buf = b''
+        self._state = self._text
+        # open <script> tag while a script is collected, None for style / svg
+        self._script_tag = None
+        self._end_re = None
+        self._nested_re = None
+        self._depth = 0
+        # element or reference list bytes held until it closes
+        self._held = []
+        self._held_bytes = 0
+
+    def feed(self, chunk):
+        self._buf += chunk
+        return self._run(final=False)
+
+    def close(self):
+        out = self._run(final=True) + self._buf
+        self._buf = b''
+        return out
+
+    def _run(self, final):
+        out = []
+        while self._state(out, final):
+            pass
+        return b''.join(out)
+
+    def _text(self, out, final):
+        # Only scan up to the last '<', or the '>' closing it: a tag cut by
+        # the chunk boundary is scanned again with the next chunk.
+        end = len(self._buf) if final else self._buf.rfind(b'<')
+        if not final and (gt := self._buf.rfind(b'>')) > end:
+            end = gt + 1
+        if end <= 0:
+            return False
+        match = _OPEN_RE.search(self._buf, 0, end)
+        if match is None:
+            out.append(_DATA_URI_RE.sub(rb'\1', self._buf[:end]))
+            self._buf = self._buf[end:]
+            return False
+        out.append(_DATA_URI_RE.sub(rb'\1', self._buf[:match.end()]))
+        self._buf = self._buf[match.end():]
+        if match.group(1):
+            if match.group().endswith(b'/>'):
+                # lxml closes <svg .../> and <script src="..."/> right there
+                return True
+            name = match.group(1).lower()
+            self._end_re = re.compile(
+                re.escape(b'</' + name) + rb'\b|(</body\b)', re.I)
+            self._script_tag = match.group() if name == b'script' else None
+            self._hold_start(self._element)
+        elif match.group(2):
+            name = re.escape(match.group(2).lower())
+            self._nested_re = re.compile(
+                rb'<(/?)' + name + rb'\b|(</body\b)', re.I)
+            self._depth = 1
+            self._hold_start(self._nested)
+        else:
+            self._state = self._comment
+        return True
+
+    def _hold_start(self, state):
+        self._held = []
+        self._held_bytes = 0
+        self._state = state
+
+    def _hold(self, out, end):
+        # Hold the buffer up to end. Past MAX_DROPPED_SECTION_BYTES the
+        # element is kept: what was held goes out, and the rest of it is
+        # passed through as it comes (_held is None).
+        if self._held is None:
+            out.append(self._buf[:end])
+        else:
+            self._held.append(self._buf[:end])
+            self._held_bytes += end
+            if self._held_bytes > MAX_DROPPED_SECTION_BYTES:
+                out.append(b''.join(self._held))
+                self._held = None
+        self._buf = self._buf[end:]
+
+    def _release(self, out, end, keep):
+        # end the element at end of the buffer, keeping or dropping it; an
+        # element over the size limit is always kept
+        if self._held is None:
+            out.append(self._buf[:end])
+        elif keep or self._held_bytes + end > MAX_DROPPED_SECTION_BYTES:
+            out.append(b''.join(self._held) + self._buf[:end])
+        self._held = []
+        self._buf = self._buf[end:]
+        self._state = self._text
+        return True
+
+    def _element(self, out, final):
+        # body of a <script>, <style> or <svg>
+        match = self._end_re.search(self._buf)
+        if match and match.end() == len(self._buf) and not final:
+            match = None  # '</svg' at the very end could still be '</svgx'
+        if match is None:
+            if final:
+                # it never closes
+                return self._release(out, len(self._buf), keep=True)
+            self._hold(out, max(len(self._buf) - _END_TAG_BYTES, 0))
+            return False
+        if match.group(1):
+            # </body> inside the element: it never closes
+            return self._release(out, match.start(), keep=True)
+        keep = False
+        if self._script_tag is not None and self._held is not None:
+            body = b''.join(self._held) + self._buf[:match.start()]
+            keep = (len(body) <= MAX_INLINE_SCRIPT_BYTES
+                    or self._signatures.search(self._script_tag)
+                    or self._signatures.search(body))
+        return self._release(out, match.start(), keep)
+
+    def _nested(self, out, final):
+        pos = 0
+        for match in self._nested_re.finditer(self._buf):
+            if match.end() == len(self._buf) and not final:
+                break  # '<div' at the very end could still be '<divx'
+            if match.group(2):
+                # </body> inside the list: it never closes
+                return self._release(out, match.start(), keep=True)
+            self._depth += -1 if match.group(1) else 1
+            if self._depth == 0:
+                return self._release(out, match.start(), keep=False)
+            pos = match.end()
+        if final:
+            return self._release(out, len(self._buf), keep=True)
+        self._hold(out, max(pos, len(self._buf) - 16))
+        return False
+
+    def _comment(self, out, final):
+        i = self._buf.find(_COMMENT_END)
+        if i < 0:
+            cut = len(self._buf) if final else \
+                max(len(self._buf) - len(_COMMENT_END) + 1, 0)
+            out.append(self._buf[:cut])
+            self._buf = self._buf[cut:]
+            return False
+        out.append(self._buf[:i + len(_COMMENT_END)])
+        self._buf = self._buf[i + len(_COMMENT_END):]
+        self._state = self._text
+        return True
+
+
+def pretrim(chunks):
+    """Trim a page given as an iterable of bytes chunks; yields the trimmed
+    bytes."""
+    trimmer = PreTrimmer()
+    for chunk in chunks:
+        if out := trimmer.feed(chunk):
+            yield out
+    if out := trimmer.close():
+        yield out
+
+
+@dataclass(frozen=True)
+class GuardedPage:
+    """Page bytes that have been through guard_chunks(); guard_page() hands
+    them on as they are. cut is True if the tail of the page was dropped."""
+    content: bytes
+    cut: bool = False
+
+
+def _is_ascii_compatible(data):
+    # the byte-level patterns assume an ASCII-compatible encoding
+    return not (data.startswith((b'\xff\xfe', b'\xfe\xff'))
+                or b'\x00' in data[:1024])
+
+
+def _trim(chunks, max_bytes):
+    """Pre-trim chunks and cut the output at max_bytes; (bytes, cut). Stops
+    consuming chunks once the cut is made."""
+    out, size, cut = io.BytesIO(), 0, False
+    for piece in pretrim(chunks):
+        if size + len(piece) > max_bytes:
+            out.write(piece[:max_bytes - size])
+            cut = True
+            break
+        out.write(piece)
+        size += len(piece)
+    return out.getvalue(), cut
+
+
+def guard_chunks(chunks, max_bytes=None):
+    """guard_page() for a page arriving as an iterable of bytes chunks, e.g.
+    a download being inflated. Pages under PRETRIM_MIN_BYTES are buffered
+    and returned whole; larger ones are trimmed as the chunks arrive, and no
+    chunk past the cut is read. Returns a GuardedPage."""
+    max_bytes = MAX_PAGE_BYTES if max_bytes is None else max_bytes
+    chunks = iter(chunks)
+    head = io.BytesIO()
+    for chunk in chunks:
+        head.write(chunk)
+        if head.tell() >= PRETRIM_MIN_BYTES:
+            break
+    else:
+        return GuardedPage(head.getvalue())
+
+    head = head.getvalue()
+    if not _is_ascii_compatible(head):
+        return GuardedPage(b''.join(chain([head], chunks)))
+    return GuardedPage(*_trim(chain([head], chunks), max_bytes))
+
+
+def guard_page(lp_content, max_bytes=None):
+    """Pre-trim lp_content (bytes or str) if it is oversized and cut it at
+    max_bytes. Returns (content, cut): content has the type it came in as,
+    cut is True if the tail of the page was dropped. A GuardedPage is
+    returned as it is."""
+    if isinstance(lp_content, GuardedPage):
+        return lp_content.content, lp_content.cut
+    max_bytes = MAX_PAGE_BYTES if max_bytes is None else max_bytes
+    is_str = isinstance(lp_content, str)
+    if len(lp_content) < PRETRIM_MIN_BYTES:
+        return lp_content, False
+    data = lp_content.encode('utf-8', 'surrogatepass') if is_str else lp_content
+    if not _is_ascii_compatible(data):
+        return lp_content, False
+
+    view = memoryview(data)
+    data, cut = _trim((bytes(view[i:i + _CHUNK_BYTES])
+                       for i in range(0, len(data), _CHUNK_BYTES)), max_bytes)
+    if is_str:
+        return data.decode('utf-8', 'ignore'), cut
+    return data, cut
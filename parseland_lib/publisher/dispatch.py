@@ -0,0 +1,105 @@
+"""Route a landing page to candidate PublisherParser subclasses.
+
+Every PublisherParser declares cheap routing hints (dispatch_hosts,
+dispatch_site_names, dispatch_publishers, dispatch_doi_prefixes). The index
+below is built once at import time; per page we read the canonical link,
+og:url, og:site_name, citation_publisher and citation DOI from the page's
+PageContext and look the parsers up by those values, so the cost of routing
+does not grow with the number of parsers.
+"""
+import re
+from urllib.parse import urlparse
+
+from parseland_lib.page_context import page_context
+from parseland_lib.publisher.parsers.parser import PublisherParser
+
+DOI_PREFIX_RE = re.compile(r'\b(10\.\d{4,9})/')
+
+_DOI_META_NAMES = ['citation_doi', 'dc.identifier', 'prism.doi', 'bepress_citation_doi']
+_PUBLISHER_META_NAMES = ['citation_publisher', 'dc.publisher']
+
+
+class DispatchIndex:
+    def __init__(self, parser_classes):
+        self.parser_classes = list(parser_classes)
+        self._order = {cls: i for i, cls in enumerate(self.parser_classes)}
+        self._by_host = {}
+        self._by_doi_prefix = {}
+        self._site_names = []
+        self._publishers = []
+
+        for cls in self.parser_classes:
+            for host in cls.dispatch_hosts:
+                self._by_host.setdefault(host.lower(), []).append(cls)
+            for prefix in cls.dispatch_doi_prefixes:
+                self._by_doi_prefix.setdefault(prefix, []).append(cls)
+            for site_name in cls.dispatch_site_names:
+                self._site_names.append((site_name.lower(), cls))
+            for publisher in cls.dispatch_publishers:
+                self._publishers.append((publisher.lower(), cls))
+
+    def _classes_for_host(self, host):
+        classes = []
+        parts = host.lower().split('.')
+        for i in range(len(parts) - 1):
+            classes += self._by_host.get('.'.join(parts[i:]), [])
+        return classes
+
+    def candidates(self, signals):
+        """Return the parser classes matching the page signals, in subclass
+        order. An empty list means the page must fall back to a full scan."""
+        found = set()
+        for host in signals['hosts']:
+            found.update(self._classes_for_host(host))
+        for prefix in signals['doi_prefixes']:
+            found.update(self._by_doi_prefix.get(prefix, []))
+        for value in signals['site_names']:
+            found.update(cls for hint, cls in self._site_names if hint in value)
+        for value in signals['publishers']:
+            found.update(cls for hint, cls in self._publishers if hint in value)
+        return sorted(found, key=lambda cls: self._order.get(cls, len(self._order)))
+
+
+def _host(url):
+    try:
+        return urlparse(url.strip()).hostname
+    except ValueError:
+        return None
+
+
+def _meta_contents(context, keys):
+    for key in keys:
+        for attr in ('property', 'name'):
+            for tag in context.metas_by(attr, key, case_sensitive=False):
+                if content := tag.get('content'):
+                    yield content
+
+
+def page_signals(soup):
+    """Collect the routing signals from the page's PageContext."""
+    context = page_context(soup)
+    signals = {'hosts': set(), 'site_names': [], 'publishers': [],
+               'doi_prefixes': set()}
+    for tag in context.links('canonical'):
+        if tag.get('href') and (host := _host(tag['href'])):
+            signals['hosts'].add(host)
+    for content in _meta_contents(context, ['og:url']):
+        if host := _host(content):
+            signals['hosts'].add(host)
+    signals['site_names'] = [
+        content.lower() for content in _meta_contents(context, ['og:site_name'])]
+    signals['publishers'] = [
+        content.lower()
+        for content in _meta_contents(context, _PUBLISHER_META_NAMES)]
+    for content in _meta_contents(context, _DOI_META_NAMES):
+        signals['doi_prefixes'].update(DOI_PREFIX_RE.findall(content))
+    return signals
+
+
+# Built once: importing the parsers package registers every
+# PublisherParser subclass shipped with the library.
+DISPATCH_INDEX = DispatchIndex(PublisherParser.__subclasses__())
+
+
+def candidate_parsers(soup):
+    return DISPATCH_INDEX.candidates(page_signals(soup))
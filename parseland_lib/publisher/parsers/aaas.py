@@ -8,6 +8,8 @@ class AAAS(PublisherParser):
         return bool(self.soup.select('div[property=author]'))
 
     parser_name = "aaas"
+    dispatch_hosts = ("science.org",)
+    dispatch_doi_prefixes = ("10.1126",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_canonical_link('science.org')
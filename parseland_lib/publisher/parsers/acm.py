@@ -3,6 +3,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class AssociationForComputingMachinery(PublisherParser):
     parser_name = "association_for_computing_machineinery"
+    dispatch_hosts = ("acm.org",)
+    dispatch_doi_prefixes = ("10.1145",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('acm.org')
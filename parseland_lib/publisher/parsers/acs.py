@@ -9,6 +9,8 @@ from parseland_lib.publisher.parsers.utils import EMAIL_RE
 
 class ACS(PublisherParser):
     parser_name = "acs"
+    dispatch_hosts = ("acs.org",)
+    dispatch_doi_prefixes = ("10.1021",)
 
     def is_publisher_specific_parser(self):
         if "Request forbidden by administrative rules" in str(self.soup):
@@ -6,6 +6,9 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class AIPPublishing(PublisherParser):
     parser_name = "aip_publishing"
+    dispatch_hosts = ("aip.scitation.org",)
+    dispatch_publishers = ("AIP Publishing",)
+    dispatch_doi_prefixes = ("10.1063",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url("aip.scitation.org") or self.substr_in_citation_publisher('AIP Publishing')
@@ -4,6 +4,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class AMA(PublisherParser):
     parser_name = "american_medical_association"
+    dispatch_hosts = ("jamanetwork.com",)
+    dispatch_doi_prefixes = ("10.1001",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_canonical_link('jamanetwork.com')
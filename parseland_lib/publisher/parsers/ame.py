@@ -6,6 +6,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class AMEPublishing(PublisherParser):
     parser_name = "ame_publishing"
+    dispatch_publishers = ("AME ",)
+    dispatch_doi_prefixes = ("10.21037",)
 
     def is_publisher_specific_parser(self):
         return self.substr_in_citation_publisher('AME ')
@@ -3,9 +3,12 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class AmericanMathematicalSociety(PublisherParser):
     parser_name = "american_mathematical_society"
+    dispatch_hosts = ("ams.org",)
+    dispatch_publishers = ("American Mathematical Society",)
+    dispatch_doi_prefixes = ("10.1090",)
 
     def is_publisher_specific_parser(self):
-        if og_title := self.soup.select_one('meta[property="og:title"]'):
+        if og_title := self.context.meta(property="og:title"):
             return 'American Mathematical Society' in og_title['content']
         return False
 
@@ -4,6 +4,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class AOM(PublisherParser):
     parser_name = "academy_of_management"
+    dispatch_hosts = ("aom.org",)
+    dispatch_doi_prefixes = ("10.5465",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url("aom.org")
@@ -4,6 +4,7 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class AOM(PublisherParser):
     parser_name = "academy_of_management"
+    dispatch_hosts = ("aom.org",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url("aom.org")
@@ -4,6 +4,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class APS(PublisherParser):
     parser_name = "aps"
+    dispatch_hosts = ("journals.aps.org", "journals.physiology.org")
+    dispatch_doi_prefixes = ("10.1103", "10.1152")
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url(
@@ -7,6 +7,7 @@ from parseland_lib.publisher.parsers.utils import name_in_text
 
 class APSPhysics(PublisherParser):
     parser_name = "aps_physics"
+    dispatch_hosts = ("physics.aps.org",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('physics.aps.org')
@@ -4,6 +4,7 @@ from parseland_lib.publisher.parsers.utils import strip_seq
 
 class AcousticalSocietyOfAmerica(PublisherParser):
     parser_name = "acoustical_society_of_america"
+    dispatch_hosts = ("asa.scitation.org",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('asa.scitation')
@@ -4,6 +4,8 @@ from parseland_lib.publisher.parsers.utils import strip_suffix
 
 class AmericanSocietyOfCivilEngineers(PublisherParser):
     parser_name = "american_society_of_civil_engineers"
+    dispatch_hosts = ("ascelibrary.org",)
+    dispatch_doi_prefixes = ("10.1061",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('ascelibrary.org')
@@ -4,6 +4,8 @@ from parseland_lib.publisher.parsers.utils import is_h_tag
 
 class AmericanSocietyOfHematology(PublisherParser):
     parser_name = "american_society_of_hematology"
+    dispatch_hosts = ("ashpublications.org",)
+    dispatch_doi_prefixes = ("10.1182",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('ashpublications.org')
@@ -3,6 +3,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class ASM(PublisherParser):
     parser_name = "american_science_for_microbiology"
+    dispatch_hosts = ("journals.asm.org",)
+    dispatch_doi_prefixes = ("10.1128",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('journals.asm.org')
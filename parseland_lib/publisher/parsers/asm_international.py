@@ -6,6 +6,7 @@ from parseland_lib.publisher.parsers.utils import is_h_tag
 
 class ASMInternational(PublisherParser):
     parser_name = "asm_international"
+    dispatch_hosts = ("astm.org", "asme.org")
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('astm.org') or self.domain_in_meta_og_url('asme.org')
@@ -5,6 +5,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class BenthamScience(PublisherParser):
     parser_name = "bentham_science"
+    dispatch_hosts = ("benthamscience.com", "eurekaselect.com")
+    dispatch_doi_prefixes = ("10.2174",)
 
     def is_publisher_specific_parser(self):
         return len(self.soup.select('a[href*="bentham"]')) >= 5
@@ -1,4 +1,3 @@
-import json
 import re
 
 from parseland_lib.elements import Author, Affiliation, AuthorAffiliations
@@ -8,6 +7,9 @@ from parseland_lib.publisher.parsers.utils import name_in_text
 
 class BMJ(PublisherParser):
     parser_name = "bmj"
+    dispatch_hosts = ("bmj.com",)
+    dispatch_doi_prefixes = ("10.1136",)
+    script_signatures = ("window.dataLayer.push",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url("bmj.com")
@@ -152,15 +154,13 @@ class BMJ(PublisherParser):
         return names
 
     def get_data_layer_content(self):
-        for script in self.soup.find_all("script"):
-            text = script.string or script.get_text("\n")
-            if "window.dataLayer.push" not in text:
-                continue
+        scripts = self.context.scripts
+        for _, text in scripts.containing("window.dataLayer.push"):
             match = re.search(r"window\.dataLayer\.push\((\{.*?\})\);", text, re.S)
             if not match:
                 continue
             try:
-                data = json.loads(match.group(1))
+                data = scripts.json(match.group(1))
             except Exception:
                 continue
             content = data.get("content")
@@ -3,6 +3,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class Brill(PublisherParser):
     parser_name = "brill"
+    dispatch_hosts = ("brill.com",)
+    dispatch_doi_prefixes = ("10.1163",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('brill.com')
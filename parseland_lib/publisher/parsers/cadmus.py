@@ -3,9 +3,13 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class CadmusPress(PublisherParser):
     parser_name = "cadmus_press"
+    dispatch_hosts = ("arvojournals.org",)
+    dispatch_publishers = (
+        "The Association for Research in Vision and Ophthalmology",
+    )
 
     def is_publisher_specific_parser(self):
-        if publisher_meta := self.soup.select_one('meta[name=citation_publisher]'):
+        if publisher_meta := self.context.meta(name="citation_publisher"):
             return 'The Association for Research in Vision and Ophthalmology' in publisher_meta['content']
         return False
 
@@ -3,6 +3,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class CAIRN(PublisherParser):
     parser_name = "cairn"
+    dispatch_hosts = ("cairn.info",)
+    dispatch_doi_prefixes = ("10.3917",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('cairn.info')
@@ -5,6 +5,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class CSJ(PublisherParser):
     parser_name = "chemical_society_of_japan"
+    dispatch_hosts = ("journal.csj.jp",)
+    dispatch_doi_prefixes = ("10.1246",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('journal.csj.jp')
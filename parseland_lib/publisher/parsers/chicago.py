@@ -3,11 +3,14 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class Chicago(PublisherParser):
     parser_name = "university_of_chicago"
+    dispatch_hosts = ("journals.uchicago.edu",)
+    dispatch_publishers = ("Theory of Computing",)
+    dispatch_doi_prefixes = ("10.1086",)
 
     def is_publisher_specific_parser(self):
         if self.domain_in_meta_og_url('journals.uchicago.edu'):
             return True
-        if meta_tag := self.soup.select_one('meta[name=citation_publisher]'):
+        if meta_tag := self.context.meta(name="citation_publisher"):
             return 'Theory of Computing' in meta_tag['content']
 
     def authors_found(self):
@@ -8,10 +8,12 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class Copernicus(PublisherParser):
     parser_name = "copernicus"
+    dispatch_hosts = ("copernicus.org",)
+    dispatch_doi_prefixes = ("10.5194",)
     chars_to_ignore = ["*", "†", "‡", "§"]
 
     def is_publisher_specific_parser(self):
-        link = self.soup.find("link", {"rel": "preconnect"})
+        link = self.context.link("preconnect")
         if link and "copernicus.org" in link.get("href"):
             return True
 
@@ -10,6 +10,8 @@ from parseland_lib.publisher.parsers.utils import strip_prefix, cleanup_raw_name
 
 class CSIRO(PublisherParser):
     parser_name = "csiro_publishing"
+    dispatch_hosts = ("publish.csiro.au",)
+    dispatch_doi_prefixes = ("10.1071",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('publish.csiro.au')
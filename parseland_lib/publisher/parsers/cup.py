@@ -7,6 +7,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 class CUP(PublisherParser):
     parser_name = "cambridge university press"
     prefer_publisher_authors_over_generic = True
+    dispatch_hosts = ("cambridge.org",)
+    dispatch_doi_prefixes = ("10.1017",)
     _NON_AUTHOR_ROLE_PREFIXES = (
         "appendix by",
         "general editor",
@@ -5,6 +5,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class DeGruyter(PublisherParser):
     parser_name = "de_gruyter"
+    dispatch_hosts = ("degruyter.com", "degruyterbrill.com")
+    dispatch_doi_prefixes = ("10.1515",)
 
     def is_publisher_specific_parser(self):
         return (
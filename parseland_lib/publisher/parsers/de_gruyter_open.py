@@ -1,10 +1,12 @@
-import json
-
 from parseland_lib.publisher.parsers.parser import PublisherParser
 
 
 class DeGruyterOpen(PublisherParser):
     parser_name = "de_gruyter_open"
+    dispatch_hosts = ("sciendo.com",)
+    dispatch_publishers = ("Sciendo",)
+    script_signatures = ("__NEXT_DATA__",)
+    dispatch_doi_prefixes = ("10.2478",)
 
     def is_publisher_specific_parser(self):
         return bool(self.soup.find(lambda
@@ -14,8 +16,8 @@ class DeGruyterOpen(PublisherParser):
         return bool(self.soup.select('div[class*=author-popup]'))
 
     def parse_json(self):
-        if json_tag := self.soup.select_one('script#__NEXT_DATA__'):
-            return json.loads(json_tag.text)
+        if script := self.context.scripts.with_id('__NEXT_DATA__'):
+            return self.context.scripts.json(script[1])
         return {}
 
     @staticmethod
@@ -23,14 +25,15 @@ class DeGruyterOpen(PublisherParser):
         authors = []
         contrib_group = j['props']['pageProps']['product']['articleData'][
             'contribGroup']
+        aff_list = contrib_group['aff']
+        if isinstance(aff_list, dict):
+            aff_list = [aff_list]
         for author in contrib_group['contrib']:
             name = f'{author["name"]["given-names"]} {author["name"]["surname"]}'
             is_corresponding = 'y' in (author.get('corresp', '') or '')
             affs = []
             aff_id = author['xref']['rid']
-            if isinstance(contrib_group['aff'], dict):
-                contrib_group['aff'] = [contrib_group['aff']]
-            for aff in contrib_group['aff']:
+            for aff in aff_list:
                 if aff['id'] == aff_id:
                     if isinstance(aff['institution'], list):
                         desc = ''
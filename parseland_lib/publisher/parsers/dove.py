@@ -7,6 +7,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class Dove(PublisherParser):
     parser_name = "dove_press"
+    dispatch_hosts = ("dovepress.com",)
+    dispatch_doi_prefixes = ("10.2147",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('dovepress.com')
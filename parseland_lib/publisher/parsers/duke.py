@@ -3,6 +3,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class Duke(PublisherParser):
     parser_name = 'duke'
+    dispatch_hosts = ("dukeupress.edu",)
+    dispatch_doi_prefixes = ("10.1215",)
 
     def authors_found(self):
         return False
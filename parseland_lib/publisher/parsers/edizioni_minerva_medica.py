@@ -7,6 +7,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class EMM(PublisherParser):
     parser_name = "edizioni_minerva_medica"
+    dispatch_hosts = ("minervamedica.it",)
+    dispatch_doi_prefixes = ("10.23736",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_canonical_link('minervamedica.it')
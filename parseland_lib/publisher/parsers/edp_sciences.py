@@ -3,11 +3,11 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class EDPSciences(PublisherParser):
     parser_name = "edp_sciences"
+    dispatch_publishers = ("EDP Sciences",)
+    dispatch_doi_prefixes = ("10.1051",)
 
     def is_publisher_specific_parser(self):
-        for meta_citation_url in self.soup.find_all(
-            "meta", {"name": "citation_publisher"}
-        ):
+        for meta_citation_url in self.context.metas_by("name", "citation_publisher"):
             if "EDP Sciences" in meta_citation_url.get("content", ""):
                 return True
 
@@ -3,10 +3,12 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class EgyptianKnowledgeBank(PublisherParser):
     parser_name = "egyptian_knowledge_bank"
+    dispatch_hosts = ("journals.ekb.eg",)
+    dispatch_doi_prefixes = ("10.21608",)
 
     def is_publisher_specific_parser(self):
-        for meta_citation_url in self.soup.find_all(
-            "meta", {"name": "citation_abstract_html_url"}
+        for meta_citation_url in self.context.metas_by(
+            "name", "citation_abstract_html_url"
         ):
             if "journals.ekb.eg" in meta_citation_url.get("content", ""):
                 return True
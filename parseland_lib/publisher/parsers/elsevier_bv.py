@@ -9,6 +9,16 @@ from parseland_lib.publisher.parsers.utils import is_h_tag
 
 class ElsevierBV(PublisherParser):
     parser_name = "Elsevier BV"
+    dispatch_hosts = (
+        "sciencedirect.com",
+        "elsevier.com",
+        "cell.com",
+        "thelancet.com",
+    )
+    dispatch_site_names = ("sciencedirect", "elsevier")
+    dispatch_publishers = ("sciencedirect", "elsevier")
+    dispatch_doi_prefixes = ("10.1016",)
+    script_signatures = ("__PRELOADED_STATE__", "application/json")
 
     def is_publisher_specific_parser(self):
         # OneTrust is used by several publishers, so it cannot identify
@@ -37,22 +47,24 @@ class ElsevierBV(PublisherParser):
         if self.domain_in_meta_og_url("sciencedirect.com"):
             return True
 
-        for selector in (
-            'meta[name="citation_publisher"]',
-            'meta[name="dc.publisher"]',
-            'meta[property="og:site_name"]',
-            'meta[name="og:site_name"]',
-            'meta[property="og:url"]',
-            'meta[name="og:url"]',
-            'link[rel="canonical"]',
+        for attr, value in (
+            ("name", "citation_publisher"),
+            ("name", "dc.publisher"),
+            ("property", "og:site_name"),
+            ("name", "og:site_name"),
+            ("property", "og:url"),
+            ("name", "og:url"),
         ):
-            for tag in self.soup.select(selector):
+            for tag in self.context.metas_by(attr, value):
                 if self._is_elsevier_value(tag.get("content") or tag.get("href")):
                     return True
+        for tag in self.context.links("canonical"):
+            if self._is_elsevier_value(tag.get("href")):
+                return True
 
         # Some Elsevier Health / EM-Consulte migrated pages expose no canonical
         # or publisher meta, but do carry Elsevier-specific app metadata.
-        for tag in self.soup.find_all("meta"):
+        for tag in self.context.metas:
             if self._is_elsevier_value(tag.get("content")):
                 return True
 
@@ -306,7 +318,6 @@ class ElsevierBV(PublisherParser):
               correspondences: {cor1: {...}, ...}
         """
         try:
-            import json
             import re
             data = None
 
@@ -316,14 +327,12 @@ class ElsevierBV(PublisherParser):
             # slice, but regressed the full 10K current-Goldie gate because
             # those payloads can carry mismatched affiliation/correspondence
             # refs. Re-enable only behind DOI-grounded evidence.
-            for script in self.soup.find_all("script"):
-                text = script.string or script.text or ""
-                if "__PRELOADED_STATE__" not in text:
-                    continue
+            scripts = self.context.scripts
+            for _, text in scripts.containing("__PRELOADED_STATE__"):
                 m = re.search(r"__PRELOADED_STATE__\s*=\s*(\{.*?\})\s*;?\s*$", text, re.DOTALL)
                 if not m:
                     continue
-                data = json.loads(m.group(1))
+                data = scripts.json(m.group(1))
                 break
             if not isinstance(data, dict):
                 return None
@@ -851,12 +860,11 @@ class ElsevierBV(PublisherParser):
 
     def _science_direct_author_json_payloads(self):
         try:
-            import json
             import re
 
+            scripts = self.context.scripts
             application_json_payloads = []
-            for script in self.soup.find_all("script"):
-                text = script.string or script.text or ""
+            for script, text in scripts:
                 if "__PRELOADED_STATE__" in text:
                     m = re.search(
                         r"__PRELOADED_STATE__\s*=\s*(\{.*?\})\s*;?\s*$",
@@ -865,7 +873,7 @@ class ElsevierBV(PublisherParser):
                     )
                     if not m:
                         continue
-                    yield json.loads(m.group(1))
+                    yield scripts.json(m.group(1))
                     return
                 script_type = (script.get("type") or "").lower()
                 if script_type != "application/json":
@@ -873,7 +881,7 @@ class ElsevierBV(PublisherParser):
                 stripped = text.strip()
                 if not stripped:
                     continue
-                data = json.loads(stripped)
+                data = scripts.json(stripped)
                 if isinstance(data, dict):
                     application_json_payloads.append(data)
             for data in application_json_payloads:
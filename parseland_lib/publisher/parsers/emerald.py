@@ -4,6 +4,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class Emerald(PublisherParser):
     parser_name = "emerald"
+    dispatch_hosts = ("emerald.com",)
+    dispatch_doi_prefixes = ("10.1108",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_canonical_link("emerald.com")
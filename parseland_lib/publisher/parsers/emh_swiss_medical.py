@@ -7,6 +7,7 @@ from parseland_lib.publisher.parsers.utils import strip_prefix, cleanup_raw_name
 
 class EMHSwissMedical(PublisherParser):
     parser_name = "emh_swiss_medical"
+    dispatch_hosts = ("bullmed.ch",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('bullmed.ch')
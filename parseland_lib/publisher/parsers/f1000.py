@@ -5,6 +5,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class F1000(PublisherParser):
     parser_name = "f1000_taylor"
+    dispatch_hosts = ("f1000research.com",)
+    dispatch_doi_prefixes = ("10.12688",)
 
     def is_publisher_specific_parser(self):
         return self.substr_in_citation_journal_title('f1000')
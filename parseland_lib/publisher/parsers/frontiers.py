@@ -6,6 +6,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class Frontiers(PublisherParser):
     parser_name = "frontiers"
+    dispatch_hosts = ("frontiersin.org",)
+    dispatch_doi_prefixes = ("10.3389",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url("frontiersin.org")
@@ -1,11 +1,12 @@
-import json
-
 from parseland_lib.publisher.parsers.parser import PublisherParser
 from parseland_lib.publisher.parsers.utils import remove_parents
 
 
 class Hindawi(PublisherParser):
     parser_name = "hindawi"
+    dispatch_hosts = ("hindawi.com",)
+    dispatch_doi_prefixes = ("10.1155",)
+    script_signatures = ("__NEXT_DATA__",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_canonical_link('hindawi.com')
@@ -51,17 +52,17 @@ class Hindawi(PublisherParser):
 
     def parse_json(self):
         authors = []
-        data_tag = self.soup.select_one('script#__NEXT_DATA__')
-        j = json.loads(data_tag.text)
+        _, data = self.context.scripts.with_id('__NEXT_DATA__')
+        j = self.context.scripts.json(data)
         article_obj = j['props']['pageProps']['article']
-        article_obj['affiliations'] = sorted(article_obj['affiliations'], key=lambda obj: obj['affId'])
+        affiliations = sorted(article_obj['affiliations'], key=lambda obj: obj['affId'])
         for author in article_obj['authors']:
             auth = {'name': f'{author["givenName"]} {author["surName"]}',
                     'affiliations': [],
                     'is_corresponding': bool(author.get('email'))}
             for aff_sup in author['affSup']:
                 auth['affiliations'].append(self.format_aff(
-                    article_obj['affiliations'][aff_sup['affId'] - 1]))
+                    affiliations[aff_sup['affId'] - 1]))
 
             authors.append(auth)
         return {'authors': authors, 'abstract': article_obj['abstract']}
@@ -1,12 +1,15 @@
-import json
 import re
 
 from parseland_lib.elements import AuthorAffiliations
+from parseland_lib.page_memo import memoized_on_page
 from parseland_lib.publisher.parsers.parser import PublisherParser
 
 
 class IEEE(PublisherParser):
     parser_name = "IEEE"
+    dispatch_hosts = ("ieee.org",)
+    dispatch_doi_prefixes = ("10.1109",)
+    script_signatures = ("xplGlobal.document.metadata",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_canonical_link("ieee.org")
@@ -32,15 +35,19 @@ class IEEE(PublisherParser):
 
         return {"authors": authors, "abstract": self.get_abstract()}
 
+    @memoized_on_page
     def get_json_data(self):
-        raw_script = re.search("xplGlobal.document.metadata=.*", str(self.soup))
+        raw_script = None
+        for _, text in self.context.scripts.containing("xplGlobal.document.metadata"):
+            if raw_script := re.search("xplGlobal.document.metadata=.*", text):
+                break
 
         if raw_script:
             raw_json = raw_script.group()
             trimmed_json = raw_json.replace("xplGlobal.document.metadata=", "").replace(
                 "};", "}"
             )
-            json_data = json.loads(trimmed_json)
+            json_data = self.context.scripts.json(trimmed_json)
         else:
             json_data = None
         return json_data
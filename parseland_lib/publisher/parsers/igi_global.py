@@ -6,6 +6,8 @@ from parseland_lib.publisher.parsers.utils import strip_prefix
 
 class IGIGlobal(PublisherParser):
     parser_name = "igi_global"
+    dispatch_hosts = ("igi-global.com",)
+    dispatch_doi_prefixes = ("10.4018",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('igi-global.com')
@@ -3,6 +3,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class InderScience(PublisherParser):
     parser_name = "inderscience"
+    dispatch_hosts = ("inderscienceonline.com",)
+    dispatch_doi_prefixes = ("10.1504",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('inderscienceonline.com')
@@ -8,6 +8,8 @@ from parseland_lib.publisher.parsers.utils import email_matches_name
 
 class IOP(PublisherParser):
     parser_name = "IOP"
+    dispatch_hosts = ("iopscience.iop.org",)
+    dispatch_doi_prefixes = ("10.1088",)
 
     def is_publisher_specific_parser(self):
         if "iopscience.iop.org" in str(
@@ -21,10 +23,10 @@ class IOP(PublisherParser):
             or self.domain_in_meta_og_url("iopscience.iop.org")
         ):
             return True
-        for stylesheet in self.soup.find_all("link", {"rel": "stylesheet"}):
+        for stylesheet in self.context.links("stylesheet"):
             if "static.iopscience.com" in stylesheet.get("href", ""):
                 return True
-        if tag := self.soup.find("meta", {"name": "citation_pdf_url"}):
+        if tag := self.context.meta(name="citation_pdf_url"):
             return "iopscience.iop.org" in tag.get("content", "")
         return False
 
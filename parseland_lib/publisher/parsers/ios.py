@@ -4,9 +4,11 @@ from parseland_lib.publisher.parsers.utils import split_name, name_in_text
 
 class IOSPress(PublisherParser):
     parser_name = "ios_press"
+    dispatch_publishers = ("IOS Press",)
+    dispatch_doi_prefixes = ("10.3233",)
 
     def is_publisher_specific_parser(self):
-        if publisher_name_tag := self.soup.select_one('meta[name=citation_publisher]'):
+        if publisher_name_tag := self.context.meta(name="citation_publisher"):
             return 'ios press' in publisher_name_tag['content'].lower()
         return False
 
@@ -3,6 +3,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class JCI(PublisherParser):
     parser_name = "jci"
+    dispatch_hosts = ("insight.jci.org",)
+    dispatch_doi_prefixes = ("10.1172",)
 
     def is_publisher_specific_parser(self):
         return self.substr_in_citation_journal_title('JCI Insight')
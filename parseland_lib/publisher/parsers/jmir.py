@@ -8,6 +8,8 @@ from parseland_lib.publisher.parsers.utils import names_match
 
 class JMIR(PublisherParser):
     parser_name = "jmir"
+    dispatch_hosts = ("jmir.org",)
+    dispatch_doi_prefixes = ("10.2196",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('jmir.org')
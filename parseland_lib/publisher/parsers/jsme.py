@@ -4,6 +4,7 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class JSME(PublisherParser):
     parser_name = "japan_society_of_mechanical_engineers"
+    dispatch_hosts = ("jstage.jst.go.jp",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('www.jstage')
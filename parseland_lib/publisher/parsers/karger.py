@@ -8,6 +8,8 @@ from parseland_lib.publisher.parsers.utils import is_h_tag
 
 class Karger(PublisherParser):
     parser_name = "karger"
+    dispatch_hosts = ("karger.com",)
+    dispatch_doi_prefixes = ("10.1159",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('karger.com')
@@ -10,6 +10,9 @@ from parseland_lib.publisher.parsers.utils import name_in_text, split_name, stri
 
 class Lippincott(PublisherParser):
     parser_name = "lippincott"
+    dispatch_hosts = ("journals.lww.com",)
+    dispatch_publishers = ("American Society of Anesthesiologists",)
+    dispatch_doi_prefixes = ("10.1097",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url(
@@ -3,6 +3,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class MaryAnnLiebert(PublisherParser):
     parser_name = "mary_ann_liebert"
+    dispatch_hosts = ("liebertpub.com",)
+    dispatch_doi_prefixes = ("10.1089",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('liebertpub.com')
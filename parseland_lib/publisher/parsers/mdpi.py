@@ -4,6 +4,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class MDPI(PublisherParser):
     parser_name = "mdpi"
+    dispatch_hosts = ("mdpi.com",)
+    dispatch_doi_prefixes = ("10.3390",)
     chars_to_ignore = ["*", "†", "‡", "§"]
 
     def is_publisher_specific_parser(self):
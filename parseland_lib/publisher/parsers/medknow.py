@@ -8,6 +8,9 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class MedKnow(PublisherParser):
     parser_name = "medknow"
+    dispatch_hosts = ("medknow.com",)
+    dispatch_doi_prefixes = ("10.4103",)
+    script_signatures = ("medknow.com/ss/ftr.js",)
 
     def is_publisher_specific_parser(self):
         script_url = "https://www.medknow.com/ss/ftr.js"
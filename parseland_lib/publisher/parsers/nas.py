@@ -3,6 +3,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class NationalAcademyOfScience(PublisherParser):
     parser_name = "national_academy_of_science"
+    dispatch_hosts = ("pnas.org",)
+    dispatch_doi_prefixes = ("10.1073",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('pnas.org')
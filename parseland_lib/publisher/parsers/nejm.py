@@ -12,6 +12,8 @@ from parseland_lib.publisher.parsers.utils import strip_seqs, strip_prefix
 
 class NewEnglandJournalOfMedicine(PublisherParser):
     parser_name = 'nejm'
+    dispatch_hosts = ("nejm.org",)
+    dispatch_doi_prefixes = ("10.1056",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('nejm.org')
@@ -5,6 +5,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class OpenEdition(PublisherParser):
     parser_name = "open_edition"
+    dispatch_hosts = ("openedition.org",)
+    dispatch_doi_prefixes = ("10.4000",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('openedition.org')
@@ -4,6 +4,8 @@ from parseland_lib.publisher.parsers.utils import EMAIL_RE
 
 class Optica(PublisherParser):
     parser_name = 'optica'
+    dispatch_hosts = ("optica.org",)
+    dispatch_doi_prefixes = ("10.1364",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('optica.org')
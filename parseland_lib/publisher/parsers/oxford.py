@@ -3,6 +3,7 @@ import re
 
 from parseland_lib.exceptions import UnusualTrafficError
 from parseland_lib.elements import AuthorAffiliations
+from parseland_lib.page_memo import memoized_on_page
 from parseland_lib.publisher.parsers.parser import PublisherParser
 
 
@@ -19,6 +20,8 @@ class Oxford(PublisherParser):
         "oxfordlawtrove.com",
         "oxfordre.com",
     )
+    dispatch_hosts = oxford_domains
+    dispatch_doi_prefixes = ("10.1093",)
     _AFFILIATION_SIGNAL = re.compile(
         r"\b("
         r"University|Department|School|College|Hospital|Institute|Centre|Center|"
@@ -110,6 +113,7 @@ class Oxford(PublisherParser):
         return {"authors": results,
                 "abstract": abstract,}
 
+    @memoized_on_page
     def _extract_schema_author_meta(self):
         """Read OUP product-page author metadata when article byline DOM is absent."""
         results = []
@@ -304,6 +308,7 @@ class Oxford(PublisherParser):
             if not author.affiliations:
                 author.affiliations.append(shared)
 
+    @memoized_on_page
     def _extract_product_author_bios(self):
         results = []
         for author in self.soup.select('li[data-role="author"]'):
@@ -326,6 +331,7 @@ class Oxford(PublisherParser):
             )
         return results
 
+    @memoized_on_page
     def _extract_author_affiliations_from_citation_title(self):
         title = self._meta_content("citation_title")
         if not title or ":" not in title:
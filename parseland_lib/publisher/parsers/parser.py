@@ -1,14 +1,15 @@
-import copy
 import re
 from abc import ABC, abstractmethod
 
 from parseland_lib.elements import AuthorAffiliations, Author
 from parseland_lib.legacy_parse_utils.fulltext import \
     parse_publisher_fulltext_location
-from parseland_lib.legacy_parse_utils.strings import cleanup_soup
+from parseland_lib.page_context import page_context
+from parseland_lib.page_memo import memoized_on_page
 from parseland_lib.publisher.parsers.utils import remove_parents, strip_seq, \
     strip_prefix, \
     is_h_tag
+from parseland_lib.text_index import TextIndex
 
 
 class Parser(ABC):
@@ -24,9 +25,37 @@ class Parser(ABC):
 
 
 class PublisherParser(Parser, ABC):
+    # Cheap routing signals read by parseland_lib.publisher.dispatch. Hosts
+    # match canonical / og:url hostnames by suffix, site names and publishers
+    # match og:site_name / citation_publisher case-insensitively by substring,
+    # and DOI prefixes match the page's citation DOI registrant. A parser with
+    # no hints is only reached by the full subclass scan.
+    dispatch_hosts = ()
+    dispatch_site_names = ()
+    dispatch_publishers = ()
+    dispatch_doi_prefixes = ()
+    # Strings identifying the inline <script> payloads the parser reads
+    # (a variable name, a type attribute, an id); parseland_lib.pretrim keeps
+    # those scripts when it trims oversized pages.
+    script_signatures = ()
+
     def __init__(self, soup):
         self.soup = soup
 
+    def __init_subclass__(cls, **kwargs):
+        # Publisher detection is asked for by the parser selection, by the
+        # parser's own authors_found() / parse(), and again by cleanup_soup
+        # and detect_bronze / detect_hybrid on fresh instances; evaluate it
+        # once per page.
+        super().__init_subclass__(**kwargs)
+        detect = cls.__dict__.get('is_publisher_specific_parser')
+        if detect is not None and not getattr(detect, 'memoized_on_page', False):
+            cls.is_publisher_specific_parser = memoized_on_page(detect)
+
+    @property
+    def context(self):
+        return page_context(self.soup)
+
     @property
     @abstractmethod
     def parser_name(self):
@@ -46,7 +75,7 @@ class PublisherParser(Parser, ABC):
                 "genre": None}
 
     def domain_in_canonical_link(self, domain):
-        canonical_link = self.soup.find("link", {"rel": "canonical"})
+        canonical_link = self.context.link("canonical")
         return (
                 canonical_link
                 and canonical_link.get("href")
@@ -55,30 +84,26 @@ class PublisherParser(Parser, ABC):
 
 
     def domain_in_meta_og_url(self, domain):
-        meta_og_url = self.soup.find("meta",
-                                     property="og:url") or self.soup.select_one(
-            'meta[name="og:url"]')
+        meta_og_url = self.context.og("og:url")
         return (meta_og_url
                 and meta_og_url.get("content")
                 and domain in meta_og_url.get("content")
                 )
 
     def substr_in_citation_journal_title(self, substr):
-        if tag := self.soup.select_one('meta[name="citation_journal_title"]'):
+        if tag := self.context.meta(name="citation_journal_title"):
             content = tag.get('content')
             return substr.lower() in content.lower()
         return False
 
     def substr_in_citation_publisher(self, substr):
-        if tag := self.soup.select_one('meta[name="citation_publisher"]'):
+        if tag := self.context.meta(name="citation_publisher"):
             content = tag.get('content')
             return substr.lower() in content.lower()
         return False
 
     def text_in_meta_og_site_name(self, txt):
-        meta_og_site_name = self.soup.find('meta',
-                                           property='og:site_name') or self.soup.select_one(
-            'meta[name="og:site_name"]')
+        meta_og_site_name = self.context.og("og:site_name")
         return (meta_og_site_name
                 and meta_og_site_name.get("content")
                 and txt in meta_og_site_name.get("content")
@@ -87,7 +112,7 @@ class PublisherParser(Parser, ABC):
     def parse_author_meta_tags(self, corresponding_tag=None,
                                corresponding_class=None):
         results = []
-        metas = self.soup.findAll("meta")
+        metas = self.context.metas
 
         corresponding_text = None
         if corresponding_tag and corresponding_class:
@@ -139,11 +164,9 @@ class PublisherParser(Parser, ABC):
 
         for meta_tag_name in meta_tag_names:
             for meta_property_name in meta_property_names:
-                if meta_tag := self.soup.find(
-                        "meta", {
-                            meta_property_name: re.compile(f"^{meta_tag_name}$",
-                                                           re.I)}
-                ):
+                if meta_tag := next(iter(self.context.metas_by(
+                        meta_property_name, meta_tag_name,
+                        case_sensitive=False)), None):
                     if description := meta_tag.get("content", '').strip():
                         if (
                                 len(description) > 200
@@ -236,28 +259,37 @@ class PublisherParser(Parser, ABC):
                              'copyright clearance center', 'procite',
                              'food funct', 'rsc publication'}
         startswith_blacklist = {'download'}
-        for tag in self.soup.find_all():
-            for attr, value in tag.attrs.items():
-                if 'abstract' in str(value).lower() or (
-                        tag.text.lower() == 'abstract' and is_h_tag(tag)):
-                    for desc in tag.descendants:
-                        abs_txt = strip_seq(r'\s',
-                                            strip_prefix('abstract', desc.text,
-                                                         flags=re.IGNORECASE))
-                        if len(desc.text) > 100 and desc.name in {'p', 'div',
-                                                                  'span',
-                                                                  'section',
-                                                                  'article'} \
-                                and not any(
-                            [abs_txt.lower().startswith(word) for word in
-                             startswith_blacklist]) \
-                                and not any([word in abs_txt.lower() for word in
-                                             blacklisted_words]):
-                            return abs_txt
+        # Tag texts come from one index of the page; a candidate nested in
+        # one whose subtree was already searched cannot match, so every tag
+        # is looked at once.
+        index = TextIndex(self.soup)
+        searched_until = 0
+        for pos, tag in enumerate(index.tags):
+            if pos < searched_until or not tag.attrs:
+                continue
+            if not (any('abstract' in str(value).lower()
+                        for value in tag.attrs.values())
+                    or (is_h_tag(tag) and index.text_length(tag) == 8
+                        and index.text(tag).lower() == 'abstract')):
+                continue
+            searched_until = index.subtree_end(pos)
+            for desc in index.tags[pos + 1:searched_until]:
+                if desc.name not in {'p', 'div', 'span', 'section',
+                                     'article'} \
+                        or index.text_length(desc) <= 100:
+                    continue
+                abs_txt = strip_seq(r'\s',
+                                    strip_prefix('abstract', index.text(desc),
+                                                 flags=re.IGNORECASE))
+                if not any([abs_txt.lower().startswith(word) for word in
+                            startswith_blacklist]) \
+                        and not any([word in abs_txt.lower() for word in
+                                     blacklisted_words]):
+                    return abs_txt
         return None
 
     def parse_fulltext_locations(self):
-        return parse_publisher_fulltext_location(self.soup, cleanup_soup(copy.deepcopy(self.soup)))
+        return parse_publisher_fulltext_location(self.soup, None)
 
 
     test_cases = []
@@ -4,9 +4,12 @@ from parseland_lib.publisher.parsers.utils import names_match
 
 class PermagonPress(PublisherParser):
     parser_name = "permagon_press"
+    dispatch_hosts = ("iwaponline.com",)
+    dispatch_publishers = ("IWA Publishing",)
+    dispatch_doi_prefixes = ("10.2166",)
 
     def is_publisher_specific_parser(self):
-        if publisher_meta := self.soup.select_one('meta[name=citation_publisher]'):
+        if publisher_meta := self.context.meta(name="citation_publisher"):
             return 'iwa publishing' in publisher_meta['content'].lower()
         return self.domain_in_canonical_link('iwaponline.com')
 
@@ -4,6 +4,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class PLOS(PublisherParser):
     parser_name = "plos"
+    dispatch_hosts = ("plos.org",)
+    dispatch_doi_prefixes = ("10.1371",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url("plos.org")
@@ -3,6 +3,7 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class RussianAcademyOfSciences(PublisherParser):
     parser_name = "russian_academy_of_sciences"
+    dispatch_hosts = ("ras.ru",)
 
     def is_publisher_specific_parser(self):
         founders_tags = self.soup.select('.founders-one-descr')
@@ -4,9 +4,12 @@ from parseland_lib.publisher.parsers.utils import email_matches_name, strip_suff
 
 class RoyalCollegeOfNursing(PublisherParser):
     parser_name = "royal_college_of_nursing"
+    dispatch_hosts = ("rcni.com",)
+    dispatch_doi_prefixes = ("10.7748",)
 
     def is_publisher_specific_parser(self):
-        return bool(self.soup.select('meta[content*="rcni.com"]'))
+        return any("rcni.com" in (meta.get("content") or "")
+                   for meta in self.context.metas)
 
     def authors_found(self):
         return bool(self.soup.select(
@@ -4,6 +4,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class ResearchSquare(PublisherParser):
     parser_name = "research square"
+    dispatch_hosts = ("researchsquare.com",)
+    dispatch_doi_prefixes = ("10.21203",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url("researchsquare.com")
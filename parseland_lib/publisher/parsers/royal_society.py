@@ -3,6 +3,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class RoyalSociety(PublisherParser):
     parser_name = "royal_society_publishing"
+    dispatch_hosts = ("royalsocietypublishing.org",)
+    dispatch_doi_prefixes = ("10.1098",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('royalsocietypublishing.org')
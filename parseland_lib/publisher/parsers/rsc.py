@@ -6,6 +6,8 @@ from parseland_lib.publisher.parsers.utils import is_h_tag
 
 class RSC(PublisherParser):
     parser_name = "rsc"
+    dispatch_hosts = ("pubs.rsc.org", "books.rsc.org")
+    dispatch_doi_prefixes = ("10.1039",)
 
     def is_publisher_specific_parser(self):
         return (
@@ -5,6 +5,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class Radiology(PublisherParser):
     parser_name = "rsna"
+    dispatch_hosts = ("rsna.org",)
+    dispatch_doi_prefixes = ("10.1148",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('rsna.org')
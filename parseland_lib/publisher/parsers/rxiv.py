@@ -4,6 +4,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class RXIV(PublisherParser):
     parser_name = "RXIV (Cold Spring Harbor Laboratory)"
+    dispatch_hosts = ("medrxiv.org", "biorxiv.org")
+    dispatch_doi_prefixes = ("10.1101",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url("medrxiv.org") or self.domain_in_meta_og_url(
@@ -3,6 +3,7 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class SCitation(PublisherParser):
     parser_name = "s_citation"
+    dispatch_hosts = ("scitation.org",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url("scitation.org")
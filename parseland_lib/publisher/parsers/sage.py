@@ -6,6 +6,8 @@ from parseland_lib.publisher.parsers.utils import is_h_tag, remove_parents
 
 class Sage(PublisherParser):
     parser_name = "Sage"
+    dispatch_hosts = ("journals.sagepub.com", "sk.sagepub.com")
+    dispatch_doi_prefixes = ("10.1177", "10.4135")
 
     def is_publisher_specific_parser(self):
         return (
@@ -7,6 +7,7 @@ import unidecode
 
 class SciELO(PublisherParser):
     parser_name = "scielo"
+    dispatch_hosts = ("scielo.br",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('www.scielo.br')
@@ -6,9 +6,10 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class ScieloPreprints(PublisherParser):
     parser_name = "SciELO preprints"
+    dispatch_hosts = ("preprints.scielo.org",)
 
     def is_publisher_specific_parser(self):
-        stylesheets = self.soup.find_all("link", {"rel": "stylesheet"})
+        stylesheets = self.context.links("stylesheet")
 
         if any(
             "preprints.scielo.org/" in stylesheet.get("href")
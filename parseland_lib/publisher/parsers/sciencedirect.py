@@ -6,6 +6,9 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class ScienceDirect(PublisherParser):
     parser_name = "sciencedirect"
+    dispatch_hosts = ("sciencedirect.com",)
+    dispatch_doi_prefixes = ("10.1016",)
+    script_signatures = ("__PRELOADED_STATE__", "application/json")
 
     def is_publisher_specific_parser(self):
         return self.domain_in_canonical_link("sciencedirect.com")
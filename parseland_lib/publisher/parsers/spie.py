@@ -4,6 +4,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class SPIE(PublisherParser):
     parser_name = "spie"
+    dispatch_hosts = ("spie.org",)
+    dispatch_doi_prefixes = ("10.1117",)
 
     def is_publisher_specific_parser(self):
         link = self.soup.find("a", class_="logo")
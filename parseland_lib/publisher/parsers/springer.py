@@ -1,4 +1,3 @@
-import json
 import re
 from collections import defaultdict
 from unicodedata import normalize
@@ -9,6 +8,24 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class Springer(PublisherParser):
     parser_name = "springer"
+    dispatch_hosts = (
+        "link.springer.com",
+        "springeropen.com",
+        "springermedizin.de",
+        "springerpflege.de",
+        "mijn.bsl.nl",
+        "nature.com",
+        "biomedcentral.com",
+    )
+    dispatch_publishers = ("SpringerMaterials",)
+    dispatch_doi_prefixes = (
+        "10.1007",
+        "10.1038",
+        "10.1186",
+        "10.1057",
+        "10.1023",
+    )
+    script_signatures = ("application/ld+json",)
 
     def is_publisher_specific_parser(self):
         return bool(
@@ -29,7 +46,7 @@ class Springer(PublisherParser):
         return True
 
     def _has_springer_materials_marker(self):
-        title = self.soup.find("title")
+        title = self.context.title
         if title and "springermaterials" in title.get_text(" ", strip=True).lower():
             return True
         return bool(self.substr_in_citation_publisher("SpringerMaterials"))
@@ -934,11 +951,12 @@ class Springer(PublisherParser):
             # available, otherwise against the ld+json author count.
             ld_authors = 0
             ld_emailed: list[str] = []
-            for s in self.soup.find_all("script", {"type": "application/ld+json"}):
-                if not s.text:
+            scripts = self.context.scripts
+            for _, text in scripts.of_type("application/ld+json"):
+                if not text:
                     continue
                 try:
-                    blob = json.loads(s.text)
+                    blob = scripts.json(text)
                 except Exception:
                     continue
                 if isinstance(blob, dict) and "mainEntity" in blob:
@@ -1282,9 +1300,9 @@ class Springer(PublisherParser):
 
     def parse_article_metadatas(self):
         metadatas = []
-        for ld_json in self.soup.find_all("script",
-                                          {"type": "application/ld+json"}):
-            article_metadata = json.loads(ld_json.text)
+        scripts = self.context.scripts
+        for _, text in scripts.of_type("application/ld+json"):
+            article_metadata = scripts.json(text)
             if 'mainEntity' in article_metadata:
                 article_metadata = article_metadata['mainEntity']
             metadatas.append(article_metadata)
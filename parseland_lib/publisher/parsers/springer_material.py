@@ -7,6 +7,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class SpringerMaterial(PublisherParser):
     parser_name = "springer material"
+    dispatch_hosts = ("materials.springer.com",)
+    dispatch_publishers = ("SpringerMaterials",)
 
     def is_publisher_specific_parser(self):
         head = self.soup.head
@@ -6,6 +6,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class SSRN(PublisherParser):
     parser_name = "ssrn"
+    dispatch_hosts = ("papers.ssrn.com",)
+    dispatch_doi_prefixes = ("10.2139",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_canonical_link("papers.ssrn.com")
@@ -1,5 +1,4 @@
 import html
-import json
 import re
 
 from bs4 import BeautifulSoup, NavigableString
@@ -10,6 +9,9 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class Taylor(PublisherParser):
     parser_name = "taylor"
+    dispatch_hosts = ("tandfonline.com", "taylorfrancis.com")
+    dispatch_doi_prefixes = ("10.1080", "10.4324", "10.1201")
+    script_signatures = ("application/ld+json", "application/json")
 
     def is_publisher_specific_parser(self):
         return (
@@ -98,12 +100,12 @@ class Taylor(PublisherParser):
         return {"authors": results, "abstract": abstract}
 
     def _taylorfrancis_jsonld_chapter(self):
-        for script in self.soup.find_all("script", type="application/ld+json"):
-            raw = script.string or script.get_text("", strip=False)
+        scripts = self.context.scripts
+        for _, raw in scripts.of_type("application/ld+json"):
             if not raw:
                 continue
             try:
-                payload = json.loads(raw)
+                payload = scripts.json(raw)
             except Exception:
                 continue
             objects = payload if isinstance(payload, list) else [payload]
@@ -358,13 +360,13 @@ class Taylor(PublisherParser):
                 yield product
 
     def _taylorfrancis_product_payload_items(self):
-        for script in self.soup.find_all("script", type="application/json"):
-            raw = script.string or script.get_text("", strip=False)
+        scripts = self.context.scripts
+        for _, raw in scripts.of_type("application/json"):
             if not raw or "&q;product&q;" not in raw:
                 continue
             normalized = self._decode_taylorfrancis_jsonish(raw)
             try:
-                payload = json.loads(normalized)
+                payload = scripts.json(normalized)
             except Exception:
                 payload = None
             yield payload, raw
@@ -10,10 +10,18 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class Thieme(PublisherParser):
     parser_name = "thieme"
+    dispatch_hosts = (
+        "thieme-connect.com",
+        "thieme-connect.de",
+        "thieme.com",
+        "thieme.de",
+    )
+    dispatch_publishers = ("thieme",)
+    dispatch_doi_prefixes = ("10.1055",)
 
     def is_publisher_specific_parser(self):
         has_thieme_description = False
-        if desc_tag := self.soup.select_one('meta[name=description]'):
+        if desc_tag := self.context.meta(name="description"):
             has_thieme_description = desc_tag.get('content', '').startswith('Thieme')
         return (
             has_thieme_description
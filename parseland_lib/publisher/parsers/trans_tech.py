@@ -4,9 +4,12 @@ from parseland_lib.publisher.parsers.utils import is_h_tag, remove_parents
 
 class TransTechPub(PublisherParser):
     parser_name = "trans_tech_publications"
+    dispatch_hosts = ("scientific.net",)
+    dispatch_publishers = ("Trans Tech",)
+    dispatch_doi_prefixes = ("10.4028",)
 
     def is_publisher_specific_parser(self):
-        if meta := self.soup.select_one('meta[name=citation_publisher]'):
+        if meta := self.context.meta(name="citation_publisher"):
             return 'Trans Tech' in meta['content']
         return False
 
@@ -6,6 +6,9 @@ from parseland_lib.publisher.parsers.utils import strip_prefix
 
 class UniversityOfCalifornia(PublisherParser):
     parser_name = 'university_of_california_press'
+    dispatch_hosts = ("online.ucpress.edu",)
+    dispatch_site_names = ("University of California Press",)
+    dispatch_doi_prefixes = ("10.1525",)
 
     AFF_PATTERN = re.compile(r'at ([a-zA-Z\d, .]+)')
 
@@ -5,6 +5,8 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class UniversityOfTorontoPress(PublisherParser):
     parser_name = "university_of_toronto_press"
+    dispatch_hosts = ("utpjournals.press",)
+    dispatch_doi_prefixes = ("10.3138",)
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url('utpjournals.press')
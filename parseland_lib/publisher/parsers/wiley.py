@@ -10,6 +10,9 @@ from parseland_lib.publisher.parsers.utils import is_h_tag, strip_prefix, strip_
 
 class Wiley(PublisherParser):
     parser_name = "wiley"
+    dispatch_hosts = ("onlinelibrary.wiley.com",)
+    dispatch_site_names = ("Wiley Online Library",)
+    dispatch_doi_prefixes = ("10.1002", "10.1111")
 
     def is_publisher_specific_parser(self):
         return self.domain_in_meta_og_url("onlinelibrary.wiley.com") or self.text_in_meta_og_site_name('Wiley Online Library')
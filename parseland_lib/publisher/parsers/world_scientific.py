@@ -4,9 +4,11 @@ from parseland_lib.publisher.parsers.parser import PublisherParser
 
 class WorldScientific(PublisherParser):
     parser_name = "world_scientific"
+    dispatch_hosts = ("worldscientific.com",)
+    dispatch_doi_prefixes = ("10.1142",)
 
     def is_publisher_specific_parser(self):
-        if pub_name_tag := self.soup.select_one("meta[name='dc.Publisher']"):
+        if pub_name_tag := self.context.meta(name="dc.Publisher"):
             return 'World Scientific' in pub_name_tag['content']
         return False
 
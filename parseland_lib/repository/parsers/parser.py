@@ -3,12 +3,20 @@ from abc import ABC, abstractmethod
 from parseland_lib.elements import AuthorAffiliations
 from parseland_lib.legacy_parse_utils.fulltext import \
     parse_repo_fulltext_location
+from parseland_lib.page_context import page_context
 
 
 class RepositoryParser(ABC):
+    # see PublisherParser.script_signatures
+    script_signatures = ()
+
     def __init__(self, soup):
         self.soup = soup
 
+    @property
+    def context(self):
+        return page_context(self.soup)
+
     @property
     @abstractmethod
     def parser_name(self):
@@ -31,7 +39,7 @@ class RepositoryParser(ABC):
         pass
 
     def domain_in_canonical_link(self, domain):
-        canonical_link = self.soup.find("link", {"rel": "canonical"})
+        canonical_link = self.context.link("canonical")
         if (
             canonical_link
             and canonical_link.get("href")
@@ -40,7 +48,7 @@ class RepositoryParser(ABC):
             return True
 
     def domain_in_meta_og_url(self, domain):
-        meta_og_url = self.soup.find("meta", property="og:url")
+        meta_og_url = self.context.meta(property="og:url")
         if (
             meta_og_url
             and meta_og_url.get("content")
@@ -50,7 +58,7 @@ class RepositoryParser(ABC):
 
     def parse_meta_tags(self):
         results = []
-        metas = self.soup.findAll("meta")
+        metas = self.context.metas
 
         result = None
         for meta in metas:
@@ -1,22 +1,22 @@
-import json
-
 from parseland_lib.repository.parsers.parser import RepositoryParser
 
 
 class Zenodo(RepositoryParser):
     parser_name = "Zenodo"
+    script_signatures = ("application/ld+json",)
 
     def is_correct_parser(self):
         return self.domain_in_meta_og_url("zenodo.org/record/")
 
     def authors_found(self):
-        return self.soup.find("script", {"type": "application/ld+json"})
+        return bool(self.context.scripts.of_type("application/ld+json"))
 
     def parse(self):
         authors = []
 
-        for ld_json in self.soup.find_all("script", {"type": "application/ld+json"}):
-            article_metadata = json.loads(ld_json.text)
+        scripts = self.context.scripts
+        for _, text in scripts.of_type("application/ld+json"):
+            article_metadata = scripts.json(text)
             for creator in article_metadata.get("creator", []):
                 if creator.get("@type") == "Person":
                     name = creator.get("name")
@@ -0,0 +1,311 @@
+"""Cache of parse_page results across runs, invalidated per parser.
+
+An evaluation run re-parses thousands of pages after a change to a single
+parser, though that parser has no say in most of them. A ResultCache keeps
+each page's result, with the parsers that took part in producing it, and
+hands the result back on a later run unless the change could affect it:
+
+- the page (HTML, namespace, resolved_url) is the same, and so are the
+  library outside the parser modules (parse.py, legacy_parse_utils,
+  dispatch, the parser base classes, ...) and the versions of Python,
+  BeautifulSoup and lxml;
+- no parser that claimed the page (its authors_found() was true) or parsed
+  it lives in, or uses parsers from, a module that has changed;
+- no other parser in a changed module claims the page now: it is not a
+  dispatch candidate and its authors_found() is false. Checking that takes
+  a soup, not a parse.
+
+Which parsers claimed a page is read off the ParseTrace of the parse that
+produced the result. Parses run under a time budget are not cacheable.
+
+Entries are JSON files under the cache directory, one per page, written
+atomically, so runs on different checkouts can share a directory.
+"""
+import functools
+import hashlib
+import json
+import os
+import platform
+import sys
+from collections import deque
+from pathlib import Path
+
+import bs4
+import lxml.etree
+
+import parseland_lib
+from parseland_lib.parse import PageResult, _pool_map, format_error, parse_page
+from parseland_lib.serialize import dumps
+from parseland_lib.trace import ParseTrace
+
+CLAIMED = 'claimed'
+CONSULTED = 'consulted'
+
+
+@functools.lru_cache(maxsize=1)
+def parser_classes():
+    """{class name: [classes]} for every publisher and repository parser."""
+    from parseland_lib.publisher.dispatch import DISPATCH_INDEX
+    from parseland_lib.publisher.parsers.generic import GenericPublisherParser
+    from parseland_lib.repository.parsers.parser import RepositoryParser
+
+    by_name = {}
+    for cls in dict.fromkeys([*DISPATCH_INDEX.parser_classes,
+                              GenericPublisherParser,
+                              *RepositoryParser.__subclasses__()]):
+        by_name.setdefault(cls.__name__, []).append(cls)
+    return by_name
+
+
+def _file_hash(path):
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+
+class CodeFingerprint:
+    """Hashes of the library source: one for the core, one per parser
+    module."""
+
+    def __init__(self):
+        self.classes = parser_classes()
+        modules = {cls.__module__: sys.modules[cls.__module__].__file__
+                   for classes in self.classes.values() for cls in classes}
+        self.modules = {name: _file_hash(path)
+                        for name, path in sorted(modules.items())}
+        # a class depends on its own module and on the parser modules that
+        # module imports parsers from (ama.py builds a
+        # GenericPublisherParser)
+        uses = {module: {value.__module__
+                         for value in vars(sys.modules[module]).values()
+                         if isinstance(value, type)
+                         and value.__module__ in modules}
+                for module in modules}
+        self.modules_of = {name: sorted({module for cls in classes
+                                         for module in (cls.__module__,
+                                                        *uses[cls.__module__])})
+                           for name, classes in self.classes.items()}
+
+        parser_files = {os.path.realpath(path) for path in modules.values()}
+        root = Path(parseland_lib.__file__).parent
+        core = hashlib.sha1()
+        for path in sorted(root.rglob('*.py')):
+            if os.path.realpath(path) not in parser_files:
+                core.update(f'{path.relative_to(root)}\0'.encode())
+                core.update(path.read_bytes())
+        core.update(f'{platform.python_version()} {bs4.__version__} '
+                    f'{lxml.etree.__version__}'.encode())
+        self.core = core.hexdigest()
+
+        self.manifest = {'modules': self.modules, 'classes': self.modules_of}
+        self.manifest_id = hashlib.sha1(
+            dumps(self.manifest)).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def code_fingerprint():
+    return CodeFingerprint()
+
+
+def page_key(lp_content, namespace, resolved_url):
+    if isinstance(lp_content, str):
+        lp_content = lp_content.encode('utf-8', 'surrogatepass')
+    digest = hashlib.sha1(f'{namespace}\0{resolved_url}\0'.encode())
+    digest.update(lp_content)
+    return digest.hexdigest()
+
+
+def involvement(trace):
+    """{parser class name: CLAIMED or CONSULTED} from a ParseTrace dict.
+    is_publisher_specific_parser() is only asked of a parser whose
+    authors_found() was true, and parse() of one that claimed the page."""
+    return {name: CLAIMED if ('parse' in methods
+                              or 'is_publisher_specific_parser' in methods)
+            else CONSULTED
+            for name, methods in trace['parsers'].items()}
+
+
+class ResultCache:
+    """parse_page results on disk; see the module docstring."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.fingerprint = code_fingerprint()
+        self._manifests = {}
+        self._manifest_saved = False
+        self.hits = self.rechecked = self.misses = 0
+
+    def _path(self, key):
+        return self.directory / key[:2] / f'{key}.json'
+
+    def _write(self, path, obj):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        tmp.write_bytes(dumps(obj))
+        os.replace(tmp, path)
+
+    def _manifest(self, manifest_id):
+        if manifest_id not in self._manifests:
+            path = self.directory / 'manifests' / f'{manifest_id}.json'
+            try:
+                self._manifests[manifest_id] = json.loads(path.read_bytes())
+            except (OSError, ValueError):
+                self._manifests[manifest_id] = None
+        return self._manifests[manifest_id]
+
+    def lookup(self, key):
+        """(entry, recheck) for a cached page: recheck lists the parser
+        classes that must still be shown not to claim the page. None if
+        the page has to be parsed."""
+        try:
+            entry = json.loads(self._path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if entry.get('core') != self.fingerprint.core:
+            return None
+        if entry['manifest'] == self.fingerprint.manifest_id:
+            return entry, []
+        manifest = self._manifest(entry['manifest'])
+        if manifest is None:
+            return None
+
+        modules = self.fingerprint.modules
+        changed = {name for name in modules.keys() | manifest['modules'].keys()
+                   if modules.get(name) != manifest['modules'].get(name)}
+        names = {name
+                 for classes in (self.fingerprint.modules_of, manifest['classes'])
+                 for name, class_modules in classes.items()
+                 if changed.intersection(class_modules)}
+        if any(entry['parsers'].get(name) == CLAIMED for name in names):
+            return None
+        return entry, sorted(name for name in names
+                             if name in self.fingerprint.classes)
+
+    def store(self, key, result, duration_ms):
+        """Cache a PageResult parsed with a trace."""
+        self._save_manifest()
+        self._write(self._path(key), {
+            'core': self.fingerprint.core,
+            'manifest': self.fingerprint.manifest_id,
+            'parsers': involvement(result.trace),
+            'parsed': result.parsed,
+            'error': result.error,
+            'duration_ms': duration_ms,
+            'trace': result.trace,
+        })
+
+    def renew(self, key, entry):
+        """Mark an entry that passed its recheck as current."""
+        self._save_manifest()
+        self._write(self._path(key), {
+            **entry, 'manifest': self.fingerprint.manifest_id})
+
+    def _save_manifest(self):
+        if self._manifest_saved:
+            return
+        path = self.directory / 'manifests' / \
+            f'{self.fingerprint.manifest_id}.json'
+        if not path.exists():
+            self._write(path, self.fingerprint.manifest)
+        self._manifest_saved = True
+
+
+def _claims(classes, lp_content, namespace):
+    """True if any of classes would take part in parsing the page."""
+    from bs4 import BeautifulSoup
+
+    from parseland_lib.page_context import page_context
+    from parseland_lib.pretrim import guard_page
+    from parseland_lib.publisher.dispatch import candidate_parsers
+    from parseland_lib.publisher.parsers.parser import PublisherParser
+    from parseland_lib.repository.parsers.parser import RepositoryParser
+
+    base = {'doi': PublisherParser, 'pmh': RepositoryParser}.get(namespace)
+    classes = [cls for cls in classes if base and issubclass(cls, base)]
+    if not classes:
+        return False
+    lp_content, _ = guard_page(lp_content)
+    soup = BeautifulSoup(lp_content, parser='lxml', features='lxml')
+    page_context(soup)
+    candidates = set(candidate_parsers(soup)) if namespace == 'doi' else ()
+    for cls in classes:
+        if cls in candidates:
+            return True
+        parser = cls(soup)
+        try:
+            if base is RepositoryParser and not parser.is_correct_parser():
+                continue
+            if parser.authors_found():
+                return True
+        except Exception:
+            continue
+    return False
+
+
+def _cached_chunk(chunk):
+    """Worker side of parse_pages_cached: recheck or parse each page."""
+    classes = parser_classes()
+    results = []
+    for key, lp_content, namespace, resolved_url, recheck in chunk:
+        if recheck and not _claims(
+                [cls for name in recheck for cls in classes[name]],
+                lp_content, namespace):
+            results.append((key, None, None))
+            continue
+        trace = ParseTrace()
+        try:
+            result = PageResult(key, parse_page(lp_content, namespace,
+                                                resolved_url, trace=trace))
+        except Exception as e:
+            result = PageResult(key, None, format_error(e))
+        result.trace = trace.to_dict()
+        results.append((key, result,
+                        trace.stages['parse_page'].wall * 1000.0))
+    return results
+
+
+def _cached_result(key, entry, trace):
+    return PageResult(key, entry['parsed'], entry['error'],
+                      entry['trace'] if trace else None, cached=True)
+
+
+def parse_pages_cached(pages, cache, workers=None, chunksize=16, trace=False):
+    """parse_pages() through a ResultCache.
+
+    Yields (PageResult, duration_ms) per page: cached pages first, as they
+    are looked up, then the rest as their parses finish, so not in input
+    order. duration_ms is the time the page took to parse, on the run that
+    parsed it. Pages that need a recheck or a parse go to the worker pool
+    as in parse_pages, and their results are written to the cache.
+    """
+    ready = deque()
+    pending = {}
+
+    def to_parse():
+        for key, lp_content, namespace, resolved_url in pages:
+            page = page_key(lp_content, namespace, resolved_url)
+            found = cache.lookup(page)
+            if found is not None and not found[1]:
+                cache.hits += 1
+                ready.append((_cached_result(key, found[0], trace),
+                              found[0]['duration_ms']))
+                continue
+            pending[key] = (page, found[0] if found else None)
+            yield (key, lp_content, namespace, resolved_url,
+                   found[1] if found else None)
+
+    for key, result, duration_ms in _pool_map(
+            _cached_chunk, to_parse(), workers, chunksize, ordered=False):
+        while ready:
+            yield ready.popleft()
+        page, entry = pending.pop(key)
+        if result is None:
+            cache.rechecked += 1
+            cache.renew(page, entry)
+            yield _cached_result(key, entry, trace), entry['duration_ms']
+            continue
+        cache.misses += 1
+        cache.store(page, result, duration_ms)
+        if not trace:
+            result.trace = None
+        yield result, duration_ms
+    while ready:
+        yield ready.popleft()
@@ -1,9 +1,21 @@
-from gzip import decompress
+import io
+import zlib
+from contextlib import closing
+
 import botocore
 
 from parseland_lib.exceptions import S3FileNotFoundError
+from parseland_lib.pretrim import guard_chunks
 
 LANDING_PAGE_BUCKET = 'openalex-html'
+PDF_MAGIC = b'%PDF-'
+GZIP_MAGIC = b'\x1f\x8b\x08'
+# Compressed bytes read from the body, and inflated bytes produced, at a
+# time.
+READ_CHUNK_BYTES = 256 * 1024
+INFLATE_CHUNK_BYTES = 1024 * 1024
+# Inflated pages are cut here, whatever the caller does with them next.
+MAX_LANDING_PAGE_BYTES = 64 * 1024 * 1024
 
 
 def get_obj(bucket, key, s3):
@@ -15,37 +27,85 @@ def get_obj(bucket, key, s3):
             raise S3FileNotFoundError()
 
 
-def is_pdf_in_r2(bucket, key, s3):
+def _inflate(head, body, harvest_id):
+    """Yield the inflated page, reading body READ_CHUNK_BYTES at a time.
+
+    head is the first bytes of the body, already read. Concatenated gzip
+    members are inflated one after another, as gzip.decompress does. A body
+    that is not gzipped is yielded as it is; one that fails to inflate
+    partway stops there, with what was inflated so far.
+    """
     try:
-        resp = s3.get_object(
-            Bucket=bucket,
-            Key=key,
-            Range='bytes=0-4'  # %PDF- is 5 bytes
-        )
-        content = resp['Body'].read()
-        return content.startswith(b'%PDF-')
-    except botocore.exceptions.ClientError as e:
-        if e.response['Error']['Code'] in {"404", "NoSuchKey"}:
-            raise S3FileNotFoundError()
+        if not head.startswith(GZIP_MAGIC):
+            yield head
+            while chunk := body.read(READ_CHUNK_BYTES):
+                yield chunk
+            return
+
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        chunk = head
+        while chunk:
+            while chunk:
+                if out := inflater.decompress(chunk, INFLATE_CHUNK_BYTES):
+                    yield out
+                chunk = inflater.unconsumed_tail
+                if inflater.eof and inflater.unused_data.startswith(GZIP_MAGIC):
+                    chunk = inflater.unused_data
+                    inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            chunk = body.read(READ_CHUNK_BYTES)
+        if out := inflater.flush():
+            yield out
+    except zlib.error as e:
+        print(f"Error decompressing content for {harvest_id}: {str(e)}")
+    finally:
+        body.close()
 
 
-def get_landing_page_from_r2(harvest_id, s3):
+def _open_landing_page(harvest_id, s3):
+    """The inflated page as a generator of chunks, or None for a PDF.
+
+    One GET: the first bytes of the stream tell a PDF apart, and only a page
+    that is not one is downloaded further. Close the generator to stop the
+    download early."""
     key = f"{harvest_id}.html.gz"
+    obj = get_obj(LANDING_PAGE_BUCKET, key, s3)
+    body = obj['Body']
+    head = body.read(len(PDF_MAGIC))
+    if head.startswith(PDF_MAGIC):
+        body.close()
+        return None
+    return _inflate(head, body, harvest_id)
+
 
-    # Check if PDF before downloading whole file
-    if is_pdf_in_r2(LANDING_PAGE_BUCKET, key, s3):
+def get_landing_page_from_r2(harvest_id, s3, max_bytes=MAX_LANDING_PAGE_BYTES):
+    """The landing page as bytes (None for a PDF), cut at max_bytes.
+
+    The body is inflated as it downloads, into a single buffer: neither the
+    compressed body nor a second copy of the page is held.
+    """
+    chunks = _open_landing_page(harvest_id, s3)
+    if chunks is None:
         return None
+    out = io.BytesIO()
+    with closing(chunks):
+        for chunk in chunks:
+            if out.tell() + len(chunk) > max_bytes:
+                out.write(chunk[:max_bytes - out.tell()])
+                break
+            out.write(chunk)
+    return out.getvalue()
 
-    obj = get_obj(LANDING_PAGE_BUCKET, key, s3)
-    content = obj['Body'].read()
 
-    try:
-        # check if content starts with gzip magic number
-        if content.startswith(b'\x1f\x8b\x08'):
-            return decompress(content)
-        # if not compressed, return as is
-        return content
-    except Exception as e:
-        print(f"Error decompressing content for {harvest_id}: {str(e)}")
-        # Return uncompressed content as fallback
-        return content
+def get_guarded_landing_page_from_r2(harvest_id, s3):
+    """The landing page as a GuardedPage ready for parse_page, or None for a
+    PDF.
+
+    Oversized pages are pre-trimmed while they download and cut at
+    pretrim.MAX_PAGE_BYTES; the download stops at the cut (see
+    pretrim.guard_chunks).
+    """
+    chunks = _open_landing_page(harvest_id, s3)
+    if chunks is None:
+        return None
+    with closing(chunks):
+        return guard_chunks(chunks)
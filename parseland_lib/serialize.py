@@ -0,0 +1,91 @@
+"""JSON encoding for API responses, batch output and eval run files.
+
+dumps() uses orjson when it is installed and the stdlib json module
+otherwise, and writes the same bytes either way: UTF-8, non-ASCII characters
+as is, keys in insertion order, compact or with a two-space indent, and
+NaN / Infinity as null. Dataclasses are written as objects of their fields,
+UUIDs as strings and enums as their values.
+
+orjson formats floats below 1e-4 or from 1e16 up differently from repr(),
+and cannot write non-str keys or ints beyond 64 bits. When its output holds
+such a float (or anything that looks like one), or it refuses the object,
+the object goes through the stdlib encoder instead. That is also where
+strings holding lone surrogates (from a "\\ud83d" in a parsed JSON-LD
+payload, say) end up; the surrogates are written as JSON escapes, since they
+have no UTF-8 encoding.
+"""
+import dataclasses
+import enum
+import json
+import math
+import re
+import uuid
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+# an exponent, or a fixed-notation float below 1e-4, in orjson output
+_ORJSON_FLOAT_MISMATCH = re.compile(rb'[0-9]e-?[0-9]|0\.0000')
+_SURROGATE = re.compile('[\ud800-\udfff]')
+
+
+def _default(obj):
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name)
+                for field in dataclasses.fields(obj)}
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _finite(obj):
+    """obj with NaN / Infinity floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _finite(_default(obj))
+    return obj
+
+
+def _stdlib_dumps(obj, indent):
+    kwargs = {'indent': 2} if indent else {'separators': (',', ':')}
+    try:
+        text = json.dumps(obj, ensure_ascii=False, allow_nan=False,
+                          default=_default, **kwargs)
+    except ValueError:
+        text = json.dumps(_finite(obj), ensure_ascii=False, allow_nan=False,
+                          default=_default, **kwargs)
+    try:
+        return text.encode('utf-8')
+    except UnicodeEncodeError:
+        # surrogates only occur inside JSON strings, where an escape is valid
+        return _SURROGATE.sub(lambda m: f'\\u{ord(m.group()):04x}',
+                              text).encode('utf-8')
+
+
+def _orjson_dumps(obj, indent):
+    option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    try:
+        data = orjson.dumps(obj, default=_default, option=option)
+    except orjson.JSONEncodeError:
+        return None
+    if _ORJSON_FLOAT_MISMATCH.search(data):
+        return None
+    return data
+
+
+def dumps(obj, indent=False):
+    """obj as JSON bytes; indent=True indents by two spaces."""
+    if orjson is not None and (data := _orjson_dumps(obj, indent)) is not None:
+        return data
+    return _stdlib_dumps(obj, indent)
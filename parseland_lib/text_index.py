@@ -0,0 +1,115 @@
+import bs4
+
+from parseland_lib.legacy_parse_utils.strings import CleanedSoup
+
+# Attribute under which a CleanedSoup view caches its index (see
+# page_context for why it is read through vars()).
+_INDEX_ATTR = '_parseland_text_index'
+
+# The string types tag.get_text() keeps for every tag except <script>,
+# <style> and <template>.
+_DEFAULT_TYPES = (bs4.NavigableString, bs4.CData)
+
+
+class TextIndex:
+    """tag.get_text() for every tag of a page, from one walk of the tree.
+
+    tag.text re-walks the tag's subtree on every call, so a predicate like
+    soup.find(lambda tag: tag.text == ...) costs the size of the page times
+    its depth. The index lays the page's tags and strings out in document
+    order once; a tag's text is then the strings between two offsets, its
+    length a subtraction, and its descendants a slice of self.tags.
+
+    soup may be a CleanedSoup view, in which case the removed nodes are left
+    out, as in view.get_text(). The root itself is not indexed, matching
+    soup.find_all().
+    """
+
+    def __init__(self, soup):
+        self.tags = []
+        self.strings = []
+        self._pos = {}
+        self._tag_end = []
+        self._string_start = []
+        self._string_end = []
+        # _lengths[i]: characters of default-type text in strings[:i]
+        self._lengths = [0]
+
+        if isinstance(soup, CleanedSoup):
+            elements = soup.elements()
+            next(elements)  # the root
+        else:
+            elements = soup.descendants
+
+        open_tags = []
+        for element in elements:
+            while open_tags and self.tags[open_tags[-1]] is not element.parent:
+                self._close(open_tags.pop())
+            if isinstance(element, bs4.Tag):
+                pos = len(self.tags)
+                self.tags.append(element)
+                self._pos[id(element)] = pos
+                self._tag_end.append(None)
+                self._string_start.append(len(self.strings))
+                self._string_end.append(None)
+                open_tags.append(pos)
+            elif isinstance(element, bs4.NavigableString):
+                self.strings.append(element)
+                length = len(element) if type(element) in _DEFAULT_TYPES else 0
+                self._lengths.append(self._lengths[-1] + length)
+        while open_tags:
+            self._close(open_tags.pop())
+
+    def _close(self, pos):
+        self._tag_end[pos] = len(self.tags)
+        self._string_end[pos] = len(self.strings)
+
+    def position(self, tag):
+        return self._pos[id(tag)]
+
+    def subtree_end(self, pos):
+        """self.tags[pos + 1:subtree_end(pos)] are the descendants of the tag
+        at pos."""
+        return self._tag_end[pos]
+
+    def _types(self, tag):
+        types = tag.interesting_string_types
+        return (types,) if isinstance(types, type) else types
+
+    def text(self, tag):
+        pos = self._pos[id(tag)]
+        types = self._types(tag)
+        return ''.join(
+            string for string in
+            self.strings[self._string_start[pos]:self._string_end[pos]]
+            if types is None or type(string) in types)
+
+    def text_length(self, tag):
+        pos = self._pos[id(tag)]
+        if self._types(tag) != _DEFAULT_TYPES:
+            return len(self.text(tag))
+        return (self._lengths[self._string_end[pos]]
+                - self._lengths[self._string_start[pos]])
+
+    def find_text(self, text):
+        """First tag whose text is exactly text, or None."""
+        for tag in self.tags:
+            if self.text_length(tag) == len(text) and self.text(tag) == text:
+                return tag
+        return None
+
+
+def text_index(soup):
+    """The TextIndex of soup.
+
+    Cached on CleanedSoup views, which never change. A plain soup is indexed
+    afresh on every call: author parsers edit their soup in place, so an
+    index cached on it could go stale.
+    """
+    if not isinstance(soup, CleanedSoup):
+        return TextIndex(soup)
+    index = vars(soup).get(_INDEX_ATTR)
+    if index is None:
+        index = TextIndex(soup)
+        setattr(soup, _INDEX_ATTR, index)
+    return index
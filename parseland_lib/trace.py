@@ -0,0 +1,139 @@
+"""Opt-in timing of the stages of a parse.
+
+parse_page(..., trace=ParseTrace()) records wall and CPU time per stage -
+pre-trim, soup construction, publisher dispatch, the parser scan,
+cleanup_soup, find_pdf_link, get_useful_links, detect_bronze, detect_hybrid
+- and per parser class and method (authors_found, parse, ...). The trace
+being filled is held in a ContextVar while the parse runs, so helpers deep
+in legacy_parse_utils record into it without it being passed down. With no
+trace active a stage costs one ContextVar lookup.
+
+Stages nest: 'fulltext_location' includes 'find_pdf_link', which includes
+'get_useful_links'. A stage entered several times for a page is summed and
+counted. CPU time is the parsing thread's own (time.thread_time).
+"""
+import contextvars
+import functools
+import time
+from contextlib import contextmanager, nullcontext
+
+_ACTIVE = contextvars.ContextVar('parseland_parse_trace', default=None)
+_NO_SPAN = nullcontext()
+
+
+class Timing:
+    __slots__ = ('calls', 'wall', 'cpu')
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def to_dict(self):
+        return {'calls': self.calls,
+                'wall_ms': round(self.wall * 1000, 3),
+                'cpu_ms': round(self.cpu * 1000, 3)}
+
+
+class _Span:
+    __slots__ = ('timing', 'wall', 'cpu')
+
+    def __init__(self, timing):
+        self.timing = timing
+
+    def __enter__(self):
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        timing = self.timing
+        timing.calls += 1
+        timing.wall += time.perf_counter() - self.wall
+        timing.cpu += time.thread_time() - self.cpu
+        return False
+
+
+class ParseTrace:
+    """Stage and parser timings of one parse; see the module docstring."""
+
+    def __init__(self):
+        self.stages = {}
+        # {parser class name: {method name: Timing}}
+        self.parsers = {}
+
+    def stage(self, name):
+        """Context manager timing a stage into this trace."""
+        timing = self.stages.get(name)
+        if timing is None:
+            timing = self.stages[name] = Timing()
+        return _Span(timing)
+
+    def parser(self, cls, method):
+        methods = self.parsers.setdefault(cls.__name__, {})
+        timing = methods.get(method)
+        if timing is None:
+            timing = methods[method] = Timing()
+        return _Span(timing)
+
+    @contextmanager
+    def activate(self):
+        """Make this the trace stages record into, for the with block."""
+        token = _ACTIVE.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE.reset(token)
+
+    def to_dict(self):
+        return {
+            'stages': {name: timing.to_dict()
+                       for name, timing in self.stages.items()},
+            'parsers': {cls: {method: timing.to_dict()
+                              for method, timing in methods.items()}
+                        for cls, methods in self.parsers.items()},
+        }
+
+    def server_timing(self, max_parsers=10):
+        """The trace as a Server-Timing header value: every stage, then the
+        max_parsers slowest parser classes (all their methods summed)."""
+        metrics = [f'{name};dur={timing.wall * 1000:.1f}'
+                   for name, timing in self.stages.items()]
+        parser_walls = sorted(
+            ((sum(timing.wall for timing in methods.values()), cls)
+             for cls, methods in self.parsers.items()),
+            reverse=True)
+        metrics += [f'parser.{cls};dur={wall * 1000:.1f}'
+                    for wall, cls in parser_walls[:max_parsers]]
+        return ', '.join(metrics)
+
+
+def active_trace():
+    """The trace of the parse running in this context, or None."""
+    return _ACTIVE.get()
+
+
+def stage(name):
+    """Time a stage into the active trace, if there is one."""
+    trace = _ACTIVE.get()
+    return _NO_SPAN if trace is None else trace.stage(name)
+
+
+def parser_stage(parser, method):
+    """Time a parser method into the active trace, if there is one."""
+    trace = _ACTIVE.get()
+    return _NO_SPAN if trace is None else trace.parser(type(parser), method)
+
+
+def traced(name):
+    """Decorator timing every call of a function as stage name."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = _ACTIVE.get()
+            if trace is None:
+                return func(*args, **kwargs)
+            with trace.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
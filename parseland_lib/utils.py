@@ -1,6 +1,7 @@
 import re
 from dataclasses import asdict, is_dataclass
 
+from parseland_lib.page_context import page_context
 from parseland_lib.publisher.parsers.utils import EMAIL_RE, strip_prefix
 import ftfy
 
@@ -138,14 +139,16 @@ def sanitize_names(message):
 
 def check_bad_landing_page(soup):
     # s = soup.prettify()
-    if not soup.title:
+    context = page_context(soup)
+    if not context.title:
         return True
-    elif canonical := soup.select_one('link[rel=canonical]'):
+    elif canonical := context.link('canonical'):
         if 'cookieAbsent' in canonical['href']:
             return True
-    return any(['Redirecting' in soup.title.text,
-                'Just a moment' in soup.title.text,
-                soup.title.text.strip().startswith('Login |'),
+    title = context.title_text
+    return any(['Redirecting' in title,
+                'Just a moment' in title,
+                title.strip().startswith('Login |'),
                 ])
 
 
@@ -197,6 +197,11 @@ def stage_whole_goldie_before_after(since: str, sha: str, sample: int | None,
 
     Stashes the current working tree, checks out `since`, runs eval, checks out
     `sha`, runs eval, restores stash + branch.
+
+    Both runs go through whole_goldie_eval's result cache
+    (mismatches/parse-cache/, git-ignored, so the stash leaves it in place):
+    each only re-parses the rows whose HTML or parsers differ from a parse
+    already cached, typically those of the publishers the commit touched.
     """
     rc, current_branch, _ = git("rev-parse", "--abbrev-ref", "HEAD")
     if rc != 0:
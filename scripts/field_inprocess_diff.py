@@ -58,7 +58,6 @@ _PARSELAND_EVAL_PATH = os.environ.get(
 )
 sys.path.insert(0, _PARSELAND_EVAL_PATH)
 
-import boto3  # noqa: E402
 import requests  # noqa: E402
 from bs4 import BeautifulSoup  # noqa: E402
 from dotenv import load_dotenv  # noqa: E402
@@ -69,6 +68,7 @@ from parseland_eval.score.abstract import score_abstract  # noqa: E402
 from parseland_eval.score.affiliations import score_affiliations  # noqa: E402
 from parseland_eval.score.authors import score_authors, score_corresponding  # noqa: E402
 from parseland_eval.score.pdf_url import score_pdf_url  # noqa: E402
+from parseland_lib.clients import r2_client  # noqa: E402
 from parseland_lib.legacy_parse_utils.fulltext import (  # noqa: E402
     parse_publisher_fulltext_location,
 )
@@ -237,14 +237,7 @@ def resolve_latest_harvest_uuid(doi: str, spec: PublisherSpec) -> str | None:
 
 def _make_r2_client():
     load_dotenv(str(REPO_ROOT / ".env"), override=True)
-    account_id = os.environ["R2_ACCOUNT_ID"]
-    return boto3.client(
-        "s3",
-        endpoint_url=f"https://{account_id}.r2.cloudflarestorage.com",
-        aws_access_key_id=os.environ["R2_ACCESS_KEY_ID"],
-        aws_secret_access_key=os.environ["R2_SECRET_ACCESS_KEY"],
-        region_name="auto",
-    )
+    return r2_client()
 
 
 def parse_in_process(html: str, parser_cls, skip_non_dispatched: bool = True) -> dict:
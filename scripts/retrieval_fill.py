@@ -26,11 +26,11 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import hashlib
 import json
 import os
 import sys
-import threading
 import time
 import traceback
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -54,10 +54,6 @@ TAXICAB_TIMEOUT_S = 15
 R2_TIMEOUT_S = 20
 
 
-# Thread-local boto3 client (boto3 clients are NOT thread-safe by default).
-_local = threading.local()
-
-
 def _doi_hash(doi: str) -> str:
     return hashlib.sha1(doi.lower().encode()).hexdigest()
 
@@ -66,20 +62,17 @@ def _cache_path(doi: str, cache_dir: Path) -> Path:
     return cache_dir / f"{_doi_hash(doi)}.html"
 
 
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    from dotenv import load_dotenv
+    load_dotenv(str(REPO_ROOT / ".env"), override=True)
+
+
 def _get_r2_client():
-    if not hasattr(_local, "s3"):
-        import boto3
-        from dotenv import load_dotenv
-        load_dotenv(str(REPO_ROOT / ".env"), override=True)
-        account_id = os.environ["R2_ACCOUNT_ID"]
-        _local.s3 = boto3.client(
-            "s3",
-            endpoint_url=f"https://{account_id}.r2.cloudflarestorage.com",
-            aws_access_key_id=os.environ["R2_ACCESS_KEY_ID"],
-            aws_secret_access_key=os.environ["R2_SECRET_ACCESS_KEY"],
-            region_name="auto",
-        )
-    return _local.s3
+    # one pooled client for the process; boto3 clients are thread-safe
+    from parseland_lib.clients import r2_client  # type: ignore
+    _load_env()
+    return r2_client()
 
 
 @dataclass
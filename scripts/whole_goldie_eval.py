@@ -16,7 +16,15 @@ Two modes:
          (Use sparingly — fetches 10K rows can take hours.)
 
 The HTML cache lives at mismatches/whole-goldie-cache/<sha1>.html keyed by
-the lowercased DOI, mirroring eval/html-cache/.
+the lowercased DOI, mirroring eval/html-cache/. `run --cache-dir` also takes
+a corpus pack built from it (`python -m parseland_eval corpus build`).
+
+`run` parses in --concurrency worker processes through a
+parseland_lib.result_cache.ResultCache at mismatches/parse-cache/ (git-ignored,
+so Shield's stash / checkout leaves it in place): a row is only parsed again
+if its HTML or a parser that could handle it changed since the cached parse,
+so Shield's before / after runs each re-parse only what the commit touched.
+`--no-result-cache` parses every row in threads, as before.
 
 Usage:
     python scripts/whole_goldie_eval.py run \\
@@ -33,13 +41,13 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import hashlib
 import json
 import os
 import re
 import sys
 import time
-import traceback
 from collections import Counter, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
@@ -65,6 +73,7 @@ ADAPTER_NAME = "whole_goldie_eval"
 ADAPTER_VERSION = "0.2.0"
 
 HTML_CACHE_DIR = REPO_ROOT / "mismatches" / "whole-goldie-cache"
+RESULT_CACHE_DIR = REPO_ROOT / "mismatches" / "parse-cache"
 FIELDS = ("authors", "affiliations", "abstract", "pdf_url", "corresponding")
 SSRN_NO_AFFILIATION = "affiliation not provided to ssrn"
 
@@ -77,7 +86,17 @@ def _cache_path(doi: str, cache_dir: Path) -> Path:
     return cache_dir / f"{_doi_hash(doi)}.html"
 
 
+@functools.lru_cache(maxsize=None)
+def _open_corpus(path: Path):
+    from parseland_lib.corpus import Corpus
+
+    return Corpus(path)
+
+
 def _read_cached(doi: str, cache_dir: Path) -> str | None:
+    if cache_dir.is_file():
+        # a corpus pack (parseland_lib.corpus) built from the cache dir
+        return _open_corpus(cache_dir).get_text(doi=doi)
     p = _cache_path(doi, cache_dir)
     if not p.exists():
         return None
@@ -297,15 +316,55 @@ def _empty_branch(gold_empty: bool, parsed_empty: bool) -> str:
     return "gold_present_parser_present"
 
 
-def _parse_and_score(row: GoldRowLite, cache_dir: Path) -> dict[str, Any]:
-    from parseland_lib.parse import parse_page  # type: ignore[import-not-found]
+def _parse(html: str, link: str) -> tuple[dict[str, Any] | None, str | None, float]:
+    from parseland_lib.parse import format_error, parse_page  # type: ignore[import-not-found]
+
+    start = time.perf_counter()
+    parsed = None
+    err = None
+    try:
+        parsed = parse_page(html, namespace="doi", resolved_url=link)
+    except Exception as exc:  # noqa: BLE001
+        err = format_error(exc)
+    return parsed, err, (time.perf_counter() - start) * 1000.0
+
+
+def _parse_cached(rows: list[GoldRowLite], cache_dir: Path, result_cache: Path,
+                  workers: int) -> dict[int, tuple[dict[str, Any] | None, str | None, float]]:
+    """(parsed, error, duration_ms) of every row with usable HTML, by row
+    index, parsed in `workers` processes through the ResultCache."""
+    from parseland_lib.result_cache import ResultCache, parse_pages_cached  # type: ignore[import-not-found]
+
+    def pages():
+        for i, row in enumerate(rows):
+            html = _read_cached(row.doi, cache_dir)
+            if not _html_block_reason(html):
+                yield i, html, "doi", row.link
+
+    cache = ResultCache(result_cache)
+    parses = {
+        result.key: (result.parsed, result.error, duration_ms)
+        for result, duration_ms in parse_pages_cached(pages(), cache, workers=workers)
+    }
+    print(f"result cache {result_cache}: {cache.hits} hits, {cache.rechecked} rechecked, "
+          f"{cache.misses} parsed", file=sys.stderr)
+    return parses
+
+
+def _parse_and_score(row: GoldRowLite, cache_dir: Path,
+                     parse: tuple[dict[str, Any] | None, str | None, float] | None = None) -> dict[str, Any]:
+    """Score a row; parse is its (parsed, error, duration_ms) if it was
+    parsed already, otherwise its cached HTML is read and parsed here."""
     from parseland_eval.score.abstract import score_abstract
     from parseland_eval.score.affiliations import score_affiliations
     from parseland_eval.score.authors import score_authors, score_corresponding
     from parseland_eval.score.pdf_url import score_pdf_url
 
-    html = _read_cached(row.doi, cache_dir)
-    block_reason = _html_block_reason(html)
+    if parse is None:
+        html = _read_cached(row.doi, cache_dir)
+        block_reason = _html_block_reason(html)
+    else:
+        block_reason = None
     if block_reason:
         return {
             "no": row.no,
@@ -321,14 +380,7 @@ def _parse_and_score(row: GoldRowLite, cache_dir: Path) -> dict[str, Any]:
             "score": {},
         }
 
-    start = time.perf_counter()
-    parsed = None
-    err = None
-    try:
-        parsed = parse_page(html, namespace="doi", resolved_url=row.link)
-    except Exception as exc:  # noqa: BLE001
-        err = f"{type(exc).__name__}: {exc}\n{traceback.format_exc(limit=3)}"
-    duration_ms = (time.perf_counter() - start) * 1000.0
+    parsed, err, duration_ms = parse if parse is not None else _parse(html, row.link)
 
     gold_authors = _to_gold_authors(row.authors)
     parsed_authors = (parsed or {}).get("authors") or []
@@ -661,6 +713,7 @@ def run_eval(
     publishers: set[str] | None = None,
     cache_dir: Path = HTML_CACHE_DIR,
     concurrency: int = 4,
+    result_cache: Path | None = RESULT_CACHE_DIR,
     run_id: str | None = None,
 ) -> dict:
     run_id = run_id or new_run_id()
@@ -673,7 +726,15 @@ def run_eval(
     rows = _iter_corpus(corpus_path, limit, publishers, reg_cache)
     rows_out: list[dict] = []
 
-    if concurrency <= 1:
+    if result_cache is not None:
+        parses = _parse_cached(rows, cache_dir, result_cache, max(concurrency, 1))
+        for i, r in enumerate(rows):
+            rows_out.append(_parse_and_score(r, cache_dir, parses.get(i)))
+            if (i + 1) % 100 == 0:
+                emit(run_id=run_id, action="whole_goldie.progress",
+                     agent_name="whole_goldie_eval",
+                     progress_current=i + 1, progress_total=len(rows))
+    elif concurrency <= 1:
         for i, r in enumerate(rows):
             rows_out.append(_parse_and_score(r, cache_dir))
             if (i + 1) % 100 == 0:
@@ -748,6 +809,7 @@ def cmd_run(args: argparse.Namespace) -> int:
         publishers=publishers,
         cache_dir=args.cache_dir,
         concurrency=args.concurrency,
+        result_cache=None if args.no_result_cache else args.result_cache,
         run_id=args.run_id,
     )
     s = run_obj["summary"]["overall"]
@@ -774,6 +836,7 @@ def cmd_fetch(args: argparse.Namespace) -> int:
     """
     sys.path.insert(0, str(REPO_ROOT / "scripts"))
     from field_inprocess_diff import (  # type: ignore  # noqa: E402
+        _make_r2_client,
         resolve_latest_harvest_uuid,
         PUBLISHER_REGISTRY,
     )
@@ -785,6 +848,7 @@ def cmd_fetch(args: argparse.Namespace) -> int:
     cache_dir = args.cache_dir
     cache_dir.mkdir(parents=True, exist_ok=True)
 
+    s3 = _make_r2_client()
     fetched = skipped = errors = 0
     for r in rows:
         p = _cache_path(r.doi, cache_dir)
@@ -803,11 +867,11 @@ def cmd_fetch(args: argparse.Namespace) -> int:
             if not uuid:
                 errors += 1
                 continue
-            html = get_landing_page_from_r2(uuid)
+            html = get_landing_page_from_r2(uuid, s3)
             if not html:
                 errors += 1
                 continue
-            p.write_text(html, encoding="utf-8", errors="replace")
+            p.write_bytes(html)
             fetched += 1
         except Exception as exc:  # noqa: BLE001
             errors += 1
@@ -829,6 +893,10 @@ def main() -> int:
     r.add_argument("--publishers", type=str, help="Comma-separated publisher_ids to include")
     r.add_argument("--cache-dir", type=Path, default=HTML_CACHE_DIR)
     r.add_argument("--concurrency", type=int, default=4)
+    r.add_argument("--result-cache", type=Path, default=RESULT_CACHE_DIR,
+                   help="ResultCache directory (shared with `parseland_eval run --result-cache`)")
+    r.add_argument("--no-result-cache", action="store_true",
+                   help="Parse every row in --concurrency threads")
     r.add_argument("--run-id", type=str)
     r.set_defaults(func=cmd_run)
 
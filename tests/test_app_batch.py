@@ -0,0 +1,128 @@
+"""POST /parseland/batch and get_dynamodb_records.
+
+Fake R2 / DynamoDB clients only; pages are parsed in-process.
+"""
+from __future__ import annotations
+
+import json
+import uuid
+
+import pytest
+
+import app as app_module
+from parseland_lib.dynamodb import get_dynamodb_records
+
+HTML = """<html><head>
+<meta name="citation_author" content="Doe, Jane">
+</head><body></body></html>"""
+
+
+class FakeDynamo:
+    def __init__(self, items, unprocessed_once=()):
+        self.items = items
+        self.unprocessed_once = set(unprocessed_once)
+        self.calls = []
+
+    def batch_get_item(self, RequestItems):
+        keys = [key['id']['S'] for key in RequestItems['harvested-html']['Keys']]
+        self.calls.append(keys)
+        retry = [k for k in keys if k in self.unprocessed_once]
+        self.unprocessed_once -= set(retry)
+        found = [{'id': {'S': k}, **self.items[k]}
+                 for k in keys if k in self.items and k not in retry]
+        response = {'Responses': {'harvested-html': found}}
+        if retry:
+            response['UnprocessedKeys'] = {
+                'harvested-html': {'Keys': [{'id': {'S': k}} for k in retry]}}
+        return response
+
+
+def _item(namespace, resolved_url):
+    return {'native_id_namespace': {'S': namespace},
+            'resolved_url': {'S': resolved_url}}
+
+
+def test_get_dynamodb_records_chunks_and_retries_unprocessed_keys():
+    ids = [str(i) for i in range(150)]
+    dynamo = FakeDynamo({'3': _item('doi', 'https://example.org/3')},
+                        unprocessed_once={'3'})
+
+    records = get_dynamodb_records(ids, dynamo)
+
+    assert [len(call) for call in dynamo.calls] == [100, 1, 50]
+    assert records['3'] == {'resolved_url': 'https://example.org/3',
+                            'namespace': 'doi'}
+    assert records['149'] == {'resolved_url': None, 'namespace': None}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app_module, 'BATCH_PARSE_WORKERS', 1)
+    app_module.app.config["TESTING"] = True
+    with app_module.app.test_client() as test_client:
+        yield test_client
+
+
+def _lines(resp):
+    return {line['id']: line for line in map(
+        json.loads, resp.get_data(as_text=True).splitlines())}
+
+
+def test_batch_streams_results_and_per_item_errors(client, monkeypatch):
+    found, pdf = str(uuid.uuid4()), str(uuid.uuid4())
+    dynamo = FakeDynamo({found: _item('doi', 'https://example.org/x')})
+    pages = {found: HTML, pdf: None}
+    monkeypatch.setattr(app_module, 'dynamodb_client', lambda: dynamo)
+    monkeypatch.setattr(app_module, 'get_guarded_landing_page_from_r2',
+                        lambda harvest_id, s3: pages[harvest_id])
+
+    resp = client.post('/parseland/batch', json={
+        'ids': [found, pdf, 'not-a-uuid'],
+        'pages': [{'id': 'inline', 'html': HTML}, {'html': HTML}],
+    })
+
+    assert resp.status_code == 200
+    assert resp.mimetype == 'application/x-ndjson'
+    lines = _lines(resp)
+    assert lines[found]['result']['authors'][0]['name'] == 'Doe, Jane'
+    assert lines['inline']['result']['authors'][0]['name'] == 'Doe, Jane'
+    assert lines[pdf] == {'id': pdf, 'error': 'No landing page found'}
+    assert lines['not-a-uuid']['error'] == 'Invalid harvest id'
+    assert lines[None]['error'] == 'No id or html in page'
+    assert dynamo.calls == [[found, pdf]]
+
+
+def test_batch_rejects_empty_and_oversized_requests(client, monkeypatch):
+    monkeypatch.setattr(app_module, 'MAX_BATCH_SIZE', 2)
+
+    assert client.post('/parseland/batch', json={}).status_code == 400
+    assert client.post('/parseland/batch', json={
+        'ids': [str(uuid.uuid4()) for _ in range(3)]}).status_code == 400
+
+
+def test_batch_reports_pages_left_at_the_deadline(client, monkeypatch):
+    monkeypatch.setattr(app_module, 'BATCH_DEADLINE_SECONDS', 0)
+
+    resp = client.post('/parseland/batch', json={
+        'ids': ['not-a-uuid'],
+        'pages': [{'id': 'a', 'html': HTML}, {'id': 'b', 'html': HTML}],
+    })
+
+    lines = resp.get_data(as_text=True).splitlines()
+    assert json.loads(lines[0]) == {'id': 'not-a-uuid', 'error': 'Invalid harvest id'}
+    assert _lines(resp) == {
+        'not-a-uuid': {'id': 'not-a-uuid', 'error': 'Invalid harvest id'},
+        'a': {'id': 'a', 'error': 'Batch deadline exceeded'},
+        'b': {'id': 'b', 'error': 'Batch deadline exceeded'},
+    }
+
+
+def test_batch_answers_repeated_and_unhashable_inline_ids(client):
+    resp = client.post('/parseland/batch', json={
+        'pages': [{'id': 'same', 'html': HTML}, {'id': 'same', 'html': HTML},
+                  {'id': ['a', 1], 'html': HTML}],
+    })
+
+    lines = [json.loads(line) for line in resp.get_data(as_text=True).splitlines()]
+    assert sorted(map(str, (line['id'] for line in lines))) == ["['a', 1]", 'same', 'same']
+    assert all('result' in line for line in lines)
@@ -87,3 +87,17 @@ def test_post_parseland_missing_html_returns_400(client):
     assert resp.status_code == 400
     body = resp.get_json()
     assert "msg" in body
+
+
+def test_post_parseland_server_timing_is_opt_in(client, monkeypatch):
+    """PARSELAND_SERVER_TIMING adds the parse's stage timings as a
+    Server-Timing header; it is off by default."""
+    resp = client.post("/parseland", json={"html": MINIMAL_HTML, "namespace": "doi"})
+    assert "Server-Timing" not in resp.headers
+
+    monkeypatch.setattr("app.SERVER_TIMING", True)
+    resp = client.post("/parseland", json={"html": MINIMAL_HTML, "namespace": "doi"})
+    assert resp.status_code == 200
+    metrics = [metric.split(";")[0] for metric in resp.headers["Server-Timing"].split(", ")]
+    assert metrics[0] == "parse_page"
+    assert {"soup", "authors_and_abstract", "fulltext_location"} <= set(metrics)
@@ -0,0 +1,77 @@
+"""cleanup_soup returns a CleanedSoup view and leaves the soup untouched.
+
+Offline tests; soup is built from inline HTML.
+"""
+from bs4 import BeautifulSoup
+
+from parseland_lib.legacy_parse_utils.fulltext import \
+    parse_publisher_fulltext_location
+from parseland_lib.legacy_parse_utils.strings import CleanedSoup, cleanup_soup
+from parseland_lib.legacy_parse_utils.version_and_license import \
+    detect_sd_author_manuscript
+
+HTML = """
+<html><head>
+<meta property="og:url" content="https://onlinelibrary.wiley.com/doi/10.1002/x">
+<script>var pdf = "/inline.pdf";</script>
+</head><body>
+<div class="hubpage-menu"><a href="/menu.pdf">Menu PDF</a></div>
+<div class="table-of-content"><a href="/toc.pdf">Chapter PDF</a></div>
+<ul><li class="linked-article__item">Related</li><li>Kept</li></ul>
+<a href="/article.pdf">Download PDF</a>
+</body></html>
+"""
+
+
+def _soup():
+    return BeautifulSoup(HTML, "lxml")
+
+
+def _extracted(soup):
+    # the document as the old, destructive cleanup_soup left it
+    for tag in (soup("script") + soup.find_all("div", class_="table-of-content")
+                + soup.find_all("li", class_="linked-article__item")
+                + soup.find_all("div", class_="hubpage-menu")):
+        tag.extract()
+    return soup
+
+
+def test_view_serializes_like_the_extracted_soup():
+    soup = _soup()
+    before = str(soup)
+
+    cleaned = cleanup_soup(soup)
+
+    assert isinstance(cleaned, CleanedSoup)
+    assert str(soup) == before
+    assert str(cleaned) == str(_extracted(_soup()))
+
+
+def test_view_select_and_text_skip_removed_nodes():
+    cleaned = cleanup_soup(_soup())
+
+    assert [a["href"] for a in cleaned.select("a")] == ["/article.pdf"]
+    assert cleaned.select_one("li").text == "Kept"
+
+
+def test_view_text_reads_the_cleaned_document():
+    html = ('<span>View Open Manuscript'
+            '<div class="table-of-content">x</div></span>')
+
+    assert detect_sd_author_manuscript(
+        cleanup_soup(BeautifulSoup(html, "lxml"))) == "open (author manuscript)"
+    assert detect_sd_author_manuscript(BeautifulSoup(html, "lxml")) is None
+
+
+def test_fulltext_parse_does_not_mutate_the_soup():
+    soup = _soup()
+    before = str(soup)
+
+    first = parse_publisher_fulltext_location(
+        soup, "https://onlinelibrary.wiley.com/doi/10.1002/x")
+    second = parse_publisher_fulltext_location(
+        soup, "https://onlinelibrary.wiley.com/doi/10.1002/x")
+
+    assert str(soup) == before
+    assert first == second
+    assert first["pdf_url"] == "https://onlinelibrary.wiley.com/article.pdf"
@@ -0,0 +1,23 @@
+from parseland_lib import clients
+
+
+def test_clients_are_shared_per_process(monkeypatch):
+    monkeypatch.setattr(clients, '_clients', {})
+    assert clients.r2_client() is clients.r2_client()
+    assert clients.dynamodb_client() is clients.dynamodb_client()
+    assert clients.r2_client() is not clients.dynamodb_client()
+
+
+def test_forked_child_builds_its_own_clients(monkeypatch):
+    monkeypatch.setattr(clients, '_clients', {})
+    before = clients.r2_client()
+    clients._forget_clients()
+    assert clients.r2_client() is not before
+
+
+def test_client_config():
+    config = clients.dynamodb_client().meta.config
+    assert config.max_pool_connections == clients.DYNAMODB_MAX_POOL_CONNECTIONS
+    assert config.retries['mode'] == 'adaptive'
+    assert config.tcp_keepalive is True
+    assert config.connect_timeout == clients.CONNECT_TIMEOUT_SECONDS
@@ -0,0 +1,139 @@
+"""Corpus packs: packed, content-addressed landing pages for offline eval.
+
+Offline tests; pages are inline HTML and R2 is a fake client.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import uuid
+
+import pytest
+
+from parseland_lib import corpus as corpus_module
+from parseland_lib.corpus import CODEC_GZIP, Corpus, CorpusWriter, \
+    import_cache_dir, import_r2
+
+PAGE_A = "<html><body><p>Ünïcode page A</p></body></html>"
+PAGE_B = "<html><body><p>page B</p></body></html>"
+HARVEST = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+
+def _pack(tmp_path, pages, name="corpus.pack"):
+    path = tmp_path / name
+    with CorpusWriter(path, codec=CODEC_GZIP) as writer:
+        for html, kwargs in pages:
+            writer.add(html, **kwargs)
+    return path
+
+
+def test_random_access_by_doi_and_harvest_id(tmp_path):
+    path = _pack(tmp_path, [
+        (PAGE_A, {"doi": "10.1/A", "harvest_id": HARVEST,
+                  "resolved_url": "https://example.org/a"}),
+        (PAGE_B, {"doi": "10.1/b"}),
+    ])
+
+    with Corpus(path) as corpus:
+        assert corpus.get_text(doi="10.1/a") == PAGE_A
+        assert corpus.get(harvest_id=str(HARVEST).upper()) == PAGE_A.encode()
+        assert corpus.get_text(doi="10.1/B") == PAGE_B
+        assert corpus.get(doi="10.1/missing") is None
+        assert "10.1/b" in corpus and "10.1/c" not in corpus
+
+
+def test_streams_pages_in_order_added(tmp_path):
+    path = _pack(tmp_path, [(PAGE_B, {"doi": "10.1/b"}),
+                            (PAGE_A, {"harvest_id": HARVEST})])
+
+    with Corpus(path) as corpus:
+        pages = list(corpus)
+    assert [(p.doi, p.harvest_id, p.text) for p in pages] == [
+        ("10.1/b", None, PAGE_B), (None, str(HARVEST), PAGE_A)]
+
+
+def test_identical_pages_are_stored_once(tmp_path):
+    path = _pack(tmp_path, [(PAGE_A, {"doi": f"10.1/{n}"}) for n in range(5)])
+
+    with Corpus(path) as corpus:
+        stats = corpus.stats()
+        assert (stats["entries"], stats["pages"], stats["keys"]) == (5, 1, 5)
+        assert corpus.get_text(doi="10.1/4") == PAGE_A
+
+
+def test_packs_are_reproducible(tmp_path):
+    pages = [(PAGE_A, {"doi": "10.1/a"}), (PAGE_B, {"harvest_id": HARVEST})]
+    first = _pack(tmp_path, pages, "first.pack")
+    second = _pack(tmp_path, pages, "second.pack")
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_failed_write_leaves_no_pack(tmp_path):
+    path = tmp_path / "corpus.pack"
+    with pytest.raises(RuntimeError):
+        with CorpusWriter(path, codec=CODEC_GZIP) as writer:
+            writer.add(PAGE_A, doi="10.1/a")
+            raise RuntimeError("interrupted")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_rejects_files_that_are_not_packs(tmp_path):
+    path = tmp_path / "page.html"
+    path.write_bytes(PAGE_A.encode() * 4)
+    with pytest.raises(ValueError):
+        Corpus(path)
+
+
+def test_import_cache_dir(tmp_path):
+    cache = tmp_path / "html-cache"
+    cache.mkdir()
+    for doi, html in (("10.1/Known", PAGE_A), ("10.1/unknown", PAGE_B)):
+        digest = hashlib.sha1(doi.lower().encode()).hexdigest()
+        (cache / f"{digest}.html").write_text(html, encoding="utf-8")
+
+    path = tmp_path / "corpus.pack"
+    with CorpusWriter(path, codec=CODEC_GZIP) as writer:
+        assert import_cache_dir(writer, cache, dois=["10.1/known"]) == 2
+
+    with Corpus(path) as corpus:
+        assert corpus.get_text(doi="10.1/KNOWN") == PAGE_A
+        assert corpus.get_text(doi="10.1/unknown") == PAGE_B
+        assert sorted(str(p.doi) for p in corpus) == ["10.1/known", "None"]
+
+
+class FakeS3:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get_object(self, Bucket, Key):
+        harvest_id = Key.removesuffix(".html.gz")
+        if harvest_id not in self.pages:
+            raise KeyError(harvest_id)
+        return {"Body": io.BytesIO(gzip.compress(self.pages[harvest_id].encode()))}
+
+
+def test_import_r2(tmp_path):
+    ids = [str(uuid.uuid4()) for _ in range(3)]
+    s3 = FakeS3({ids[0]: PAGE_A, ids[2]: PAGE_B})
+
+    path = tmp_path / "corpus.pack"
+    with CorpusWriter(path, codec=CODEC_GZIP) as writer:
+        failed = import_r2(writer, [(f"10.1/{n}", harvest_id, None)
+                                    for n, harvest_id in enumerate(ids)],
+                           s3=s3, max_workers=2)
+
+    assert [harvest_id for harvest_id, _ in failed] == [ids[1]]
+    with Corpus(path) as corpus:
+        assert corpus.get_text(harvest_id=ids[0]) == PAGE_A
+        assert corpus.get_text(doi="10.1/2") == PAGE_B
+        assert len(corpus) == 2
+
+
+@pytest.mark.skipif(corpus_module.zstandard is None, reason="zstandard not installed")
+def test_zstd_frames(tmp_path):
+    path = tmp_path / "corpus.pack"
+    with CorpusWriter(path, codec=corpus_module.CODEC_ZSTD) as writer:
+        writer.add(PAGE_A, doi="10.1/a")
+    with Corpus(path) as corpus:
+        assert corpus.get_text(doi="10.1/a") == PAGE_A
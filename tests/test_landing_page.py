@@ -0,0 +1,67 @@
+"""LandingPage: one serialization and one lxml tree per landing page.
+
+Offline tests; soup is built from inline HTML.
+"""
+from bs4 import BeautifulSoup
+
+from parseland_lib.legacy_parse_utils import strings
+from parseland_lib.legacy_parse_utils.fulltext import \
+    parse_publisher_fulltext_location
+from parseland_lib.legacy_parse_utils.pdf import get_useful_links
+from parseland_lib.legacy_parse_utils.strings import LandingPage, get_tree
+from parseland_lib.legacy_parse_utils.version_and_license import \
+    page_potential_license_text
+
+HTML = """
+<html><head>
+<meta name="citation_pdf_url" content="https://example.org/article.pdf">
+<meta name="citation_reference" content="Someone else's CC-BY paper">
+</head><body>
+<div class="references"><a href="/other.pdf">Download PDF</a></div>
+<a href="/article.pdf">Download PDF</a>
+<button onclick="location='https://example.org/button.pdf'">PDF</button>
+<p>This article is licensed under a Creative Commons Attribution license.</p>
+</body></html>
+"""
+
+
+def _soup():
+    return BeautifulSoup(HTML, "lxml")
+
+
+def test_page_is_serialized_and_parsed_once(monkeypatch):
+    calls = []
+    parse_tree = strings._parse_tree
+    monkeypatch.setattr(strings, "_parse_tree",
+                        lambda page: calls.append(page) or parse_tree(page))
+
+    result = parse_publisher_fulltext_location(_soup(),
+                                               "https://example.org/article")
+
+    assert result["pdf_url"] == "https://example.org/article.pdf"
+    assert len(calls) == 1
+
+
+def test_writable_tree_leaves_shared_tree_untouched():
+    page = LandingPage(_soup())
+
+    links = [link.href for link in get_useful_links(page)]
+
+    assert "/other.pdf" not in links
+    assert "/article.pdf" in links
+    assert "https://example.org/button.pdf" in links
+    assert page.tree.xpath("//div[@class='references']/a")
+    assert get_tree(page) is page.tree
+    assert get_tree(page, writable=True) is not page.tree
+
+
+def test_helpers_give_the_same_answer_for_strings_and_pages():
+    soup = _soup()
+    page = LandingPage(soup)
+
+    assert page.html == str(soup)
+    assert page_potential_license_text(page) == \
+        page_potential_license_text(str(soup))
+    assert "citation_reference" not in page_potential_license_text(page)
+    assert [(l.href, l.anchor) for l in get_useful_links(page)] == \
+        [(l.href, l.anchor) for l in get_useful_links(str(soup))]
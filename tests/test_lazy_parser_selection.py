@@ -0,0 +1,58 @@
+"""get_authors_and_abstract defers parse() until selection needs it.
+
+Springer.authors_found() is unconditionally true, so before lazy selection
+its full parse() ran on every DOI page. Once a publisher-specific parser
+yields affiliations, no non-specific parser should be parsed at all.
+"""
+from bs4 import BeautifulSoup
+
+from parseland_lib.parse_publisher_authors_abstract import (
+    LazyParse,
+    get_authors_and_abstract,
+)
+from parseland_lib.publisher.parsers.springer import Springer
+
+
+def test_non_specific_parsers_are_not_parsed_when_specific_parser_wins(monkeypatch):
+    calls = []
+    original = Springer.parse
+
+    def spy(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(Springer, "parse", spy)
+    # TheAstronomicalJournal is publisher-specific and finds affiliations
+    soup = BeautifulSoup(
+        '<html><head>'
+        '<meta name="citation_journal_title" content="The Astronomical Journal">'
+        '</head><body><ul><li class="author"><a>Jane Doe</a>'
+        '<span class="affiliation">(Example University)</span></li></ul>'
+        '</body></html>', "lxml")
+
+    result = get_authors_and_abstract(soup, "doi")
+
+    assert result["authors"][0]["name"] == "Jane Doe"
+    assert calls == []
+
+
+def test_lazy_parse_memoizes_result_and_failure():
+    class Counting:
+        calls = 0
+
+        def parse(self):
+            Counting.calls += 1
+            return {"authors": [], "abstract": "x"}
+
+    class Failing:
+        def parse(self):
+            raise ValueError("boom")
+
+    lazy = LazyParse(Counting())
+    assert lazy.result() == lazy.result() == {"authors": [], "abstract": "x"}
+    assert Counting.calls == 1
+    assert not lazy.failed
+
+    failing = LazyParse(Failing())
+    assert failing.result() is None
+    assert failing.failed
@@ -0,0 +1,120 @@
+"""Compiled link rule tables in legacy_parse_utils.
+
+Offline tests; links are built by hand.
+"""
+from bs4 import BeautifulSoup
+
+from parseland_lib.legacy_parse_utils.pdf import DuckLink, clean_pdf_url, \
+    find_normalized_license, has_bad_anchor_word, has_bad_href_word, \
+    is_known_bad_link, trust_publisher_license
+from parseland_lib.legacy_parse_utils.rules import GatedPatterns, HostRules, \
+    OrderedLookups, SubstringSet
+from parseland_lib.legacy_parse_utils.version_and_license import detect_hybrid
+
+
+def test_substring_set_matches_like_any_in():
+    words = ["Sample Pages", "faq", "download MODS"]
+    blacklist = SubstringSet(words)
+
+    for text in ["sample pages (pdf)", "FAQ", "Download mods", "Full text"]:
+        assert (text in blacklist) == any(
+            word.lower() in text.lower() for word in words)
+    assert "" not in blacklist
+    assert "FAQ" not in SubstringSet(words, ignore_case=False)
+
+
+def test_host_rules_keep_declaration_order_and_parent_domains():
+    rules = HostRules([
+        (["example.org"], "parent"),
+        ([], "everywhere"),
+        (["www.example.org", "example.org"], "www"),
+        (["other.org"], "other"),
+    ])
+
+    assert rules.rules_for("https://www.example.org/x") == [
+        "parent", "everywhere", "www"]
+    assert rules.rules_for("/relative/path") == ["everywhere"]
+
+
+def test_blacklists():
+    assert has_bad_href_word("https://example.org/files/BookTOC.pdf")
+    assert has_bad_href_word("https://www.jmir.org/x/jmir_v21i9e15011_app1.pdf")
+    assert not has_bad_href_word(
+        "https://onlinelibrary.wiley.com/doi/pdf/10.1002/9781118.fmatter")
+    assert not has_bad_href_word("https://example.org/article.pdf")
+    assert has_bad_anchor_word("View PDF flyer")
+    assert not has_bad_anchor_word("download pdf")
+
+
+def test_known_bad_links_only_checked_for_their_site():
+    abstract = DuckLink("https://repositorio.uchile.cl/item_12.pdf", "pdf")
+    meta = DuckLink("https://cora.ucc.ie/bitstream/1/a.pdf",
+                    "<meta citation_pdf_url>")
+
+    assert is_known_bad_link("https://repositorio.uchile.cl/handle/1", abstract)
+    assert not is_known_bad_link("https://example.org/handle/1", abstract)
+    assert is_known_bad_link("https://example.org/x", meta)
+    assert not is_known_bad_link("https://repositorio.uchile.cl/handle/1", meta)
+
+
+def test_clean_pdf_url_rewrites_by_host():
+    link = DuckLink("https://www.tandfonline.com/doi/full/10.1080/x", "pdf")
+
+    assert clean_pdf_url(link.href, link)[0] == \
+        "https://www.tandfonline.com/doi/pdf/10.1080/x"
+    assert clean_pdf_url("https://example.org/doi/full/10.1/x",
+                         DuckLink("x", "pdf"))[0] == \
+        "https://example.org/doi/full/10.1/x"
+
+
+def test_untrusted_license_hosts():
+    assert not trust_publisher_license("https://www.berghahnjournals.com/view")
+    assert trust_publisher_license("https://example.org/view")
+
+
+def test_gated_patterns_return_the_last_matching_pattern():
+    patterns = GatedPatterns([
+        ("open access", r"open access (\w+)"),
+        ("licensed under", r"licensed under (\w+)"),
+        ("never", r"never (\w+)"),
+    ])
+
+    assert patterns.last_match("Open Access one, licensed under two").group(1) == "two"
+    assert patterns.last_match("OPEN ACCESS one").group(1) == "one"
+    # 'ı' matches 'i' case-insensitively but does not lower() to it
+    assert patterns.last_match("lıcensed under three").group(1) == "three"
+    assert patterns.last_match("nothing here") is None
+    assert patterns.last_match("") is None
+
+
+def test_ordered_lookups_keep_priority_across_anchor_groups():
+    lookups = OrderedLookups([
+        ("ccbyncnd", "cc-by-nc-nd"),
+        ("publicdomain", "public-domain"),
+        ("ccby", "cc-by"),
+    ], anchors=("ccby",))
+
+    assert lookups.first("publicdomain ccbyncnd") == "cc-by-nc-nd"
+    assert lookups.first("ccby publicdomain") == "public-domain"
+    assert lookups.first("ccby") == "cc-by"
+    assert lookups.first("cc by") is None
+
+
+def test_find_normalized_license():
+    assert find_normalized_license("Licensed CC BY-NC-ND 4.0") == "cc-by-nc-nd"
+    assert find_normalized_license("creativecommons.org/licenses/by/4.0") == "cc-by"
+    assert find_normalized_license("works not in the public domain") is None
+    assert find_normalized_license("MIT") is None
+    assert find_normalized_license("MIT", is_dataset=True) == "mit"
+
+
+def test_detect_hybrid_license_text():
+    text = ("This is an open access article under the terms of the "
+            "Creative Commons Attribution License, which permits use")
+
+    soup = BeautifulSoup("<html><body><p>article</p></body></html>", "lxml")
+
+    assert detect_hybrid(soup, text, "https://example.org/a") == (
+        "open (via page says license)", "cc-by")
+    assert detect_hybrid(soup, "no license", "https://example.org/a") == (
+        None, None)
@@ -0,0 +1,107 @@
+"""PageContext: per-page index of head metadata.
+
+Offline tests; soup is built from inline HTML.
+"""
+from bs4 import BeautifulSoup
+
+from parseland_lib.page_context import PageContext, page_context
+from parseland_lib.publisher.parsers.wiley import Wiley
+
+HTML = """
+<html><head>
+<title>An Article</title>
+<base href="https://example.org/">
+<link rel="stylesheet" href="/a.css">
+<link rel="canonical" href="https://onlinelibrary.wiley.com/doi/10.1002/x">
+<meta property="og:url" content="https://onlinelibrary.wiley.com/doi/10.1002/x">
+<meta name="og:site_name" content="Wiley Online Library">
+<meta name="citation_author" content="Doe, Jane">
+<meta name="citation_author" content="Roe, Richard">
+<meta name="DC.Description" content="Lower-cased lookups still find this">
+<script type="application/ld+json">{"@type": "ScholarlyArticle"}</script>
+<script type="application/ld+json">{not json</script>
+</head><body></body></html>
+"""
+
+
+def _soup():
+    return BeautifulSoup(HTML, "lxml")
+
+
+def test_indexes_head_metadata():
+    context = PageContext(_soup())
+
+    assert context.title_text == "An Article"
+    assert context.base["href"] == "https://example.org/"
+    assert context.canonical_href == "https://onlinelibrary.wiley.com/doi/10.1002/x"
+    assert [t["href"] for t in context.links("stylesheet")] == ["/a.css"]
+    assert context.og("og:url")["content"].startswith("https://onlinelibrary")
+    assert context.og("og:site_name")["content"] == "Wiley Online Library"
+    assert [t["content"] for t in context.metas_by("name", "citation_author")] == [
+        "Doe, Jane", "Roe, Richard"]
+    assert context.meta(name="dc.description") is None
+    assert context.meta_content(name="dc.description", case_sensitive=False) == (
+        "Lower-cased lookups still find this")
+
+
+def test_json_ld_is_decoded_lazily_and_skips_bad_blocks():
+    context = PageContext(_soup())
+
+    assert context.json_ld() == [{"@type": "ScholarlyArticle"}]
+
+
+def test_page_context_is_cached_per_soup():
+    soup = _soup()
+
+    assert page_context(soup) is page_context(soup)
+    assert page_context(soup) is not page_context(_soup())
+
+
+def test_parser_helpers_read_from_context():
+    parser = Wiley(_soup())
+
+    assert parser.context is page_context(parser.soup)
+    assert parser.domain_in_canonical_link("wiley.com")
+    assert parser.domain_in_meta_og_url("onlinelibrary.wiley.com")
+    assert parser.text_in_meta_og_site_name("Wiley Online Library")
+    assert parser.is_publisher_specific_parser()
+    assert [a["name"] for a in parser.parse_author_meta_tags()] == [
+        "Doe, Jane", "Roe, Richard"]
+
+
+SCRIPTS_HTML = """
+<html><head>
+<script type="application/ld+json">{"@type": "ScholarlyArticle"}</script>
+<script type="Application/LD+JSON">{"@type": "Dataset"}</script>
+<script id="__NEXT_DATA__" type="application/json">{"props": {}}</script>
+</head><body>
+<script>window.dataLayer.push({"content": {"a": 1}});</script>
+<script>var x = 1;</script>
+</body></html>
+"""
+
+
+def test_script_index_classifies_scripts_in_document_order():
+    scripts = PageContext(BeautifulSoup(SCRIPTS_HTML, "lxml")).scripts
+
+    assert len(list(scripts)) == 5
+    assert [text for _, text in scripts.of_type("application/ld+json")] == [
+        '{"@type": "ScholarlyArticle"}']
+    assert len(scripts.of_type("application/ld+json", case_sensitive=False)) == 2
+    assert scripts.with_id("__NEXT_DATA__")[1] == '{"props": {}}'
+    assert scripts.with_id("missing") is None
+    assert [text for _, text in scripts.containing("dataLayer.push")] == [
+        'window.dataLayer.push({"content": {"a": 1}});']
+
+
+def test_script_index_decodes_each_payload_once():
+    scripts = PageContext(BeautifulSoup(SCRIPTS_HTML, "lxml")).scripts
+    _, text = scripts.with_id("__NEXT_DATA__")
+
+    assert scripts.json(text) is scripts.json(str(text))
+    try:
+        scripts.json("{not json")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("decode errors must be raised")
@@ -0,0 +1,116 @@
+"""Per-page memoization of parser helpers and publisher detection."""
+from bs4 import BeautifulSoup
+
+from parseland_lib.legacy_parse_utils.version_and_license import detect_hybrid
+from parseland_lib.page_memo import memoized_on_page, page_memo
+from parseland_lib.parse_publisher_authors_abstract import get_authors_and_abstract
+from parseland_lib.publisher.parsers.generic import GenericPublisherParser
+from parseland_lib.publisher.parsers.ieee import IEEE
+from parseland_lib.publisher.parsers.oxford import Oxford
+
+IEEE_HTML = """
+<html><head>
+<link rel="canonical" href="https://ieeexplore.ieee.org/document/1">
+<meta property="og:description" content="An abstract.">
+</head><body><script>
+xplGlobal.document.metadata={"authors":[{"name":"Ada Lovelace","affiliation":["Analytical Engine Co"]}],"isOpenAccess":true};
+</script></body></html>
+"""
+
+
+def _soup(html):
+    return BeautifulSoup(html, "lxml")
+
+
+# not a direct PublisherParser subclass, so parser selection never scans it
+class CountingParser(GenericPublisherParser):
+    parser_name = "counting"
+    calls = []
+
+    def is_publisher_specific_parser(self):
+        CountingParser.calls.append("detect")
+        return bool(self.soup.find("meta", {"name": "x-counting-parser"}))
+
+    def authors_found(self):
+        return False
+
+    @memoized_on_page
+    def helper(self):
+        CountingParser.calls.append("helper")
+        return [self.soup.title.string]
+
+    def parse(self):
+        return {"authors": [], "abstract": None}
+
+
+def test_detection_is_evaluated_once_per_page():
+    CountingParser.calls = []
+    soup = _soup('<html><head><meta name="x-counting-parser"></head></html>')
+
+    assert CountingParser(soup).is_publisher_specific_parser() is True
+    assert CountingParser(soup).is_publisher_specific_parser() is True
+    assert CountingParser(_soup("<html></html>")).is_publisher_specific_parser() is False
+    assert CountingParser.calls == ["detect", "detect"]
+
+
+def test_memoized_helper_is_shared_between_instances():
+    CountingParser.calls = []
+    soup = _soup("<html><head><title>t</title></head></html>")
+
+    first = CountingParser(soup).helper()
+
+    assert CountingParser(soup).helper() is first
+    assert CountingParser.calls == ["helper"]
+    assert (CountingParser, "helper") in page_memo(soup)
+
+
+def test_failures_are_not_memoized():
+    soup = _soup("<html></html>")  # no <title>: helper raises
+
+    for _ in range(2):
+        try:
+            CountingParser(soup).helper()
+        except AttributeError:
+            pass
+    assert (CountingParser, "helper") not in page_memo(soup)
+
+
+def test_ieee_metadata_is_decoded_once_per_page(monkeypatch):
+    decoded = []
+    import parseland_lib.page_context as page_context_module
+    loads = page_context_module.json.loads
+    monkeypatch.setattr(page_context_module.json, "loads",
+                        lambda raw: decoded.append(raw) or loads(raw))
+    soup = _soup(IEEE_HTML)
+
+    result = get_authors_and_abstract(soup, "doi")
+    assert result["authors"][0].name == "Ada Lovelace"
+    assert detect_hybrid(soup, "", "https://ieeexplore.ieee.org/document/1") == (
+        "open (via page says Open Access)", "unspecified-oa")
+    assert page_memo(soup)[(IEEE, "is_publisher_specific_parser")] is True
+    assert IEEE(soup).get_json_data()["isOpenAccess"] is True
+    assert len(decoded) == 1
+
+
+def test_oxford_helpers_run_once_between_authors_found_and_parse(monkeypatch):
+    calls = []
+    original = Oxford._extract_schema_author_meta.__wrapped__
+
+    def spy(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(Oxford, "_extract_schema_author_meta",
+                        memoized_on_page(spy))
+    soup = _soup("""
+    <html><head>
+    <meta property="og:url" content="https://academic.oup.com/x/article/1">
+    <meta name="citation_author" content="Grace Hopper">
+    <meta name="citation_author_institution" content="Harvard University">
+    </head><body></body></html>
+    """)
+
+    parser = Oxford(soup)
+    assert parser.authors_found()
+    assert parser.parse()["authors"][0].affiliations == ["Harvard University"]
+    assert len(calls) == 1
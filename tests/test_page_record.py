@@ -0,0 +1,59 @@
+"""PageRecord / AuthorRecord: parser output normalized once, serialized to
+the parseland response shape."""
+import pickle
+
+import pytest
+
+from parseland_lib.elements import AuthorAffiliations, AuthorRecord, PageRecord
+from parseland_lib.parse import parse_page, parse_page_record
+
+FULLTEXT = {'pdf_url': 'https://example.org/x.pdf', 'license': 'cc-by',
+            'version': 'publishedVersion', 'oa_status': None,
+            'open_version_source_string': None}
+
+
+def test_dict_and_dataclass_authors_normalize_the_same():
+    from_dict = AuthorRecord.from_parsed(
+        {'name': 'Jane Doe', 'affiliations': ['Uni A'], 'is_corresponding': True})
+    from_dataclass = AuthorRecord.from_parsed(
+        AuthorAffiliations('Jane Doe', ['Uni A'], True))
+
+    assert from_dict == from_dataclass
+    assert from_dict.to_dict() == {
+        'name': 'Jane Doe', 'affiliations': [{'name': 'Uni A'}],
+        'is_corresponding': True}
+
+
+def test_records_are_slotted():
+    author = AuthorRecord('Jane Doe')
+
+    assert not hasattr(author, '__dict__')
+    with pytest.raises(AttributeError):
+        author.email = 'jane@example.org'
+
+
+@pytest.mark.parametrize('parsed, authors, abstract', [
+    (None, [], None),
+    ([{'name': 'A'}], [{'name': 'A', 'affiliations': [],
+                        'is_corresponding': None}], None),
+    ({'authors': [], 'abstract': 'Text'}, [], 'Text'),
+])
+def test_page_record_response_shape(parsed, authors, abstract):
+    response = PageRecord.from_parsed(parsed, FULLTEXT).to_dict()
+
+    assert response == {
+        'authors': authors,
+        'urls': [{'url': 'https://example.org/x.pdf', 'content_type': 'pdf'}],
+        'license': 'cc-by',
+        'version': 'publishedVersion',
+        'abstract': abstract,
+    }
+
+
+def test_parse_page_record_round_trips_through_pickle():
+    html = '<html><head><meta name="citation_author" content="Doe, Jane">' \
+           '</head><body></body></html>'
+    record = parse_page_record(html, 'doi', 'https://example.org/x')
+
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert record.to_dict() == parse_page(html, 'doi', 'https://example.org/x')
@@ -0,0 +1,57 @@
+"""parse_page budget: stages skipped once the budget runs out are listed in
+truncated_stages. Offline; pages are inline HTML."""
+from bs4 import BeautifulSoup
+
+from parseland_lib.budget import ParseBudget
+from parseland_lib.parse import parse_page
+from parseland_lib.parse_publisher_authors_abstract import \
+    get_authors_and_abstract
+
+HTML = """<html><head>
+<meta name="citation_author" content="Doe, Jane">
+<meta name="citation_pdf_url" content="https://example.org/x.pdf">
+</head><body></body></html>"""
+
+
+class OneCheckBudget(ParseBudget):
+    """Allows the first `checks` stage checks, then runs out."""
+
+    def __init__(self, checks):
+        super().__init__(seconds=1)
+        self.checks = checks
+
+    def expired(self):
+        self.checks -= 1
+        return self.checks < 0
+
+
+def test_no_budget_leaves_response_unchanged():
+    response = parse_page(HTML, "doi", "https://example.org/x")
+
+    assert "truncated_stages" not in response
+    assert response["authors"][0]["name"] == "Doe, Jane"
+    assert response["urls"][0]["url"] == "https://example.org/x.pdf"
+
+
+def test_spent_budget_truncates_every_stage():
+    response = parse_page(HTML, "doi", "https://example.org/x", budget=0)
+
+    assert response["authors"] == []
+    assert response["urls"] == []
+    assert response["truncated_stages"] == [
+        "publisher_parsers", "generic_parser", "pdf_link", "bronze", "hybrid"]
+
+
+def test_budget_running_out_during_the_parser_scan_keeps_later_stages_out():
+    soup = BeautifulSoup(HTML, "lxml")
+    budget = OneCheckBudget(checks=3)
+
+    assert get_authors_and_abstract(soup, "doi", budget) is None
+    assert budget.truncated_stages == ["publisher_parsers", "generic_parser"]
+
+
+def test_repository_pages_have_their_own_stage():
+    response = parse_page(HTML, "pmh", "https://example.org/x", budget=0)
+
+    assert response["truncated_stages"] == [
+        "repository_parsers", "generic_parser", "pdf_link"]
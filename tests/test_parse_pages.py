@@ -0,0 +1,68 @@
+"""parse_pages: batch parsing over a process pool.
+
+Offline tests; pages are inline HTML.
+"""
+from parseland_lib.parse import parse_page, parse_pages
+
+PAGE = """
+<html><head>
+<meta name="citation_author" content="Doe, Jane">
+<meta name="citation_pdf_url" content="https://example.org/{n}.pdf">
+</head><body></body></html>
+"""
+
+
+def _pages(count):
+    for n in range(count):
+        yield (n, PAGE.format(n=n), "doi", f"https://example.org/{n}")
+
+
+def test_results_match_parse_page_in_order():
+    results = list(parse_pages(_pages(7), workers=2, chunksize=2))
+
+    assert [r.key for r in results] == list(range(7))
+    for n, result in enumerate(results):
+        assert result.error is None
+        assert result.parsed == parse_page(
+            PAGE.format(n=n), "doi", f"https://example.org/{n}")
+
+
+def test_unordered_results_carry_their_keys():
+    results = parse_pages(_pages(7), workers=2, chunksize=3, ordered=False)
+
+    assert sorted(r.key for r in results) == list(range(7))
+
+
+def test_errors_are_isolated_per_page():
+    pages = [("ok", PAGE.format(n=1), "doi", None),
+             ("bad", None, "doi", None),
+             ("ok-too", PAGE.format(n=2), "doi", None)]
+
+    results = {r.key: r for r in parse_pages(pages, workers=1)}
+
+    assert results["ok"].parsed["urls"][0]["url"] == "https://example.org/1.pdf"
+    assert results["bad"].parsed is None
+    message, trace = results["bad"].error.split("\n", 1)
+    assert message == "TypeError: object of type 'NoneType' has no len()"
+    assert trace.startswith("Traceback (most recent call last):")
+    assert results["ok-too"].error is None
+
+
+def test_runs_in_a_caller_pool_and_stops_at_the_deadline():
+    import multiprocessing
+    import time
+
+    from parseland_lib.parse import parse_pool
+
+    pool = parse_pool(2, multiprocessing.get_context("spawn"))
+    try:
+        results = list(parse_pages(_pages(5), workers=2, chunksize=1, pool=pool,
+                                   deadline=time.monotonic() + 60))
+        assert [r.key for r in results] == list(range(5))
+
+        assert list(parse_pages(_pages(5), workers=2, pool=pool,
+                                deadline=time.monotonic())) == []
+        # the pool outlives the calls
+        assert len(list(parse_pages(_pages(2), workers=2, pool=pool))) == 2
+    finally:
+        pool.shutdown()
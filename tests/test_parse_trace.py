@@ -0,0 +1,75 @@
+"""ParseTrace: opt-in stage / parser timing of parse_page.
+
+Offline tests; pages are inline HTML.
+"""
+from parseland_lib.parse import parse_page, parse_pages
+from parseland_lib.trace import ParseTrace, active_trace, stage, traced
+
+PAGE = """
+<html><head>
+<meta name="citation_author" content="Doe, Jane">
+<meta name="citation_author_institution" content="MIT">
+<meta name="citation_pdf_url" content="https://example.org/a.pdf">
+</head><body><p>Creative Commons Attribution</p></body></html>
+"""
+
+
+def test_trace_records_stages_and_parsers():
+    trace = ParseTrace()
+    traced_result = parse_page(PAGE, "doi", "https://example.org/a", trace=trace)
+
+    assert traced_result == parse_page(PAGE, "doi", "https://example.org/a")
+    stages = trace.to_dict()["stages"]
+    for name in ("parse_page", "pretrim", "soup", "page_context",
+                 "authors_and_abstract", "publisher_parsers",
+                 "fulltext_location", "cleanup_soup", "find_pdf_link",
+                 "get_useful_links", "detect_bronze", "detect_hybrid"):
+        assert stages[name]["calls"] >= 1, name
+    assert stages["parse_page"]["wall_ms"] >= stages["soup"]["wall_ms"]
+    parsers = trace.to_dict()["parsers"]
+    assert "authors_found" in parsers["GenericPublisherParser"]
+    assert all(timing["calls"] >= 1
+               for methods in parsers.values() for timing in methods.values())
+
+
+def test_trace_is_only_active_during_the_parse():
+    trace = ParseTrace()
+    parse_page(PAGE, "doi", None, trace=trace)
+
+    assert active_trace() is None
+    with stage("outside"):
+        pass
+    assert "outside" not in trace.stages
+
+
+def test_traced_sums_repeated_calls():
+    @traced("helper")
+    def helper(x):
+        return x * 2
+
+    trace = ParseTrace()
+    assert helper(1) == 2
+    with trace.activate():
+        assert helper(2) == 4
+        assert helper(3) == 6
+    assert trace.to_dict()["stages"]["helper"]["calls"] == 2
+
+
+def test_server_timing_lists_stages_then_slowest_parsers():
+    trace = ParseTrace()
+    parse_page(PAGE, "doi", None, trace=trace)
+
+    metrics = trace.server_timing(max_parsers=3).split(", ")
+    names = [metric.split(";")[0] for metric in metrics]
+    assert names[:len(trace.stages)] == list(trace.stages)
+    assert len(names) == len(trace.stages) + 3
+    assert all(name.startswith("parser.") for name in names[len(trace.stages):])
+    assert all(";dur=" in metric for metric in metrics)
+
+
+def test_parse_pages_returns_traces_on_request():
+    pages = [(n, PAGE, "doi", None) for n in range(3)]
+
+    assert all(r.trace is None for r in parse_pages(pages, workers=1))
+    results = list(parse_pages(pages, workers=2, chunksize=1, trace=True))
+    assert all(r.trace["stages"]["parse_page"]["calls"] == 1 for r in results)
@@ -0,0 +1,162 @@
+"""pretrim: byte-level trimming of oversized pages before parsing.
+
+Offline tests on inline HTML.
+"""
+import pytest
+
+from parseland_lib import pretrim as pretrim_module
+from parseland_lib.pretrim import guard_page, pretrim, script_signature_re
+from parseland_lib.parse import parse_page
+
+BIG = "x" * (pretrim_module.MAX_INLINE_SCRIPT_BYTES + 1)
+B64 = "QUJD" * 100
+
+PAGE = f"""<html><head>
+<meta name="citation_author" content="Doe, Jane">
+<style>body {{ color: red; }}</style>
+<script>var junk = "{BIG}";</script>
+<script>var small = 1;</script>
+<script>xplGlobal.document.metadata={{"big": "{BIG}"}};</script>
+<script type="application/ld+json">{{"big": "{BIG}"}}</script>
+<!-- <script> in a comment is not a script -->
+</head><body>
+<svg class="icon"><path d="M0 0L10 10"/></svg>
+<img src="data:image/png;base64,{B64}">
+<div class="article-references"><div><p>Ref 1</p></div><p>Ref 2</p></div>
+<div id="references"><div><p>Ref 1</p></div><p>Ref 2</p></div>
+<p>kept</p>
+</body></html>""".encode()
+
+
+def _trim(data, chunksize):
+    chunks = (data[i:i + chunksize] for i in range(0, len(data), chunksize))
+    return b"".join(pretrim(chunks))
+
+
+def test_trims_payloads_and_keeps_signatures():
+    trimmed = _trim(PAGE, len(PAGE))
+
+    assert b"color: red" not in trimmed and b"<style></style>" in trimmed
+    assert b'<script>var junk' not in trimmed
+    assert b"<script>var small = 1;</script>" in trimmed
+    assert b"xplGlobal.document.metadata" in trimmed
+    assert b'<script type="application/ld+json">{"big"' in trimmed
+    assert b"<!-- <script> in a comment is not a script -->" in trimmed
+    assert b'<svg class="icon"></svg>' in trimmed
+    assert b'src="data:image/png;base64,"' in trimmed
+    assert b'<div id="references"></div>' in trimmed
+    assert b'<div class="article-references"><div><p>Ref 1' in trimmed
+    assert b"<p>kept</p>" in trimmed
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 17, 4096])
+def test_output_does_not_depend_on_chunk_boundaries(chunksize):
+    assert _trim(PAGE, chunksize) == _trim(PAGE, len(PAGE))
+
+
+def test_parser_signatures_are_registered():
+    signatures = script_signature_re()
+
+    assert signatures.search(b"window.__PRELOADED_STATE__ = {}")
+    assert signatures.search(b'<script id="__NEXT_DATA__">')
+    assert not signatures.search(b"var junk")
+
+
+def test_javascript_pdf_scripts_are_kept():
+    from parseland_lib.legacy_parse_utils.pdf import get_pdf_from_javascript
+
+    script = (f'<script>var config = {{"exportPdfDownloadUrl": '
+              f'"https://example.org/a.pdf", "pad": "{BIG}"}};</script>').encode()
+    trimmed = _trim(b"<html><head>" + script + b"</head></html>", 4096)
+
+    assert script in trimmed
+    assert get_pdf_from_javascript(trimmed.decode()).href == "https://example.org/a.pdf"
+
+
+def test_guard_page_leaves_small_pages_alone(monkeypatch):
+    assert guard_page(PAGE) == (PAGE, False)
+
+    monkeypatch.setattr(pretrim_module, "PRETRIM_MIN_BYTES", 0)
+    trimmed, cut = guard_page(PAGE.decode())
+    assert isinstance(trimmed, str) and not cut
+    assert trimmed.encode() == _trim(PAGE, len(PAGE))
+
+
+def test_oversized_page_is_cut_and_reported(monkeypatch):
+    monkeypatch.setattr(pretrim_module, "PRETRIM_MIN_BYTES", 0)
+    monkeypatch.setattr(pretrim_module, "MAX_PAGE_BYTES", 200)
+
+    response = parse_page(PAGE, "doi", "https://example.org/x")
+
+    assert response["authors"][0]["name"] == "Doe, Jane"
+    assert response["truncated_stages"] == ["page_tail"]
+
+
+UNBALANCED = b"""<html><body>
+<div class="references"><div><p>Ref 1</p><p>Ref 2</p></div>
+<div class="affiliations"><p>MIT</p></div>
+<script type="application/ld+json">{"author": "Doe, Jane"}</script>
+</body></html>"""
+
+
+@pytest.mark.parametrize("chunksize", [1, 7, 4096])
+def test_unclosed_reference_list_is_kept(chunksize):
+    # the references <div> never closes: everything after it stays
+    assert _trim(UNBALANCED, chunksize) == UNBALANCED
+    assert _trim(UNBALANCED.replace(b"</body></html>", b""), chunksize) == \
+        UNBALANCED.replace(b"</body></html>", b"")
+
+
+def test_reference_list_over_the_size_limit_is_kept(monkeypatch):
+    monkeypatch.setattr(pretrim_module, "MAX_DROPPED_SECTION_BYTES", 32)
+    page = b'<div id="references">' + b"<p>Ref</p>" * 20 + b"</div><p>kept</p>"
+
+    assert _trim(page, 8) == page
+
+
+SELF_CLOSING = f"""<html><head>
+<script src="a.js"/>
+<meta name="citation_author" content="Doe, Jane">
+<script>var junk = "{BIG}";</script>
+</head><body>
+<svg class="icon"/>
+<div class="authors"><p>Jane Doe</p></div>
+<style>p {{ color: red; }}</style>
+</body></html>""".encode()
+
+
+@pytest.mark.parametrize("chunksize", [1, 7, 4096, len(SELF_CLOSING)])
+def test_self_closing_tags_hold_nothing(chunksize):
+    trimmed = _trim(SELF_CLOSING, chunksize)
+
+    assert trimmed == (SELF_CLOSING.replace(f'var junk = "{BIG}";'.encode(), b"")
+                       .replace(b"p { color: red; }", b""))
+
+
+def test_self_closing_script_keeps_the_head(monkeypatch):
+    monkeypatch.setattr(pretrim_module, "PRETRIM_MIN_BYTES", 0)
+
+    response = parse_page(SELF_CLOSING, "doi", "https://example.org/x")
+
+    assert response["authors"][0]["name"] == "Doe, Jane"
+
+
+@pytest.mark.parametrize("tag", [b"style", b"svg", b"script"])
+@pytest.mark.parametrize("chunksize", [1, 7, 4096])
+def test_unclosed_element_is_kept(tag, chunksize):
+    page = (b"<html><body><" + tag + b">" + BIG.encode()
+            + b'<div class="authors"><p>Jane Doe</p></div></body></html>')
+
+    assert _trim(page, chunksize) == page
+    assert _trim(page[:-len(b"</body></html>")], chunksize) == \
+        page[:-len(b"</body></html>")]
+
+
+@pytest.mark.parametrize("tag", [b"style", b"svg", b"script"])
+@pytest.mark.parametrize("chunksize", [100, 1 << 20])
+def test_element_over_the_size_limit_is_kept(tag, chunksize, monkeypatch):
+    monkeypatch.setattr(pretrim_module, "MAX_DROPPED_SECTION_BYTES", 1024)
+    page = (b"<" + tag + b">" + BIG.encode() + b"</" + tag + b">"
+            + b"<style>p { color: red; }</style>")
+
+    assert _trim(page, chunksize) == page.replace(b"p { color: red; }", b"")
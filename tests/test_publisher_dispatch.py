@@ -0,0 +1,106 @@
+"""Indexed PublisherParser dispatch.
+
+parseland_lib.publisher.dispatch routes a page to candidate parsers from
+canonical / og:url hosts, og:site_name, citation_publisher and the citation
+DOI prefix. These tests are offline and build soup from inline HTML.
+"""
+from bs4 import BeautifulSoup
+
+from parseland_lib.parse import parse_page
+from parseland_lib.publisher.dispatch import candidate_parsers, page_signals
+from parseland_lib.publisher.parsers.asj import TheAstronomicalJournal
+from parseland_lib.publisher.parsers.elsevier_bv import ElsevierBV
+from parseland_lib.publisher.parsers.parser import PublisherParser
+from parseland_lib.publisher.parsers.sciencedirect import ScienceDirect
+from parseland_lib.publisher.parsers.springer import Springer
+from parseland_lib.publisher.parsers.wiley import Wiley
+
+
+def _soup(head):
+    return BeautifulSoup(f"<html><head>{head}</head><body></body></html>", "lxml")
+
+
+def test_page_signals_reads_head_metadata_in_one_pass():
+    soup = _soup(
+        '<link rel="canonical" href="https://onlinelibrary.wiley.com/doi/10.1002/x">'
+        '<meta property="og:url" content="https://doi.org/10.1002/x">'
+        '<meta property="og:site_name" content="Wiley Online Library">'
+        '<meta name="citation_publisher" content="John Wiley &amp; Sons">'
+        '<meta name="citation_doi" content="10.1002/x">'
+    )
+    signals = page_signals(soup)
+
+    assert signals["hosts"] == {"onlinelibrary.wiley.com", "doi.org"}
+    assert signals["site_names"] == ["wiley online library"]
+    assert signals["publishers"] == ["john wiley & sons"]
+    assert signals["doi_prefixes"] == {"10.1002"}
+
+
+def test_canonical_host_routes_by_suffix():
+    soup = _soup('<link rel="canonical" href="https://www.sciencedirect.com/science/article/pii/S1">')
+    candidates = candidate_parsers(soup)
+
+    assert ElsevierBV in candidates
+    assert ScienceDirect in candidates
+    assert Springer not in candidates
+
+
+def test_doi_prefix_and_site_name_route():
+    assert Springer in candidate_parsers(_soup('<meta name="citation_doi" content="10.1038/nature123">'))
+    assert Wiley in candidate_parsers(_soup('<meta property="og:site_name" content="Wiley Online Library">'))
+
+
+def test_candidates_follow_subclass_order():
+    soup = _soup(
+        '<link rel="canonical" href="https://www.sciencedirect.com/science/article/pii/S1">'
+        '<meta name="citation_doi" content="10.1038/nature123">'
+    )
+    order = PublisherParser.__subclasses__()
+    candidates = candidate_parsers(soup)
+
+    assert candidates == sorted(candidates, key=order.index)
+
+
+def test_unrouted_page_has_no_candidates():
+    assert candidate_parsers(_soup("<title>Nothing here</title>")) == []
+
+
+def test_routed_page_without_winner_falls_back_to_full_scan():
+    # routed to the Elsevier parsers, which find nothing; the full scan
+    # reaches TheAstronomicalJournal, which has no dispatch hints
+    html = (
+        '<html><head>'
+        '<link rel="canonical" href="https://www.sciencedirect.com/science/article/pii/S1">'
+        '<meta name="citation_journal_title" content="The Astronomical Journal">'
+        '</head><body><ul>'
+        '<li class="author"><a>Jane Doe</a>'
+        '<span class="affiliation">(Example University)</span></li>'
+        '</ul></body></html>'
+    )
+    soup = BeautifulSoup(html, "lxml")
+    assert TheAstronomicalJournal not in candidate_parsers(soup)
+
+    result = parse_page(html, "doi")
+
+    assert [a["name"] for a in result["authors"]] == ["Jane Doe"]
+
+
+def test_parser_without_hints_ahead_of_the_candidate_still_wins():
+    # TheAstronomicalJournal has no dispatch hints and comes before IOP in
+    # subclass order, so the full scan would pick it
+    html = (
+        '<html><head>'
+        '<link rel="canonical" href="https://iopscience.iop.org/article/10.3847/1538-3881/abc">'
+        '<meta name="citation_journal_title" content="The Astronomical Journal">'
+        '<meta name="citation_author" content="Doe, Jane">'
+        '<meta name="citation_author_institution" content="IOP Meta University">'
+        '</head><body><ul>'
+        '<li class="author"><a>Jane Doe</a>'
+        '<span class="affiliation">(Visible Observatory)</span></li>'
+        '</ul></body></html>'
+    )
+
+    result = parse_page(html, "doi")
+
+    assert [(a["name"], [aff["name"] for aff in a["affiliations"]])
+            for a in result["authors"]] == [("Jane Doe", ["Visible Observatory"])]
@@ -0,0 +1,127 @@
+"""R2 landing page fetches and the concurrent fetch in the GET endpoints.
+
+Fake boto3 clients only — no R2, no DynamoDB.
+"""
+from __future__ import annotations
+
+import gzip
+import io
+import threading
+import uuid
+
+import pytest
+
+import app as app_module
+from parseland_lib import pretrim, s3 as s3_module
+from parseland_lib.pretrim import GuardedPage, guard_page
+from parseland_lib.s3 import get_guarded_landing_page_from_r2, \
+    get_landing_page_from_r2
+
+
+class FakeBody(io.BytesIO):
+    def __init__(self, data):
+        super().__init__(data)
+        self.bytes_read = 0
+        self.closed_early = False
+
+    def close(self):
+        self.closed_early = self.tell() < len(self.getbuffer())
+        super().close()
+
+    def read(self, amt=None):
+        chunk = super().read(amt)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+class FakeS3:
+    def __init__(self, data):
+        self.body = FakeBody(data)
+        self.calls = []
+
+    def get_object(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"Body": self.body}
+
+
+def test_single_get_decompresses_landing_page():
+    html = b"<html><body>hello</body></html>"
+    s3 = FakeS3(gzip.compress(html))
+
+    assert get_landing_page_from_r2("abc", s3) == html
+    assert len(s3.calls) == 1
+    assert "Range" not in s3.calls[0]
+
+
+def test_streaming_inflate_matches_gzip_decompress(monkeypatch):
+    monkeypatch.setattr(s3_module, "READ_CHUNK_BYTES", 7)
+    monkeypatch.setattr(s3_module, "INFLATE_CHUNK_BYTES", 100)
+    html = b"<html><body>" + b"<p>paragraph</p>" * 500 + b"</body></html>"
+    members = gzip.compress(html[:1000]) + gzip.compress(html[1000:])
+
+    assert get_landing_page_from_r2("abc", FakeS3(gzip.compress(html))) == html
+    assert get_landing_page_from_r2("abc", FakeS3(members)) == html
+    assert get_landing_page_from_r2("abc", FakeS3(html)) == html
+    assert get_landing_page_from_r2("abc", FakeS3(b"")) == b""
+
+
+def test_truncated_gzip_keeps_what_was_inflated(monkeypatch):
+    monkeypatch.setattr(s3_module, "READ_CHUNK_BYTES", 64)
+    html = b"<html>" + bytes(range(256)) * 40 + b"</html>"
+    data = gzip.compress(html)
+
+    page = get_landing_page_from_r2("abc", FakeS3(data[:len(data) // 2]))
+
+    assert page and html.startswith(page)
+
+
+def test_download_stops_at_max_bytes(monkeypatch):
+    monkeypatch.setattr(s3_module, "READ_CHUNK_BYTES", 1024)
+    html = b"<html>" + b"x" * 1_000_000 + b"</html>"
+    s3 = FakeS3(gzip.compress(html, compresslevel=0))
+
+    assert get_landing_page_from_r2("abc", s3, max_bytes=10_000) == html[:10_000]
+    assert s3.body.closed_early
+
+
+@pytest.mark.parametrize("size", [100, 3_000_000])
+def test_guarded_page_matches_guard_page(monkeypatch, size):
+    monkeypatch.setattr(pretrim, "MAX_PAGE_BYTES", 2_000_000)
+    script = b"<script>" + b"var big = 1;" * 20_000 + b"</script>"
+    html = b"<html><body>" + script + b"<p>text</p>" * (size // 11) + b"</body></html>"
+
+    page = get_guarded_landing_page_from_r2("abc", FakeS3(gzip.compress(html)))
+
+    assert isinstance(page, GuardedPage)
+    assert (page.content, page.cut) == guard_page(html)
+    assert guard_page(page) == (page.content, page.cut)
+
+
+def test_pdf_detected_from_first_bytes_without_reading_the_rest():
+    s3 = FakeS3(b"%PDF-1.7" + b"x" * 100_000)
+
+    assert get_landing_page_from_r2("abc", s3) is None
+    assert len(s3.calls) == 1
+    assert s3.body.bytes_read == 5
+
+
+def test_endpoint_fetches_r2_and_dynamodb_concurrently(monkeypatch):
+    # each fake waits for the other: a serial implementation would time out
+    both_started = threading.Barrier(2, timeout=5)
+
+    def fake_r2(harvest_id, s3):
+        both_started.wait()
+        return "<html><body></body></html>"
+
+    def fake_record(harvest_id, dynamodb):
+        both_started.wait()
+        return {"namespace": "doi", "resolved_url": "https://example.org/x"}
+
+    monkeypatch.setattr(app_module, "get_guarded_landing_page_from_r2", fake_r2)
+    monkeypatch.setattr(app_module, "get_dynamodb_record", fake_record)
+
+    client = app_module.app.test_client()
+    resp = client.get(f"/parseland/{uuid.uuid4()}")
+
+    assert resp.status_code == 200, resp.get_data(as_text=True)
+    assert resp.get_json()["authors"] == []
@@ -0,0 +1,137 @@
+"""ResultCache / parse_pages_cached: parse results reused across runs.
+
+Offline tests; pages are inline HTML. A code change is simulated by editing
+the cache's CodeFingerprint.
+"""
+import copy
+import hashlib
+
+from parseland_lib.parse import parse_page
+from parseland_lib.result_cache import (
+    CLAIMED, CONSULTED, ResultCache, code_fingerprint, parse_pages_cached)
+from parseland_lib.serialize import dumps
+
+PAGE = """
+<html><head>
+<meta name="citation_author" content="Doe, Jane">
+<meta name="citation_pdf_url" content="https://example.org/{n}.pdf">
+</head><body></body></html>
+"""
+
+
+def _pages(count):
+    return [(n, PAGE.format(n=n), "doi", f"https://example.org/{n}")
+            for n in range(count)]
+
+
+def _run(directory, pages, edit=None):
+    cache = ResultCache(directory)
+    if edit:
+        cache.fingerprint = edit(copy.copy(cache.fingerprint))
+    results = {result.key: (result, duration_ms) for result, duration_ms
+               in parse_pages_cached(pages, cache, workers=1)}
+    return cache, results
+
+
+def _edit_module(module):
+    def edit(fingerprint):
+        fingerprint.modules = {**fingerprint.modules, module: "edited"}
+        fingerprint.manifest = {"modules": fingerprint.modules,
+                                "classes": fingerprint.modules_of}
+        fingerprint.manifest_id = hashlib.sha1(
+            dumps(fingerprint.manifest)).hexdigest()
+        return fingerprint
+    return edit
+
+
+def _edit_core(fingerprint):
+    fingerprint.core = "edited"
+    return fingerprint
+
+
+def test_second_run_is_served_from_the_cache(tmp_path):
+    pages = _pages(4)
+    first, parsed = _run(tmp_path, pages)
+    second, cached = _run(tmp_path, pages)
+
+    assert (first.misses, first.hits) == (4, 0)
+    assert (second.misses, second.hits) == (0, 4)
+    for n, (result, duration_ms) in cached.items():
+        assert result.cached
+        assert result.parsed == parsed[n][0].parsed == parse_page(*pages[n][1:])
+        assert duration_ms == parsed[n][1]
+
+
+def test_the_trace_of_a_cached_page_is_returned_on_request(tmp_path):
+    _run(tmp_path, _pages(1))
+    cache = ResultCache(tmp_path)
+
+    [(result, _)] = parse_pages_cached(_pages(1), cache, workers=1, trace=True)
+
+    assert result.cached
+    assert result.trace["parsers"]["GenericPublisherParser"]["parse"]["calls"] >= 1
+
+
+def test_a_changed_page_is_parsed_again(tmp_path):
+    _run(tmp_path, _pages(2))
+    pages = _pages(2)
+    pages[1] = (1, PAGE.format(n=9), "doi", "https://example.org/1")
+
+    cache, results = _run(tmp_path, pages)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert results[1][0].parsed["urls"][0]["url"] == "https://example.org/9.pdf"
+
+
+def test_a_parser_that_does_not_claim_the_page_is_only_rechecked(tmp_path):
+    pages = _pages(2)
+    _, parsed = _run(tmp_path, pages)
+    module = "parseland_lib.publisher.parsers.wiley"
+    assert code_fingerprint().modules_of["Wiley"] == [module]
+
+    cache, results = _run(tmp_path, pages, _edit_module(module))
+
+    assert (cache.rechecked, cache.misses) == (2, 0)
+    assert results[0][0].parsed == parsed[0][0].parsed
+    # the entries were renewed: the same code now hits outright
+    again, _ = _run(tmp_path, pages, _edit_module(module))
+    assert (again.hits, again.rechecked) == (2, 0)
+
+
+def test_a_parser_that_claimed_the_page_forces_a_parse(tmp_path):
+    pages = _pages(2)
+    first, parsed = _run(tmp_path, pages)
+    entry = first.lookup(next(iter(first.directory.glob("??/*.json"))).stem)
+    assert entry[0]["parsers"]["GenericPublisherParser"] == CLAIMED
+    assert entry[0]["parsers"]["Wiley"] == CONSULTED
+
+    cache, results = _run(
+        tmp_path, pages, _edit_module("parseland_lib.publisher.parsers.generic"))
+
+    assert (cache.hits, cache.rechecked, cache.misses) == (0, 0, 2)
+    assert not results[0][0].cached
+
+
+def test_parsers_depend_on_the_parser_modules_they_import():
+    assert code_fingerprint().modules_of["AMA"] == [
+        "parseland_lib.publisher.parsers.ama",
+        "parseland_lib.publisher.parsers.generic",
+    ]
+
+
+def test_a_core_change_invalidates_every_entry(tmp_path):
+    pages = _pages(2)
+    _run(tmp_path, pages)
+
+    cache, _ = _run(tmp_path, pages, _edit_core)
+
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_errors_are_cached_too(tmp_path):
+    pages = [("bad", "", "doi", None)]
+    _, first = _run(tmp_path, pages)
+    cache, second = _run(tmp_path, pages)
+
+    assert cache.hits == 1
+    assert second["bad"][0].error == first["bad"][0].error
@@ -0,0 +1,68 @@
+"""serialize.dumps: orjson and stdlib backends write the same bytes."""
+import json
+import math
+import uuid
+from dataclasses import dataclass
+
+import pytest
+
+from parseland_lib import serialize
+
+
+@dataclass(slots=True)
+class Point:
+    x: float
+    label: str
+
+
+VALUES = [
+    {"authors": [{"name": "Zoë Ünal", "affiliations": [{"name": "東京大学"}],
+                  "is_corresponding": None}], "urls": [], "abstract": None},
+    {"b": 1, "a": [1.5, 0.1, -0.0, 1e-05, 2.5e-07, 1e16, 123456.789]},
+    {"nan": math.nan, "inf": [math.inf, -math.inf]},
+    {"control": "\x00\x1f\x7f  \"quoted\" \\ /"},
+    {1: "int key", "big": 2 ** 70},
+    {"id": uuid.UUID(int=1), "point": Point(0.25, "p")},
+    [],
+    {},
+]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(serialize, "orjson", None)
+    elif serialize.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+@pytest.mark.parametrize("value", VALUES)
+@pytest.mark.parametrize("indent", [False, True])
+def test_backends_write_identical_bytes(value, indent, backend, monkeypatch):
+    data = serialize.dumps(value, indent=indent)
+
+    monkeypatch.setattr(serialize, "orjson", None)
+    assert data == serialize.dumps(value, indent=indent)
+
+
+def test_output_format():
+    value = {"b": [1, {"c": None}], "a": "é", "nan": math.nan}
+
+    assert serialize.dumps(value) == '{"b":[1,{"c":null}],"a":"é","nan":null}'.encode()
+    assert serialize.dumps(value, indent=True) == json.dumps(
+        {**value, "nan": None}, indent=2, ensure_ascii=False).encode()
+
+
+def test_unserializable_objects_raise(backend):
+    with pytest.raises(TypeError):
+        serialize.dumps({"x": object()})
+
+
+def test_lone_surrogates_are_escaped(backend):
+    name = json.loads('"Jos\\ud83d"')
+
+    data = serialize.dumps({"authors": [{"name": name}], "emoji": "😀"})
+
+    assert data == '{"authors":[{"name":"Jos\\ud83d"}],"emoji":"😀"}'.encode()
+    assert json.loads(data) == {"authors": [{"name": name}], "emoji": "😀"}
@@ -0,0 +1,71 @@
+"""TextIndex: tag texts from one walk of the page.
+
+Offline tests; soup is built from inline HTML.
+"""
+from bs4 import BeautifulSoup
+
+from parseland_lib.legacy_parse_utils.strings import cleanup_soup
+from parseland_lib.legacy_parse_utils.version_and_license import \
+    detect_sd_author_manuscript
+from parseland_lib.publisher.parsers.wiley import Wiley
+from parseland_lib.text_index import TextIndex, text_index
+
+HTML = """
+<html><body>
+<div id="a">one <b>two</b><!-- not text --><script>var x;</script></div>
+<div class="table-of-content"><a>View Open Manuscript</a></div>
+<p>three</p>
+</body></html>
+"""
+
+ABSTRACT = "This study " + "measures things carefully " * 5
+
+
+def _soup(html=HTML):
+    return BeautifulSoup(html, "lxml")
+
+
+def test_text_matches_get_text_for_every_tag():
+    soup = _soup()
+    index = TextIndex(soup)
+
+    assert index.tags == soup.find_all()
+    for tag in soup.find_all():
+        assert index.text(tag) == tag.get_text()
+        assert index.text_length(tag) == len(tag.get_text())
+
+
+def test_subtree_end_bounds_descendants():
+    soup = _soup()
+    index = TextIndex(soup)
+    pos = index.position(soup.find(id="a"))
+
+    assert index.tags[pos + 1:index.subtree_end(pos)] == soup.find(
+        id="a").find_all()
+
+
+def test_cleaned_view_leaves_removed_nodes_out():
+    soup = _soup()
+    view = cleanup_soup(soup)
+    index = text_index(view)
+
+    assert text_index(view) is index
+    assert index.text(soup.body) == view.get_text(soup.body)
+    assert index.find_text("View Open Manuscript") is None
+    # the <div> reads the same as its only child and comes first
+    assert TextIndex(soup).find_text("View Open Manuscript").name == "div"
+
+
+def test_detect_sd_author_manuscript():
+    assert detect_sd_author_manuscript(cleanup_soup(_soup())) is None
+    assert detect_sd_author_manuscript(_soup()) == 'open (author manuscript)'
+
+
+def test_fallback_parse_abstract_skips_blacklisted_and_finds_nested():
+    soup = _soup(f"""<html><body>
+    <div class="abstract"><div>Download options {'x' * 100}</div></div>
+    <section class="article-abstract"><p>Abstract {ABSTRACT}</p></section>
+    </body></html>""")
+
+    assert Wiley(soup).fallback_parse_abstract() == ABSTRACT.strip()
+
@@ -0,0 +1,37 @@
+"""get_useful_links: bad sections pruned, candidate anchors in page order.
+
+Offline tests; pages are inline HTML.
+"""
+from parseland_lib.legacy_parse_utils.pdf import get_useful_links
+
+HTML = """
+<html><body>
+<div class="references"><a href="/ref.pdf">Reference PDF</a></div>
+<div id="toc"><div class="relatedItem"><a href="/nested.pdf">PDF</a></div></div>
+<a href="/article.pdf">Download <span class="fa-lock">locked</span>PDF</a>
+<a href="/cover" class="cover-out">Cover</a>
+<div class="pdf-download"><a href="/viewer">Read</a></div>
+<a title="Download PDF" href="/titled.pdf"></a>
+<a href="/image"><img src="/icons/pdf.png"></a>
+<button onclick="window.open('https://example.org/button.pdf')">Go</button>
+</body></html>
+"""
+
+
+def test_links_skip_bad_sections_and_keep_page_order():
+    links = [(link.href, link.anchor) for link in get_useful_links(HTML)]
+
+    assert links == [
+        ("/article.pdf", "download"),
+        ("/viewer", "read"),
+        ("/titled.pdf", "title: Download PDF"),
+        ("/image", "image: /icons/pdf.png"),
+        ("/viewer", "Read"),
+        ("https://example.org/button.pdf", "<button onclick>"),
+    ]
+
+
+def test_page_without_bad_sections():
+    links = get_useful_links('<p><a href="/a.pdf">PDF</a></p>')
+
+    assert [(link.href, link.anchor) for link in links] == [("/a.pdf", "pdf")]